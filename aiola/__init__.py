@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from .client import AiolaClient, AsyncAiolaClient
-from .clients.stt import TasksConfig
+from .clients.stt import ReplayConfig, TasksConfig
 from .errors import (
     AiolaAuthenticationError,
     AiolaConnectionError,
@@ -12,13 +12,15 @@ from .errors import (
     AiolaStreamingError,
     AiolaValidationError,
 )
-from .mic import MicrophoneStream
+from .mic import MicrophoneStream, MultiChannelMicrophoneStream
 
 __all__ = [
     "AiolaClient",
     "AsyncAiolaClient",
     "TasksConfig",
+    "ReplayConfig",
     "MicrophoneStream",
+    "MultiChannelMicrophoneStream",
     "AiolaError",
     "AiolaAuthenticationError",
     "AiolaConnectionError",
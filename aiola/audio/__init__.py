@@ -0,0 +1,43 @@
+from .bus import AudioBusPublisher, AudioBusSubscriber, BusSource
+from .concat import WavJoiner, aconcat_wav, concat_wav
+from .decode import PcmDecoder
+from .files import MappedAudioFile
+from .framing import FrameChunker
+from .g711 import g711_decode, g711_encode
+from .meter import LevelMeter, LevelReading
+from .resample import Resampler
+from .source import AudioSource
+from .sources import FfmpegSource, FileSource, PipeSource, ToneSource
+from .transcode import AudioTranscoder
+from .vad import VadGate, VadGateStats
+from .wav import WavInfo, WavStreamParser, is_wav, parse_wav_header, wav_header
+
+__all__ = [
+    "AudioBusPublisher",
+    "AudioBusSubscriber",
+    "AudioSource",
+    "AudioTranscoder",
+    "BusSource",
+    "FfmpegSource",
+    "FileSource",
+    "FrameChunker",
+    "LevelMeter",
+    "LevelReading",
+    "MappedAudioFile",
+    "PcmDecoder",
+    "PipeSource",
+    "Resampler",
+    "ToneSource",
+    "VadGate",
+    "VadGateStats",
+    "WavInfo",
+    "WavJoiner",
+    "WavStreamParser",
+    "aconcat_wav",
+    "concat_wav",
+    "g711_decode",
+    "g711_encode",
+    "is_wav",
+    "parse_wav_header",
+    "wav_header",
+]
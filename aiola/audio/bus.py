@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import math
+import queue
+import sys
+import threading
+import time
+from contextlib import suppress
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any
+
+from .source import MAX_BUFFER_MS, AudioSource
+from .sources import _ThreadedSource
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .meter import LevelMeter
+
+# Header fields, stored as int64 at the start of the segment
+_WRITTEN, _CAPACITY, _SLOT_BYTES, _SAMPLERATE, _CHANNELS, _BLOCK_FRAMES, _CLOSED = range(7)
+_HEADER_FIELDS = 8
+_DTYPE_BYTES = 16
+_HEADER_BYTES = _HEADER_FIELDS * 8 + _DTYPE_BYTES
+
+# Segments created by publishers in this process, which stay registered with the resource tracker
+_published: set[str] = set()
+
+
+class _Segment:
+    """Typed views over the shared memory layout: header, dtype name, slot sizes and slots."""
+
+    def __init__(self, shm: shared_memory.SharedMemory) -> None:
+        self.shm = shm
+        self.header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        capacity = int(self.header[_CAPACITY])
+        self.sizes = np.ndarray((capacity,), dtype=np.int64, buffer=shm.buf, offset=_HEADER_BYTES)
+        self.data_offset = _HEADER_BYTES + capacity * 8
+
+    @staticmethod
+    def size(capacity: int, slot_bytes: int) -> int:
+        return _HEADER_BYTES + capacity * 8 + capacity * slot_bytes
+
+    @property
+    def dtype(self) -> str:
+        start = _HEADER_FIELDS * 8
+        return bytes(self.shm.buf[start : start + _DTYPE_BYTES]).rstrip(b"\0").decode()
+
+    @dtype.setter
+    def dtype(self, value: str) -> None:
+        start = _HEADER_FIELDS * 8
+        self.shm.buf[start : start + _DTYPE_BYTES] = value.encode().ljust(_DTYPE_BYTES, b"\0")
+
+    def slot(self, index: int, size: int) -> memoryview:
+        slot_bytes = int(self.header[_SLOT_BYTES])
+        start = self.data_offset + index * slot_bytes
+        return self.shm.buf[start : start + size]
+
+    def close(self) -> None:
+        # Views into the mapping must go before it can be closed
+        del self.header, self.sizes
+        # BufferError: a caller still holds a block; the mapping is released together with it
+        with suppress(BufferError):
+            self.shm.close()
+
+
+class AudioBusPublisher:
+    """
+    Publishes the audio of one :class:`AudioSource` to a shared-memory ring buffer.
+
+    Any number of processes can attach an :class:`AudioBusSubscriber` by :attr:`name` and read
+    the same blocks through their own cursor. Each block is copied into shared memory once, so
+    the capture cost does not grow with the number of subscribers. A subscriber that falls more
+    than ``buffer_ms`` behind skips the oldest blocks and counts them in ``overruns``.
+    """
+
+    def __init__(self, source: AudioSource, *, name: str | None = None, buffer_ms: float = MAX_BUFFER_MS):
+        """
+        Initialize the publisher and create its shared memory segment.
+
+        Args:
+            source: The audio source to publish
+            name: Name of the shared memory segment (default: a random name)
+            buffer_ms: Audio kept for subscribers, in milliseconds (default: 2000)
+        """
+        if np is None:
+            raise ImportError("numpy is required for the audio bus. Install it with: pip install 'aiola[audio]'")
+        if buffer_ms <= 0:
+            raise ValueError("buffer_ms must be positive")
+
+        self.source = source
+        block_frames = source._buffer.block_frames
+        slot_bytes = block_frames * source.channels * np.dtype(source.dtype).itemsize
+        capacity = max(2, math.ceil(buffer_ms * source.samplerate / 1000 / block_frames) + 1)
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_Segment.size(capacity, slot_bytes))
+        shm.buf[:_HEADER_BYTES] = bytes(_HEADER_BYTES)
+        header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        header[_CAPACITY] = capacity
+        header[_SLOT_BYTES] = slot_bytes
+        header[_SAMPLERATE] = source.samplerate
+        header[_CHANNELS] = source.channels
+        header[_BLOCK_FRAMES] = block_frames
+        del header
+        self._segment = _Segment(shm)
+        self._segment.dtype = str(np.dtype(source.dtype))
+        _published.add(shm.name)
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """Name subscribers attach to."""
+        return self._segment.shm.name
+
+    @property
+    def blocks_published(self) -> int:
+        return int(self._segment.header[_WRITTEN])
+
+    def start(self) -> None:
+        """Start the source, if needed, and begin publishing its audio."""
+        if self._thread is not None:
+            return
+
+        self.source.start()
+        self._segment.header[_CLOSED] = 0
+        self._thread = threading.Thread(target=self._publish, daemon=True)
+        self._thread.start()
+
+    def _publish(self) -> None:
+        segment = self._segment
+        header, sizes = segment.header, segment.sizes
+        capacity = int(header[_CAPACITY])
+        try:
+            while True:
+                try:
+                    view = self.source.read_view()
+                except (queue.Empty, RuntimeError):
+                    # Stopped or exhausted
+                    return
+                index = int(header[_WRITTEN])
+                slot = index % capacity
+                segment.slot(slot, len(view))[:] = view
+                sizes[slot] = len(view)
+                # Publish the block only once its bytes are in place
+                header[_WRITTEN] = index + 1
+        finally:
+            header[_CLOSED] = 1
+
+    def stop(self) -> None:
+        """Stop the source and mark the bus as finished for subscribers."""
+        self.source.stop()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._segment.header[_CLOSED] = 1
+
+    def close(self) -> None:
+        """Stop publishing and remove the shared memory segment."""
+        self.stop()
+        shm = self._segment.shm
+        self._segment.close()
+        shm.unlink()
+        _published.discard(shm.name)
+
+
+class AudioBusSubscriber:
+    """
+    Reads the blocks of an :class:`AudioBusPublisher`, possibly from another process.
+
+    Each subscriber keeps its own cursor. :meth:`read_view` returns views straight into shared
+    memory; they stay valid until the publisher laps the ring, so use or copy them before
+    reading on. Waiting for the next block sleeps in short steps, as there is no cross-process
+    wakeup that can be attached to by name.
+    """
+
+    def __init__(self, name: str, *, from_start: bool = False):
+        """
+        Attach to a bus.
+
+        Args:
+            name: The publisher's :attr:`AudioBusPublisher.name`
+            from_start: Start with the oldest block still buffered instead of the next new one
+        """
+        if np is None:
+            raise ImportError("numpy is required for the audio bus. Install it with: pip install 'aiola[audio]'")
+
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            if shm.name not in _published:
+                # Only the publisher owns the segment; don't let this process unlink it on exit
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        self._segment = _Segment(shm)
+        header = self._segment.header
+        self.capacity = int(header[_CAPACITY])
+        self.samplerate = int(header[_SAMPLERATE])
+        self.channels = int(header[_CHANNELS])
+        self.blocksize = int(header[_BLOCK_FRAMES])
+        self.dtype = self._segment.dtype
+        self._bytes_per_ms = self.samplerate * self.channels * np.dtype(self.dtype).itemsize / 1000
+        self._poll_interval = self.blocksize / self.samplerate / 4
+        written = int(header[_WRITTEN])
+        self._cursor = max(0, written - (self.capacity - 1)) if from_start else written
+        self.overruns = 0
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def __iter__(self):
+        """Iterate over blocks as bytes until the publisher stops."""
+        while True:
+            try:
+                yield self.read()
+            except queue.Empty:
+                return
+
+    @property
+    def closed(self) -> bool:
+        """``True`` once the publisher stopped and every remaining block was read."""
+        header = self._segment.header
+        return bool(header[_CLOSED]) and self._cursor >= int(header[_WRITTEN])
+
+    @property
+    def lag_ms(self) -> float:
+        """Duration of published audio this subscriber has not read yet, in milliseconds."""
+        written = int(self._segment.header[_WRITTEN])
+        pending = min(written - self._cursor, self.capacity - 1)
+        if pending <= 0:
+            return 0.0
+        slots = np.arange(written - pending, written) % self.capacity
+        return float(self._segment.sizes[slots].sum()) / self._bytes_per_ms
+
+    def read_view(self, timeout: float | None = None) -> memoryview:
+        """
+        Return the next block as a read-only view into shared memory.
+
+        Raises:
+            queue.Empty: If timeout is reached, or the publisher stopped and all blocks were read
+        """
+        header = self._segment.header
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            written = int(header[_WRITTEN])
+            if self._cursor < written:
+                # The slot being written next is off limits, hence capacity - 1
+                if written - self._cursor > self.capacity - 1:
+                    skipped = written - self._cursor - (self.capacity - 1)
+                    self.overruns += skipped
+                    self._cursor += skipped
+                slot = self._cursor % self.capacity
+                self._cursor += 1
+                return self._segment.slot(slot, int(self._segment.sizes[slot])).toreadonly()
+            if header[_CLOSED]:
+                raise queue.Empty
+            if deadline is not None and time.monotonic() >= deadline:
+                raise queue.Empty
+            time.sleep(self._poll_interval)
+
+    def read(self, timeout: float | None = None) -> bytes:
+        """
+        Return a copy of the next block, skipping blocks overwritten while they were copied.
+
+        Raises:
+            queue.Empty: If timeout is reached, or the publisher stopped and all blocks were read
+        """
+        while True:
+            view = self.read_view(timeout=timeout)
+            data = bytes(view)
+            view.release()
+            # The copy is only valid if the publisher didn't reach the slot in the meantime
+            if int(self._segment.header[_WRITTEN]) - (self._cursor - 1) <= self.capacity - 1:
+                return data
+            self.overruns += 1
+
+    def close(self) -> None:
+        """Detach from the bus; the publisher owns and removes the segment."""
+        self._segment.close()
+
+
+class BusSource(_ThreadedSource):
+    """
+    An :class:`AudioSource` fed by an :class:`AudioBusSubscriber`, so audio published in another
+    process can be sent with ``stream_to``/``astream_to`` like local capture.
+    """
+
+    _name = "Bus source"
+    _paces_itself = True
+
+    def __init__(self, name: str, *, max_buffer_ms: float = MAX_BUFFER_MS, meter: LevelMeter | None = None):
+        """
+        Initialize the bus source.
+
+        Args:
+            name: The publisher's :attr:`AudioBusPublisher.name`
+            max_buffer_ms: Most unread audio to keep, in milliseconds (default: 2000)
+            meter: Optional level meter updated with every block
+        """
+        self.subscriber = AudioBusSubscriber(name)
+        super().__init__(
+            realtime=True,
+            channels=self.subscriber.channels,
+            samplerate=self.subscriber.samplerate,
+            blocksize=self.subscriber.blocksize,
+            dtype=self.subscriber.dtype,
+            max_buffer_ms=max_buffer_ms,
+            meter=meter,
+        )
+
+    def _produce(self, stopped: threading.Event) -> None:
+        push = self._pacer(stopped)
+        while not stopped.is_set():
+            try:
+                view = self.subscriber.read_view(timeout=0.1)
+            except queue.Empty:
+                if self.subscriber.closed:
+                    return
+                continue
+            block: Any = np.frombuffer(view, dtype=self.dtype).reshape(-1, self.channels)
+            try:
+                if not push(block):
+                    return
+            finally:
+                # Drop the array first: the view can't be released while it is exported
+                del block
+                view.release()
+
+    def close(self) -> None:
+        """Stop the source and detach from the bus."""
+        self.stop()
+        self.subscriber.close()
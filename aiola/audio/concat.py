@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+from typing import Any, Union
+
+from ..errors import AiolaFileError
+from .wav import WAVE_FORMAT_PCM, WavStreamParser, wav_header
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+# A part of concat_wav: a complete buffer, or the chunks of a stream such as a TtsStream
+AudioPart = Union[bytes, bytearray, memoryview, Iterable[Any]]
+AsyncAudioPart = Union[AudioPart, AsyncIterable[Any]]
+
+
+def _describe(fmt: tuple[int, int, int | None, int]) -> str:
+    format_tag, channels, sample_rate, sample_width = fmt
+    rate = f"{sample_rate} Hz" if sample_rate is not None else "unknown rate"
+    return f"format {format_tag:#06x}, {channels} channel(s), {rate}, {sample_width * 8}-bit"
+
+
+class WavJoiner:
+    """Joins audio streams, WAV or raw PCM, into one stream without decoding them.
+
+    Feed each part with :meth:`push` and end it with :meth:`end_part`; call :meth:`finish`
+    after the last one. The headers of the parts are parsed and dropped and their payload is
+    passed on, as views of the pushed chunks where possible, behind a single WAV header in the
+    format of the first part, or as raw PCM with ``header=False``. The header states
+    ``data_size`` if it is given, and otherwise :data:`~aiola.audio.wav.UNKNOWN_SIZE`, as
+    streaming writers do. A partial sample at the end of a part is dropped, so the next part
+    stays aligned.
+
+    Raw parts are taken to be in the format given by ``sample_rate``, ``sample_width`` and
+    ``channels``; without a ``sample_rate`` they take the rate of the WAV parts.
+
+    Raises:
+        AiolaFileError: If a part is in a different format than the first one
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int | None = None,
+        sample_width: int = 2,
+        channels: int = 1,
+        header: bool = True,
+        data_size: int | None = None,
+    ) -> None:
+        if sample_width <= 0 or channels <= 0 or (sample_rate is not None and sample_rate <= 0):
+            raise ValueError("sample_rate, sample_width and channels must be positive")
+
+        self.header = header
+        self.data_size = data_size
+        # (format tag, channels, sample rate, sample width) of the joined audio, once known
+        self.format: tuple[int, int, int | None, int] | None = None
+        self.bytes_written = 0
+        self._raw_format = (WAVE_FORMAT_PCM, channels, sample_rate, sample_width)
+        self._parser = WavStreamParser()
+        self._block_align = 0
+        self._carry = b""
+        self._header_sent = False
+
+    def _begin_part(self) -> list[memoryview]:
+        info = self._parser.info
+        if info is not None:
+            fmt = (info.format_tag, info.channels, info.sample_rate, info.block_align // info.channels)
+        else:
+            format_tag, channels, sample_rate, sample_width = self._raw_format
+            if sample_rate is None and self.format is not None:
+                sample_rate = self.format[2]
+            fmt = (format_tag, channels, sample_rate, sample_width)
+        if self.format is None:
+            self.format = fmt
+        elif fmt != self.format:
+            raise AiolaFileError(f"Cannot join {_describe(fmt)} audio to {_describe(self.format)} audio")
+        self._block_align = fmt[1] * fmt[3]
+        return self._header()
+
+    def _header(self) -> list[memoryview]:
+        if self._header_sent or not self.header or self.format is None:
+            return []
+        format_tag, channels, sample_rate, sample_width = self.format
+        if sample_rate is None:
+            raise ValueError("sample_rate is required for audio without a WAV header")
+        self._header_sent = True
+        header = wav_header(
+            sample_rate=sample_rate,
+            channels=channels,
+            sample_width=sample_width,
+            format_tag=format_tag,
+            data_size=self.data_size,
+        )
+        return [memoryview(header)]
+
+    def _emit(self, payload: memoryview) -> list[memoryview]:
+        output = self._begin_part() if not self._block_align else []
+        if self._carry:
+            payload = memoryview(self._carry + payload)
+        end = len(payload) - len(payload) % self._block_align
+        if end:
+            output.append(payload[:end])
+            self.bytes_written += end
+        self._carry = bytes(payload[end:])
+        return output
+
+    def push(self, chunk: bytes | bytearray | memoryview) -> list[memoryview]:
+        """Add a chunk of the current part and return the output it completes, in order."""
+        payload = self._parser.push(chunk)
+        return self._emit(payload) if len(payload) else []
+
+    def end_part(self) -> list[memoryview]:
+        """End the current part; the next :meth:`push` starts a new one, with its own header."""
+        tail = self._parser.flush()
+        output = self._emit(tail) if len(tail) else []
+        if not self._block_align and self._parser.info is not None:
+            # A WAV part without payload still has to match the others
+            output += self._begin_part()
+        self._parser = WavStreamParser()
+        self._block_align = 0
+        self._carry = b""
+        return output
+
+    def finish(self) -> list[memoryview]:
+        """End the last part and return the rest of the output."""
+        output = self.end_part()
+        if self.format is None and self._raw_format[2] is not None:
+            self.format = self._raw_format
+        output += self._header()
+        if self.header and self.data_size is not None and self.data_size & 1:
+            # RIFF chunks are word aligned
+            output.append(memoryview(b"\0"))
+        return output
+
+
+def _payload_size(parts: Sequence[Any], sample_rate: int | None, sample_width: int, channels: int) -> int | None:
+    """Size of the joined payload, if every part is a complete buffer."""
+    if not all(isinstance(part, _BUFFER_TYPES) for part in parts):
+        return None
+    sizer = WavJoiner(sample_rate=sample_rate, sample_width=sample_width, channels=channels, header=False)
+    for part in parts:
+        sizer.push(part)
+        sizer.end_part()
+    return sizer.bytes_written
+
+
+def concat_wav(
+    parts: Iterable[AudioPart],
+    *,
+    sample_rate: int | None = None,
+    sample_width: int = 2,
+    channels: int = 1,
+    header: bool = True,
+) -> Iterator[memoryview]:
+    """
+    Join audio results, e.g. of several TTS requests, into a single WAV stream.
+
+    Each part is a complete buffer or an iterable of chunks, such as a :class:`TtsStream`, which
+    is read only when its turn comes and closed afterwards. Only payload bytes are passed on, see
+    :class:`WavJoiner`. If ``parts`` is a sequence of buffers the header states the exact size;
+    otherwise the size is unknown and the output can be written as it is produced.
+
+    Args:
+        parts: The audio to join, in order
+        sample_rate: Sample rate of raw PCM parts (default: the rate of the WAV parts)
+        sample_width: Bytes per sample of raw PCM parts (default: 2)
+        channels: Channels of raw PCM parts (default: 1)
+        header: Start the output with a WAV header; ``False`` gives raw PCM (default: True)
+
+    Returns:
+        An iterator of output chunks, as memoryviews
+    """
+    data_size = None
+    if header and isinstance(parts, Sequence):
+        data_size = _payload_size(parts, sample_rate, sample_width, channels)
+    joiner = WavJoiner(
+        sample_rate=sample_rate, sample_width=sample_width, channels=channels, header=header, data_size=data_size
+    )
+    for part in parts:
+        if isinstance(part, _BUFFER_TYPES):
+            yield from joiner.push(part)
+        else:
+            try:
+                for chunk in part:
+                    yield from joiner.push(chunk)
+            finally:
+                if hasattr(part, "close"):
+                    part.close()
+        yield from joiner.end_part()
+    yield from joiner.finish()
+
+
+async def aconcat_wav(
+    parts: Iterable[AsyncAudioPart],
+    *,
+    sample_rate: int | None = None,
+    sample_width: int = 2,
+    channels: int = 1,
+    header: bool = True,
+) -> AsyncIterator[memoryview]:
+    """Join audio results, such as :class:`AsyncTtsStream` objects, into a single WAV stream; see :func:`concat_wav`."""
+    data_size = None
+    if header and isinstance(parts, Sequence):
+        data_size = _payload_size(parts, sample_rate, sample_width, channels)
+    joiner = WavJoiner(
+        sample_rate=sample_rate, sample_width=sample_width, channels=channels, header=header, data_size=data_size
+    )
+    for part in parts:
+        if isinstance(part, _BUFFER_TYPES):
+            for view in joiner.push(part):
+                yield view
+        elif isinstance(part, AsyncIterable):
+            try:
+                async for chunk in part:
+                    for view in joiner.push(chunk):
+                        yield view
+            finally:
+                if hasattr(part, "aclose"):
+                    await part.aclose()
+        else:
+            try:
+                for chunk in part:
+                    for view in joiner.push(chunk):
+                        yield view
+            finally:
+                if hasattr(part, "close"):
+                    part.close()
+        for view in joiner.end_part():
+            yield view
+    for view in joiner.finish():
+        yield view
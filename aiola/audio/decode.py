@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .g711 import g711_decode
+from .wav import WAVE_FORMAT_ALAW, WAVE_FORMAT_IEEE_FLOAT, WAVE_FORMAT_MULAW, WAVE_FORMAT_PCM, WavInfo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Sample type of the bytes in a frame, by format and sample width; 24-bit PCM is widened to int32
+# and G.711 is expanded to 16-bit PCM
+_NATIVE_DTYPES = {
+    (WAVE_FORMAT_PCM, 1): "uint8",
+    (WAVE_FORMAT_PCM, 2): "<i2",
+    (WAVE_FORMAT_PCM, 3): "<i4",
+    (WAVE_FORMAT_PCM, 4): "<i4",
+    (WAVE_FORMAT_IEEE_FLOAT, 4): "<f4",
+    (WAVE_FORMAT_IEEE_FLOAT, 8): "<f8",
+    (WAVE_FORMAT_MULAW, 1): "<i2",
+    (WAVE_FORMAT_ALAW, 1): "<i2",
+}
+_G711_LAWS = {WAVE_FORMAT_MULAW: "mulaw", WAVE_FORMAT_ALAW: "alaw"}
+_OUTPUT_DTYPES = ("int16", "int32", "float32", "float64")
+
+
+class PcmDecoder:
+    """Turns frames of PCM bytes into NumPy arrays of shape ``(samples, channels)``.
+
+    Without a ``dtype`` the samples keep their stored type and each array is a read-only
+    ``frombuffer`` view of its frame, so nothing is copied; copy an array before changing it.
+    With a ``dtype`` they are converted in one vectorized pass: floats are scaled to [-1, 1],
+    integers to the full range of the type. 8-bit PCM is unsigned and centred on 128, as in WAV.
+    G.711 mu-law and A-law are expanded to int16, which is always a copy.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_width: int = 2,
+        channels: int = 1,
+        format_tag: int = WAVE_FORMAT_PCM,
+        dtype: str | None = None,
+    ) -> None:
+        if np is None:
+            raise ImportError("numpy is required for PCM decoding. Install it with: pip install 'aiola[audio]'")
+        if (format_tag, sample_width) not in _NATIVE_DTYPES:
+            raise ValueError(f"Unsupported audio format {format_tag:#06x} with {sample_width}-byte samples")
+        if dtype is not None and dtype not in _OUTPUT_DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r}; expected one of {list(_OUTPUT_DTYPES)}")
+        if channels <= 0:
+            raise ValueError("channels must be positive")
+
+        self.sample_width = sample_width
+        self.channels = channels
+        self.format_tag = format_tag
+        self.native_dtype = np.dtype(_NATIVE_DTYPES[(format_tag, sample_width)])
+        self._bits = 16 if format_tag in _G711_LAWS else sample_width * 8
+        self.dtype = np.dtype(dtype) if dtype is not None else self.native_dtype
+
+    @classmethod
+    def from_wav_info(cls, info: WavInfo, dtype: str | None = None) -> PcmDecoder:
+        """Create a decoder for the audio described by a WAV header."""
+        return cls(
+            sample_width=info.block_align // info.channels,
+            channels=info.channels,
+            format_tag=info.format_tag,
+            dtype=dtype,
+        )
+
+    def _samples(self, frame: Any) -> np.ndarray:
+        if self.format_tag in _G711_LAWS:
+            return g711_decode(frame, _G711_LAWS[self.format_tag])
+        if self.sample_width == 3:
+            # Place the three bytes in the top of an int32, then shift back keeping the sign
+            packed = np.frombuffer(frame, dtype=np.uint8).reshape(-1, 3)
+            widened = np.zeros((len(packed), 4), dtype=np.uint8)
+            widened[:, 1:] = packed
+            return widened.view("<i4").reshape(-1) >> 8
+        return np.frombuffer(frame, dtype=self.native_dtype)
+
+    def _scale(self) -> float:
+        """Full scale of the stored samples."""
+        if self.native_dtype.kind == "f":
+            return 1.0
+        return float(2 ** (self._bits - 1))
+
+    def decode(self, frame: Any) -> np.ndarray:
+        """Decode a bytes-like frame holding whole samples for every channel."""
+        samples = self._samples(frame).reshape(-1, self.channels)
+        if self.dtype == self.native_dtype:
+            return samples
+
+        # float32 keeps every bit of 16-bit audio; wider conversions need float64
+        exact = self.dtype == np.float32 and self._bits <= 16
+        values = samples.astype(np.float32 if exact else np.float64)
+        if self.sample_width == 1 and self.native_dtype.kind == "u":
+            values -= 128
+        if self.native_dtype.kind != "f":
+            values /= self._scale()
+        if self.dtype.kind == "f":
+            return values.astype(self.dtype, copy=False)
+        # Integer output: map [-1, 1) onto the full range of the type
+        limit = np.iinfo(self.dtype)
+        scaled = np.rint(values * (limit.max + 1.0))
+        return np.clip(scaled, limit.min, limit.max).astype(self.dtype)
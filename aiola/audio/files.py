@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Iterator
+
+from ..errors import AiolaFileError, AiolaValidationError
+from .wav import WAVE_FORMAT_PCM, is_wav, parse_wav_header
+
+
+class MappedAudioFile:
+    """A WAV or raw PCM file mapped into memory.
+
+    WAV files describe their own format; raw PCM files use the format passed in.
+    Frames are returned as memoryview slices of the mapping, so reading never copies.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        channels: int = 1,
+    ) -> None:
+        try:
+            self._file = open(path, "rb")  # noqa: SIM115 - closed in close()
+        except OSError as exc:
+            raise AiolaFileError(f"Cannot open audio file: {path}") from exc
+
+        self._mmap: mmap.mmap | None = None
+        self._view: memoryview | None = None
+        self.data = memoryview(b"")
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                raise AiolaFileError(f"Audio file is empty: {path}")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = self._view = memoryview(self._mmap)
+            if is_wav(view):
+                info = parse_wav_header(view)
+                if info.format_tag != WAVE_FORMAT_PCM:
+                    raise AiolaFileError(f"Unsupported WAV encoding (format tag {info.format_tag:#06x})")
+                end = len(view) if info.data_size is None else min(len(view), info.data_offset + info.data_size)
+                self.sample_rate = info.sample_rate
+                self.sample_width = info.sample_width
+                self.channels = info.channels
+                self.data = view[info.data_offset : end]
+            else:
+                self.sample_rate = sample_rate
+                self.sample_width = sample_width
+                self.channels = channels
+                self.data = view
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def block_align(self) -> int:
+        return self.sample_width * self.channels
+
+    @property
+    def duration(self) -> float:
+        """Duration of the payload in seconds."""
+        return len(self.data) / (self.sample_rate * self.block_align)
+
+    def frame_bytes(self, frame_ms: float) -> int:
+        """Size in bytes of a *frame_ms* frame, rounded to whole samples."""
+        if frame_ms <= 0:
+            raise AiolaValidationError("frame_ms must be positive")
+        return max(1, round(self.sample_rate * frame_ms / 1000)) * self.block_align
+
+    def frames(self, frame_ms: float) -> Iterator[memoryview]:
+        """Yield consecutive *frame_ms* frames of the payload; the last one may be shorter."""
+        size = self.frame_bytes(frame_ms)
+        for offset in range(0, len(self.data), size):
+            yield self.data[offset : offset + size]
+
+    def close(self) -> None:
+        try:
+            self.data.release()
+            if self._view is not None:
+                self._view.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            pass  # A caller still holds a frame; the mapping is released together with it
+        self.data = memoryview(b"")
+        self._view = None
+        self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> MappedAudioFile:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+class FrameChunker:
+    """Re-chunks audio of arbitrary block sizes into frames of exactly ``frame_ms``.
+
+    Whole frames inside an incoming block are returned as memoryview slices of that block, so
+    they are only copied when the caller turns them into bytes. Only a frame that straddles two
+    blocks is assembled in a small carry-over buffer. Returned views share memory with the input
+    and must be consumed before the input buffer is reused.
+    """
+
+    def __init__(
+        self,
+        frame_ms: float = 20,
+        *,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        channels: int = 1,
+    ) -> None:
+        if frame_ms <= 0 or sample_rate <= 0 or sample_width <= 0 or channels <= 0:
+            raise ValueError("frame_ms, sample_rate, sample_width and channels must be positive")
+
+        self.frame_ms = frame_ms
+        self.frame_bytes = max(1, round(sample_rate * frame_ms / 1000)) * sample_width * channels
+        self._carry = bytearray()
+
+    @property
+    def pending(self) -> int:
+        """Number of bytes held back until the next frame is complete."""
+        return len(self._carry)
+
+    def push(self, data: Any) -> list[memoryview]:
+        """Add a block of audio and return the frames completed by it, in order."""
+        view = memoryview(data).cast("B")
+        size = self.frame_bytes
+        frames: list[memoryview] = []
+        start = 0
+
+        if self._carry:
+            start = min(size - len(self._carry), len(view))
+            self._carry += view[:start]
+            if len(self._carry) < size:
+                return frames
+            frames.append(memoryview(self._carry))
+            self._carry = bytearray()
+
+        end = start + (len(view) - start) // size * size
+        frames.extend(view[offset : offset + size] for offset in range(start, end, size))
+        if end < len(view):
+            self._carry += view[end:]
+        return frames
+
+    def flush(self) -> bytes:
+        """Return the incomplete trailing frame, if any, and start over."""
+        tail = bytes(self._carry)
+        self._carry = bytearray()
+        return tail
+
+    def reset(self) -> None:
+        """Drop any incomplete frame."""
+        self._carry = bytearray()
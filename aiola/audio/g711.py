@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Encoding and decoding are single table lookups: 65536 entries map every 16-bit sample to its
+# code and 256 entries map every code back. The tables are built on first use.
+_tables: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+# Bias and clip level of mu-law, on 14-bit samples
+_MULAW_BIAS = 0x21
+_MULAW_CLIP = 8159
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for G.711 transcoding. Install it with: pip install 'aiola[audio]'")
+
+
+def _mulaw_tables() -> tuple[np.ndarray, np.ndarray]:
+    pcm = np.arange(-32768, 32768, dtype=np.int32) >> 2
+    mask = np.where(pcm >= 0, 0xFF, 0x7F)
+    pcm = np.minimum(np.abs(pcm), _MULAW_CLIP) + _MULAW_BIAS
+    segment = np.searchsorted(np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF]), pcm)
+    codes = np.where(segment >= 8, 0x7F, (np.minimum(segment, 7) << 4) | ((pcm >> (segment + 1)) & 0x0F))
+    codes ^= mask
+
+    inverted = ~np.arange(256) & 0xFF
+    exponent = (inverted >> 4) & 0x07
+    magnitude = ((((inverted & 0x0F) << 3) + (_MULAW_BIAS << 2)) << exponent) - (_MULAW_BIAS << 2)
+    linear = np.where(inverted & 0x80, -magnitude, magnitude)
+    return _by_sample(codes), linear.astype(np.int16)
+
+
+def _alaw_tables() -> tuple[np.ndarray, np.ndarray]:
+    pcm = np.arange(-32768, 32768, dtype=np.int32) >> 3
+    mask = np.where(pcm >= 0, 0xD5, 0x55)
+    pcm = np.where(pcm >= 0, pcm, -pcm - 1)
+    segment = np.searchsorted(np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]), pcm)
+    shift = np.maximum(segment, 1)
+    codes = np.where(segment >= 8, 0x7F, (np.minimum(segment, 7) << 4) | ((pcm >> np.minimum(shift, 7)) & 0x0F))
+    codes ^= mask
+
+    code = np.arange(256) ^ 0x55
+    segment = (code & 0x70) >> 4
+    magnitude = ((code & 0x0F) << 4) + np.where(segment == 0, 8, 0x108)
+    magnitude = np.where(segment > 1, magnitude << np.maximum(segment - 1, 0), magnitude)
+    linear = np.where(code & 0x80, magnitude, -magnitude)
+    return _by_sample(codes), linear.astype(np.int16)
+
+
+def _by_sample(codes: np.ndarray) -> np.ndarray:
+    """Reorder a table built for samples -32768..32767 so it is indexed by the sample's bits."""
+    return np.roll(codes.astype(np.uint8), -32768)
+
+
+def _table(law: str) -> tuple[np.ndarray, np.ndarray]:
+    _require_numpy()
+    if law not in _tables:
+        if law == "mulaw":
+            _tables[law] = _mulaw_tables()
+        elif law == "alaw":
+            _tables[law] = _alaw_tables()
+        else:
+            raise ValueError(f"Unsupported G.711 law {law!r}; expected 'mulaw' or 'alaw'")
+    return _tables[law]
+
+
+def g711_encode(samples: Any, law: str = "mulaw") -> bytes:
+    """Encode 16-bit PCM, as bytes or an int16 array, into G.711 ``"mulaw"`` or ``"alaw"`` codes."""
+    encode, _ = _table(law)
+    if not isinstance(samples, np.ndarray):
+        samples = np.frombuffer(samples, dtype="<i2")
+    return encode[samples.astype("<i2", copy=False).view(np.uint16)].tobytes()
+
+
+def g711_decode(data: Any, law: str = "mulaw") -> np.ndarray:
+    """Decode G.711 ``"mulaw"`` or ``"alaw"`` codes into an int16 array of samples."""
+    _, decode = _table(law)
+    return decode[np.frombuffer(data, dtype=np.uint8)]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .vad import _FULL_SCALE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Level reported for digital silence, in dBFS
+SILENCE_DB = -120.0
+
+
+def _to_db(value: float) -> float:
+    return 20 * math.log10(value) if value > 0 else SILENCE_DB
+
+
+@dataclass(frozen=True)
+class LevelReading:
+    """A snapshot of a :class:`LevelMeter`. Levels are in dBFS."""
+
+    rms_db: float = SILENCE_DB
+    peak_db: float = SILENCE_DB
+    peak_hold_db: float = SILENCE_DB
+    clipped_samples: int = 0
+    samples: int = 0
+
+    @property
+    def clip_ratio(self) -> float:
+        return self.clipped_samples / self.samples if self.samples else 0.0
+
+
+class LevelMeter:
+    """Running RMS level, peak and clipping counters for a stream of audio blocks.
+
+    Each block is measured in a few vectorized passes over its samples. The RMS level is
+    smoothed over ``window_ms``; ``peak_db`` is the peak of the latest block and
+    ``peak_hold_db`` the highest peak since the last :meth:`reset`. A sample counts as clipped
+    when its magnitude reaches ``clip_threshold`` of full scale.
+
+    :meth:`update` is called from the capture thread while :meth:`reading` may be called from
+    any other: the state is replaced as a whole, so a reading is always consistent.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 16000,
+        channels: int = 1,
+        dtype: str = "int16",
+        window_ms: float = 300,
+        clip_threshold: float = 0.999,
+    ) -> None:
+        if np is None:
+            raise ImportError("numpy is required for level metering. Install it with: pip install 'aiola[audio]'")
+        if dtype not in _FULL_SCALE:
+            raise ValueError(f"Unsupported dtype {dtype!r}; expected one of {sorted(_FULL_SCALE)}")
+        if sample_rate <= 0 or channels <= 0 or window_ms <= 0:
+            raise ValueError("sample_rate, channels and window_ms must be positive")
+        if not 0 < clip_threshold <= 1:
+            raise ValueError("clip_threshold must be in (0, 1]")
+
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self.window_ms = window_ms
+        self._full_scale = _FULL_SCALE[dtype]
+        self._clip_level = clip_threshold * self._full_scale
+        # Mean square (relative to full scale) smoothed over the window, and the latest reading
+        self._mean_square = 0.0
+        self._reading = LevelReading()
+
+    def update(self, block: Any) -> None:
+        """Measure one block: a NumPy array or a bytes-like object of interleaved samples."""
+        samples = (
+            block.reshape(-1) if isinstance(block, np.ndarray) else np.frombuffer(block, dtype=self.dtype)
+        ).astype(np.float32)
+        if not samples.size:
+            return
+
+        mean_square = float(np.dot(samples, samples)) / samples.size / self._full_scale**2
+        peak = max(float(samples.max()), -float(samples.min())) / self._full_scale
+        clipped = int(np.count_nonzero(samples >= self._clip_level)) + int(
+            np.count_nonzero(samples <= -self._clip_level)
+        )
+
+        duration_ms = samples.size / self.channels / self.sample_rate * 1000
+        alpha = 1 - math.exp(-duration_ms / self.window_ms)
+        self._mean_square += alpha * (mean_square - self._mean_square)
+
+        previous = self._reading
+        peak_db = _to_db(peak)
+        self._reading = LevelReading(
+            rms_db=_to_db(math.sqrt(self._mean_square)),
+            peak_db=peak_db,
+            peak_hold_db=max(previous.peak_hold_db, peak_db),
+            clipped_samples=previous.clipped_samples + clipped,
+            samples=previous.samples + samples.size,
+        )
+
+    def reading(self) -> LevelReading:
+        """Return the current levels and counters; safe to call from any thread."""
+        return self._reading
+
+    def reset(self) -> None:
+        """Forget the smoothed level, the peak hold and the counters."""
+        self._mean_square = 0.0
+        self._reading = LevelReading()
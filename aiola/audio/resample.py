@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Zero crossings of the sinc on each side of a tap; more gives a steeper filter
+DEFAULT_ZERO_CROSSINGS = 8
+# Outputs computed per vectorized step, which bounds the memory of one step
+_BLOCK = 4096
+
+
+class Resampler:
+    """Changes the sample rate of a stream of float samples, chunk by chunk.
+
+    Uses a polyphase windowed-sinc filter for the exact ratio of the two rates, which also
+    removes frequencies the lower rate can't represent. Each chunk is processed in a few
+    vectorized steps, and enough input is kept between chunks that the output is the same
+    however the stream is split. The output is aligned with the input, but its last
+    ``zero_crossings`` or so samples of the lower rate are only returned with more input or by
+    :meth:`flush`.
+    """
+
+    def __init__(
+        self,
+        input_rate: int,
+        output_rate: int,
+        *,
+        channels: int = 1,
+        zero_crossings: int = DEFAULT_ZERO_CROSSINGS,
+    ) -> None:
+        if np is None:
+            raise ImportError("numpy is required for resampling. Install it with: pip install 'aiola[audio]'")
+        if input_rate <= 0 or output_rate <= 0 or channels <= 0 or zero_crossings <= 0:
+            raise ValueError("input_rate, output_rate, channels and zero_crossings must be positive")
+
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.channels = channels
+        divisor = math.gcd(input_rate, output_rate)
+        # Output n falls at input position n * step / phases
+        self._phases = output_rate // divisor
+        self._step = input_rate // divisor
+        cutoff = min(1.0, output_rate / input_rate)
+        self._half = math.ceil(zero_crossings / cutoff)
+        offsets = np.arange(-self._half + 1, self._half + 1)
+        distance = np.arange(self._phases)[:, None] / self._phases - offsets[None, :]
+        window = np.cos(np.pi * distance / (2 * self._half)) ** 2
+        bank = np.sinc(cutoff * distance) * window
+        self._bank = (bank / bank.sum(axis=1, keepdims=True)).astype(np.float32)
+        self._offsets = offsets
+        # Input kept for the filter, and the index in the stream of its first sample
+        self._buffer = np.zeros((self._half, channels), dtype=np.float32)
+        self._start = -self._half
+        self._received = 0
+        self._produced = 0
+
+    def _run(self, end: int) -> np.ndarray:
+        """Compute the outputs up to ``end``."""
+        blocks = []
+        for first in range(self._produced, end, _BLOCK):
+            positions = np.arange(first, min(first + _BLOCK, end), dtype=np.int64) * self._step
+            bases, phases = np.divmod(positions, self._phases)
+            taps = self._buffer[bases[:, None] + self._offsets[None, :] - self._start]
+            blocks.append(np.einsum("ntc,nt->nc", taps, self._bank[phases]))
+        self._produced = max(end, self._produced)
+        # Drop the input no later output will reach
+        keep_from = self._produced * self._step // self._phases - self._half + 1 - self._start
+        if keep_from > 0:
+            self._buffer = self._buffer[keep_from:]
+            self._start += keep_from
+        if not blocks:
+            return np.zeros((0, self.channels), dtype=np.float32)
+        return np.concatenate(blocks).astype(np.float32, copy=False)
+
+    def push(self, samples: np.ndarray) -> np.ndarray:
+        """Add samples of shape ``(samples, channels)`` and return the output they complete."""
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1, self.channels)
+        self._buffer = np.concatenate([self._buffer, samples])
+        self._received += len(samples)
+        # Output n is complete once the input reaches n * step / phases + half
+        last_base = self._received - self._half - 1
+        return self._run(max(0, ((last_base + 1) * self._phases + self._step - 1) // self._step))
+
+    def flush(self) -> np.ndarray:
+        """Return the rest of the output, as if the input were followed by silence."""
+        total = (self._received * self._phases + self._step - 1) // self._step
+        self._buffer = np.concatenate([self._buffer, np.zeros((self._half, self.channels), dtype=np.float32)])
+        return self._run(total)
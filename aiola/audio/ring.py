@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AudioRingBuffer:
+    """Preallocated single-producer/single-consumer ring of fixed-size audio blocks.
+
+    The producer (typically a PortAudio callback) copies each block into the next slot with
+    :meth:`write`, which performs no allocation and converts the dtype in place when needed. The
+    consumer gets zero-copy views of the slots with :meth:`read_view`. No lock is shared between
+    the two sides: each only advances its own counter.
+
+    When the consumer falls behind by more than ``capacity - 1`` blocks, the oldest blocks are
+    skipped and counted in ``overflows``, and a warning is logged the first time; reads that find
+    the ring empty and wait for the producer are counted in ``underflows``. A view returned by
+    :meth:`read_view` stays valid until the producer laps the ring, so consumers should be done
+    with it before reading the next block.
+    """
+
+    def __init__(self, block_frames: int, channels: int, dtype: str, capacity: int) -> None:
+        if np is None:
+            raise ImportError("numpy is required for audio buffering. Install it with: pip install 'aiola[audio]'")
+        if block_frames <= 0 or channels <= 0:
+            raise ValueError("block_frames and channels must be positive")
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2 blocks")
+
+        self.block_frames = block_frames
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self.capacity = capacity
+        self._slots = np.zeros((capacity, block_frames, channels), dtype=self.dtype)
+        self._frames = np.zeros(capacity, dtype=np.int64)
+        self._written = 0  # Blocks published; only the producer writes this
+        self._read = 0  # Blocks consumed; only the consumer writes this
+        self.overflows = 0
+        self.underflows = 0
+        self._data_ready = threading.Event()
+        self._space_ready = threading.Event()
+        self._closed = False
+        self._interrupted = False
+
+    def __len__(self) -> int:
+        """Number of blocks waiting to be read."""
+        return min(self._written - self._read, self.capacity - 1)
+
+    @property
+    def buffered_frames(self) -> int:
+        """Number of audio frames waiting to be read."""
+        pending = len(self)
+        if pending <= 0:
+            return 0
+        first = (self._written - pending) % self.capacity
+        slots = np.arange(first, first + pending) % self.capacity
+        return int(self._frames[slots].sum())
+
+    def write(self, block: Any) -> None:
+        """Copy a ``(frames, channels)`` array into the ring (producer side).
+
+        Blocks longer than ``block_frames`` are spread over consecutive slots.
+        """
+        total = len(block)
+        start = 0
+        while start < total:
+            frames = min(self.block_frames, total - start)
+            slot = self._written % self.capacity
+            np.copyto(self._slots[slot, :frames], block[start : start + frames], casting="unsafe")
+            self._frames[slot] = frames
+            self._written += 1
+            start += frames
+        self._data_ready.set()
+
+    def read_view(self, timeout: float | None = None) -> memoryview | None:
+        """Return the next block as a read-only byte view.
+
+        Returns ``None`` if no block arrived in time, after :meth:`interrupt` or, once the ring
+        is closed, as soon as it has been drained. Waiting consumes no CPU: the consumer sleeps
+        until a write, :meth:`interrupt` or :meth:`close` wakes it.
+        """
+        if self._written == self._read:
+            if self._closed or self._take_interrupt():
+                return None
+            self._data_ready.clear()
+            # Re-check after clearing so a write, interrupt or close racing with clear() isn't missed
+            if self._written == self._read and not self._closed and not self._interrupted:
+                # The consumer is ahead of the producer and has to wait for it
+                self.underflows += 1
+                if not self._data_ready.wait(timeout):
+                    return None
+            if self._written == self._read:
+                self._take_interrupt()
+                return None
+
+        backlog = self._written - self._read
+        if backlog > self.capacity - 1:
+            skipped = backlog - (self.capacity - 1)
+            if not self.overflows:
+                logger.warning(
+                    "Audio consumer fell %d blocks behind; dropping the oldest audio. Raise max_buffer_ms "
+                    "or read faster; dropped blocks are counted in overflows.",
+                    backlog,
+                )
+            self.overflows += skipped
+            self._read += skipped
+
+        slot = self._read % self.capacity
+        frames = int(self._frames[slot])
+        self._read += 1
+        self._space_ready.set()
+        return memoryview(self._slots[slot, :frames]).cast("B").toreadonly()
+
+    def _take_interrupt(self) -> bool:
+        interrupted, self._interrupted = self._interrupted, False
+        return interrupted
+
+    def interrupt(self) -> None:
+        """Make a waiting (or the next) read of an empty ring return ``None`` once."""
+        self._interrupted = True
+        self._data_ready.set()
+
+    def clear_interrupt(self) -> None:
+        """Forget an :meth:`interrupt` no read has consumed yet."""
+        self._interrupted = False
+
+    def skip_overwritten(self) -> None:
+        """Move past blocks the producer has overwritten without counting them in ``overflows``.
+
+        For a consumer that attaches late: audio captured while nobody was reading is not lag
+        (consumer side).
+        """
+        self._read = max(self._read, self._written - (self.capacity - 1))
+
+    def discard_older(self, keep_frames: int) -> None:
+        """Drop unread blocks except the newest ones holding at least *keep_frames* (consumer side)."""
+        oldest = self._written - len(self)
+        start = self._written
+        kept = 0
+        while start > oldest and kept < keep_frames:
+            start -= 1
+            kept += int(self._frames[start % self.capacity])
+        self._read = max(self._read, start)
+
+    def wait_for_space(self, timeout: float | None = None) -> bool:
+        """Block the producer until a slot is free (producer side).
+
+        Only producers that can be paused (files, pipes) use this; live capture writes
+        regardless and lets the oldest blocks go. Returns ``False`` on timeout or once the
+        ring is closed.
+        """
+        while self._written - self._read >= self.capacity - 1:
+            if self._closed:
+                return False
+            self._space_ready.clear()
+            # Re-check after clearing so a read racing with clear() isn't missed
+            if (
+                self._written - self._read >= self.capacity - 1
+                and not self._closed
+                and not self._space_ready.wait(timeout)
+            ):
+                return False
+        return not self._closed
+
+    @property
+    def closed(self) -> bool:
+        """``True`` after :meth:`close` until :meth:`reopen`."""
+        return self._closed
+
+    def close(self) -> None:
+        """Wake up a waiting consumer and make reads of an empty ring return immediately."""
+        self._closed = True
+        self._data_ready.set()
+        self._space_ready.set()
+
+    def reopen(self) -> None:
+        """Undo :meth:`close` so reads wait for data again."""
+        self._closed = False
+        self._interrupted = False
+
+    def clear(self) -> None:
+        """Discard unread blocks (consumer side)."""
+        self._read = self._written
+        self._data_ready.clear()
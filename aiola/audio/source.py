@@ -0,0 +1,507 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import queue
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing, suppress
+from typing import TYPE_CHECKING, Any
+
+from .framing import FrameChunker
+from .ring import AudioRingBuffer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .meter import LevelMeter
+    from .vad import VadGate
+
+# Most unread audio kept before the oldest blocks are dropped, and the ring slot size used when
+# the producer picks its own block size (blocksize=0)
+MAX_BUFFER_MS = 2000
+VARIABLE_BLOCK_FRAMES = 1024
+
+
+def _is_open(connection: Any) -> bool:
+    """Whether a connection still accepts audio, including while it reconnects."""
+    return getattr(connection, "connected", True) or getattr(connection, "reconnecting", False)
+
+
+class AudioSource(ABC):
+    """
+    Base class for audio producers that can be streamed to a connection.
+
+    Subclasses implement :meth:`_open` and :meth:`_close` and hand captured blocks of shape
+    ``(frames, channels)`` to :meth:`_deliver` from any thread; finite sources call
+    :meth:`_end` once their input is exhausted. Everything else (the bounded ring buffer,
+    ``read``, ``stream_to``, ``astream_to`` and the lag counters) is shared by all sources.
+    """
+
+    _name = "Audio source"
+
+    def __init__(
+        self,
+        *,
+        channels: int,
+        samplerate: int,
+        blocksize: int,
+        dtype: str,
+        max_buffer_ms: float = MAX_BUFFER_MS,
+        meter: LevelMeter | None = None,
+        preroll_ms: float | None = None,
+    ):
+        """
+        Initialize the audio source.
+
+        Args:
+            channels: Number of audio channels
+            samplerate: Sample rate in Hz
+            blocksize: Number of frames per block (0 lets the producer choose)
+            dtype: Audio data type, e.g. "int16"
+            max_buffer_ms: Most unread audio to keep, in milliseconds (default: 2000). When the
+                consumer falls further behind, the oldest audio is dropped, with a warning logged the
+                first time, and counted in ``overflows``, which bounds both memory use and latency.
+            meter: Optional level meter updated with every captured block; sample it with
+                ``meter.reading()`` from any thread
+            preroll_ms: Audio captured before a consumer attaches that is still delivered to it,
+                in milliseconds (default: None for everything still buffered). Keeping the
+                source started and calling :meth:`detach` between utterances means a trigger
+                (push-to-talk, wake word) never clips the start of speech.
+        """
+        if max_buffer_ms <= 0:
+            raise ValueError("max_buffer_ms must be positive")
+        if preroll_ms is not None and not 0 <= preroll_ms <= max_buffer_ms:
+            raise ValueError("preroll_ms must be between 0 and max_buffer_ms")
+
+        self.channels = channels
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.dtype = dtype
+        self.max_buffer_ms = max_buffer_ms
+        self.meter = meter
+        self.preroll_ms = preroll_ms
+
+        self._is_recording = False
+        self._thread: threading.Thread | None = None
+        self._detached = threading.Event()
+        block_frames = blocksize or VARIABLE_BLOCK_FRAMES
+        # One spare slot: the ring holds at most capacity - 1 unread blocks
+        capacity = max(2, math.ceil(max_buffer_ms * samplerate / 1000 / block_frames) + 1)
+        self._buffer = AudioRingBuffer(block_frames, channels, dtype, capacity)
+        self._on_audio_callback: Callable[[bytes], None] | None = None
+        self._on_error_callback: Callable[[Exception], None] | None = None
+        # Error that ended the input, raised by the consumer when no on_error callback took it
+        self._error: Exception | None = None
+        # Loop and event of the asyncio consumer, if any, woken from the producer thread
+        self._async_waiter: tuple[asyncio.AbstractEventLoop, asyncio.Event] | None = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.stop()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self.stop()
+
+    @abstractmethod
+    def _open(self) -> None:
+        """Start producing audio into :meth:`_deliver`."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Stop producing audio and release the underlying device, file or process."""
+
+    def _deliver(self, block: Any) -> None:
+        """Hand a ``(frames, channels)`` block to the consumers (producer side)."""
+        meter = self.meter
+        if meter is not None:
+            meter.update(block)
+        # Copy into a preallocated slot; no allocation or dtype conversion when dtypes match
+        self._buffer.write(block)
+        self._wake_async_consumer()
+
+    def _end(self) -> None:
+        """Signal that a finite source is exhausted; consumers finish once they drain the buffer."""
+        self._buffer.close()
+        self._wake_async_consumer()
+
+    def _wake_async_consumer(self) -> None:
+        waiter = self._async_waiter
+        if waiter is None:
+            return
+        loop, ready = waiter
+        # RuntimeError: the consumer's loop is already closed
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(ready.set)
+
+    def _report_error(self, error: Exception) -> None:
+        if self._on_error_callback:
+            self._on_error_callback(error)
+
+    def _fail(self, error: Exception) -> None:
+        """Report an error that ends the input; without an ``on_error`` callback the consumer raises it."""
+        if self._on_error_callback:
+            self._on_error_callback(error)
+        else:
+            self._error = error
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _attach(self) -> threading.Event:
+        """Prepare the buffer for a new consumer and return the event that detaches it."""
+        self._buffer.clear_interrupt()
+        # Audio captured while detached is not consumer lag: drop what was overwritten silently
+        self._buffer.skip_overwritten()
+        if self.preroll_ms is not None:
+            self._buffer.discard_older(math.ceil(self.preroll_ms * self.samplerate / 1000))
+        self._detached = threading.Event()
+        return self._detached
+
+    def detach(self) -> None:
+        """
+        End the current ``stream_to``, ``stream_with_callback``, ``frames`` or ``astream_to``
+        consumer but keep capturing.
+
+        The trailing partial frame is still sent. The next consumer starts with the
+        ``preroll_ms`` of audio captured in the meantime.
+        """
+        self._detached.set()
+        self._buffer.interrupt()
+        self._wake_async_consumer()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def start(self) -> None:
+        """Start the audio source."""
+        if self._is_recording:
+            return
+
+        self._buffer.reopen()
+        self._error = None
+        self._open()
+        self._is_recording = True
+
+    def stop(self) -> None:
+        """Stop the audio source."""
+        if not self._is_recording:
+            return
+
+        self._is_recording = False
+        # Wake waiting consumers so the worker thread can be joined right away
+        self._buffer.close()
+        self._wake_async_consumer()
+
+        if self._thread and self._thread.is_alive():
+            self._thread.join()
+
+        self._close()
+
+        # Discard unread audio
+        self._buffer.clear()
+
+    def read(self, timeout: float | None = None) -> bytes:
+        """
+        Read audio data from the source.
+
+        Args:
+            timeout: Timeout in seconds to wait for audio data (default: None for blocking)
+
+        Returns:
+            Audio data as bytes
+
+        Raises:
+            RuntimeError: If the source is not started
+            queue.Empty: If timeout is reached, the source is stopped while waiting or a finite
+                source is exhausted
+            Exception: The error that ended the input, when no ``on_error`` callback received it
+        """
+        return self.read_view(timeout=timeout).tobytes()
+
+    def read_view(self, timeout: float | None = None) -> memoryview:
+        """
+        Read the next audio block without copying it.
+
+        The returned read-only view points into the source's ring buffer and stays valid
+        until the buffer wraps around; copy it (``bytes(view)``) to keep it longer.
+
+        Args:
+            timeout: Timeout in seconds to wait for audio data (default: None for blocking)
+
+        Returns:
+            Audio data as a memoryview of bytes
+
+        Raises:
+            RuntimeError: If the source is not started
+            queue.Empty: If timeout is reached, the source is stopped while waiting or a finite
+                source is exhausted
+            Exception: The error that ended the input, when no ``on_error`` callback received it
+        """
+        if not self._is_recording:
+            raise RuntimeError(f"{self._name} is not started")
+
+        view = self._buffer.read_view(timeout=timeout)
+        if view is None:
+            self._raise_error()
+            raise queue.Empty
+        return view
+
+    def stream_to(
+        self,
+        connection: Any,
+        on_error: Callable[[Exception], None] | None = None,
+        vad: VadGate | None = None,
+        frame_ms: float | None = None,
+    ) -> None:
+        """
+        Stream audio data to a connection (e.g., STT streaming connection).
+
+        Args:
+            connection: The connection object to send audio data to
+            on_error: Optional callback for handling errors
+            vad: Optional client-side voice activity gate; only speech (plus its pre-roll,
+                hang-over and keep-alive blocks) is sent. Savings are reported in ``vad.stats``.
+            frame_ms: Optional frame duration in milliseconds; captured blocks are re-chunked
+                into frames of exactly this length before sending. Latency is still bounded
+                below by ``blocksize``, so pair short frames with a small (or 0) block size.
+
+        Raises:
+            RuntimeError: If the source is not started
+        """
+        if not self._is_recording:
+            raise RuntimeError(f"{self._name} is not started")
+
+        self._on_error_callback = on_error
+        chunker = self._make_chunker(frame_ms)
+        detached = self._attach()
+
+        def _stream_worker():
+            try:
+                while self._is_recording and not detached.is_set():
+                    try:
+                        # Sleeps until a block arrives; stop(), detach() or the end of input wakes it with None
+                        view = self._buffer.read_view()
+                        if view is None:
+                            self._raise_error()
+                            break
+                        # Check if connection is still active before sending; keep feeding a
+                        # reconnecting connection so it can buffer the audio for replay
+                        if not _is_open(connection):
+                            break
+                        for chunk in self._outgoing_chunks(view, chunker, vad):
+                            connection.send(chunk)
+                    except Exception as e:
+                        if self._on_error_callback:
+                            self._on_error_callback(e)
+                        else:
+                            raise
+                # Stopped: send the trailing partial frame, if any
+                if _is_open(connection):
+                    for chunk in self._flush_chunks(chunker, vad):
+                        connection.send(chunk)
+            except Exception as e:
+                if self._on_error_callback:
+                    self._on_error_callback(e)
+                else:
+                    raise
+
+        self._thread = threading.Thread(target=_stream_worker, daemon=True)
+        self._thread.start()
+
+    async def frames(self) -> AsyncIterator[bytes]:
+        """
+        Iterate over captured audio blocks from an asyncio event loop.
+
+        No thread is involved: the producer wakes the loop with ``call_soon_threadsafe``
+        whenever a block arrives. Iteration ends when the source is stopped or exhausted, or
+        on :meth:`detach`. Only one consumer (``frames``, ``astream_to`` or a ``read`` loop) may be active.
+
+        Yields:
+            Audio data as bytes
+
+        Raises:
+            RuntimeError: If the source is not started
+            Exception: The error that ended the input, when no ``on_error`` callback received it
+        """
+        if not self._is_recording:
+            raise RuntimeError(f"{self._name} is not started")
+
+        detached = self._attach()
+        ready = asyncio.Event()
+        self._async_waiter = (asyncio.get_running_loop(), ready)
+        try:
+            while self._is_recording and not detached.is_set():
+                if not len(self._buffer):
+                    if self._buffer.closed:
+                        self._raise_error()
+                        return
+                    ready.clear()
+                    # Re-check after clearing so a block, stop() or detach() racing with clear() isn't missed
+                    idle = not len(self._buffer) and not self._buffer.closed
+                    if idle and self._is_recording and not detached.is_set():
+                        await ready.wait()
+                    continue
+                view = self._buffer.read_view(timeout=0)
+                if view is not None:
+                    yield view.tobytes()
+        finally:
+            self._async_waiter = None
+
+    async def astream_to(
+        self,
+        connection: Any,
+        on_error: Callable[[Exception], None] | None = None,
+        vad: VadGate | None = None,
+        frame_ms: float | None = None,
+    ) -> None:
+        """
+        Stream audio data to an async connection (e.g., ``AsyncStreamConnection``).
+
+        Runs until the source is stopped or exhausted, or the connection is closed; wrap it in
+        ``asyncio.create_task`` to capture in the background.
+
+        Args:
+            connection: The connection object whose ``send`` coroutine receives the audio data
+            on_error: Optional callback for handling errors
+            vad: Optional client-side voice activity gate; only speech (plus its pre-roll,
+                hang-over and keep-alive blocks) is sent. Savings are reported in ``vad.stats``.
+            frame_ms: Optional frame duration in milliseconds; captured blocks are re-chunked
+                into frames of exactly this length before sending.
+
+        Raises:
+            RuntimeError: If the source is not started
+        """
+        self._on_error_callback = on_error
+        chunker = self._make_chunker(frame_ms)
+        async with aclosing(self.frames()) as frames:
+            async for audio_data in frames:
+                # Keep feeding a reconnecting connection so it can buffer the audio for replay
+                if not _is_open(connection):
+                    return
+                try:
+                    for chunk in self._outgoing_chunks(audio_data, chunker, vad):
+                        await connection.send(chunk)
+                except Exception as e:
+                    if on_error:
+                        on_error(e)
+                    else:
+                        raise
+
+        if _is_open(connection):
+            for chunk in self._flush_chunks(chunker, vad):
+                await connection.send(chunk)
+
+    def _make_chunker(self, frame_ms: float | None) -> FrameChunker | None:
+        if frame_ms is None:
+            return None
+        return FrameChunker(
+            frame_ms,
+            sample_rate=self.samplerate,
+            sample_width=np.dtype(self.dtype).itemsize,
+            channels=self.channels,
+        )
+
+    @staticmethod
+    def _outgoing_chunks(block: Any, chunker: FrameChunker | None, vad: VadGate | None) -> list[bytes]:
+        """Turn a captured block into the byte chunks to send, after re-chunking and gating."""
+        frames = [bytes(block)] if chunker is None else [frame.tobytes() for frame in chunker.push(block)]
+        if vad is None:
+            return frames
+        return [chunk for frame in frames for chunk in vad.process(frame)]
+
+    @staticmethod
+    def _flush_chunks(chunker: FrameChunker | None, vad: VadGate | None) -> list[bytes]:
+        tail = chunker.flush() if chunker is not None else b""
+        if not tail:
+            return []
+        return [tail] if vad is None else vad.process(tail)
+
+    def stream_with_callback(
+        self,
+        callback: Callable[[bytes], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """
+        Stream audio data to a callback function.
+
+        Args:
+            callback: Function to call with audio data
+            on_error: Optional callback for handling errors
+
+        Raises:
+            RuntimeError: If the source is not started
+        """
+        if not self._is_recording:
+            raise RuntimeError(f"{self._name} is not started")
+
+        self._on_audio_callback = callback
+        self._on_error_callback = on_error
+        detached = self._attach()
+
+        def _stream_worker():
+            try:
+                while self._is_recording and not detached.is_set():
+                    try:
+                        view = self._buffer.read_view()
+                        if view is None:
+                            self._raise_error()
+                            break
+                        if self._on_audio_callback:
+                            self._on_audio_callback(view.tobytes())
+                    except Exception as e:
+                        if self._on_error_callback:
+                            self._on_error_callback(e)
+                        else:
+                            raise
+            except Exception as e:
+                if self._on_error_callback:
+                    self._on_error_callback(e)
+                else:
+                    raise
+
+        self._thread = threading.Thread(target=_stream_worker, daemon=True)
+        self._thread.start()
+
+    @property
+    def is_recording(self) -> bool:
+        """Check if the source is currently producing audio."""
+        return self._is_recording
+
+    @property
+    def lag_ms(self) -> float:
+        """Duration of captured audio that has not been read yet, in milliseconds."""
+        return self._buffer.buffered_frames * 1000 / self.samplerate
+
+    @property
+    def overflows(self) -> int:
+        """Number of blocks dropped because the consumer fell more than ``max_buffer_ms`` behind."""
+        return self._buffer.overflows
+
+    @property
+    def underflows(self) -> int:
+        """Number of reads that found no audio waiting and had to wait for capture, or timed out.
+
+        A consumer that keeps up with a live source waits about once per block; a count that
+        stops growing while ``lag_ms`` rises means the consumer is the bottleneck.
+        """
+        return self._buffer.underflows
@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import IO, TYPE_CHECKING, Any
+
+from ..errors import AiolaError, AiolaFileError
+from .files import MappedAudioFile
+from .source import MAX_BUFFER_MS, AudioSource
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .meter import LevelMeter
+
+# Block length used when a source is not given an explicit block size
+DEFAULT_BLOCK_MS = 20
+
+_SAMPLE_DTYPES = {1: "uint8", 2: "int16", 4: "int32"}
+# Lines of ffmpeg's stderr kept for the error message when it fails
+_STDERR_TAIL_LINES = 20
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for audio sources. Install it with: pip install 'aiola[audio]'")
+
+
+def _block_frames(blocksize: int | None, samplerate: int) -> int:
+    return blocksize or max(1, round(samplerate * DEFAULT_BLOCK_MS / 1000))
+
+
+class _ThreadedSource(AudioSource):
+    """Source whose audio is produced by a background thread running :meth:`_produce`.
+
+    With ``realtime`` the producer is paced at the audio's own rate, like a live device, and a
+    slow consumer loses the oldest audio. Without it the producer runs as fast as the consumer
+    reads, pausing while the buffer is full, which is what benchmarks and batch jobs want.
+    """
+
+    # Whether stop() waits for the producer thread; sources blocked on foreign input can't be joined,
+    # so the next run's producer waits for the old one instead and delivers the block it read
+    _join_producer = True
+    # Whether the input arrives at its own rate, so the source never sleeps between blocks
+    _paces_itself = False
+
+    def __init__(self, *, realtime: bool, **kwargs: Any) -> None:
+        _require_numpy()
+        super().__init__(**kwargs)
+        self.realtime = realtime
+        self._producer: threading.Thread | None = None
+        self._stopped = threading.Event()
+        # Input read by a producer after its run was stopped, delivered first by the next run
+        self._unread = b""
+
+    def _open(self) -> None:
+        # A fresh event per run, so a producer left over from an earlier run can't feed this one
+        previous = self._producer
+        self._stopped = stopped = threading.Event()
+        self._producer = threading.Thread(target=self._run, args=(stopped, previous), daemon=True)
+        self._producer.start()
+
+    def _close(self) -> None:
+        self._stopped.set()
+        if self._join_producer:
+            if self._producer and self._producer.is_alive():
+                self._producer.join()
+            self._producer = None
+
+    def _run(self, stopped: threading.Event, previous: threading.Thread | None) -> None:
+        try:
+            if previous is not None:
+                # One reader at a time: wait until the last run's blocked read returns
+                previous.join()
+            self._produce(stopped)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            if not stopped.is_set():
+                self._end()
+
+    @abstractmethod
+    def _produce(self, stopped: threading.Event) -> None:
+        """Deliver blocks through :meth:`_pacer` until the input ends or *stopped* is set."""
+
+    def _pacer(self, stopped: threading.Event) -> Callable[[Any], bool]:
+        """Return a function that delivers one block and reports whether to keep going."""
+        next_time = time.monotonic()
+
+        def push(block: Any) -> bool:
+            nonlocal next_time
+            if stopped.is_set():
+                return False
+            if self.realtime and not self._paces_itself:
+                next_time += len(block) / self.samplerate
+                delay = next_time - time.monotonic()
+                # Sleep on the event so stop() interrupts the wait
+                if delay > 0 and stopped.wait(delay):
+                    return False
+            elif not self._buffer.wait_for_space():
+                return False
+            self._deliver(block)
+            return True
+
+        return push
+
+    def _read_blocks(self, stream: IO[bytes], stopped: threading.Event) -> None:
+        """Deliver raw PCM from a binary stream until EOF, in blocks of ``blocksize`` frames."""
+        frame_bytes = np.dtype(self.dtype).itemsize * self.channels
+        push = self._pacer(stopped)
+        data, self._unread = self._unread, b""
+        while not stopped.is_set():
+            usable = len(data) - len(data) % frame_bytes
+            if not usable:
+                # Pipes may return short reads; keep a partial frame until the rest arrives
+                chunk = stream.read(self.blocksize * frame_bytes)
+                if not chunk:
+                    return
+                data += chunk
+                continue
+            if not push(np.frombuffer(data[:usable], dtype=self.dtype).reshape(-1, self.channels)):
+                break
+            data = data[usable:]
+        if not self._join_producer:
+            # Stopped with input read but not delivered; the input outlives the run, so keep it
+            self._unread = data
+
+
+class FileSource(_ThreadedSource):
+    """
+    Streams a WAV or raw PCM file as if it were captured live.
+
+    WAV files describe their own format; raw PCM files use ``samplerate``, ``channels`` and
+    ``sample_width``. The file is memory-mapped, so blocks are read without copying.
+    """
+
+    _name = "File source"
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        samplerate: int = 16000,
+        channels: int = 1,
+        sample_width: int = 2,
+        blocksize: int | None = None,
+        realtime: bool = True,
+        loop: bool = False,
+        max_buffer_ms: float = MAX_BUFFER_MS,
+        meter: LevelMeter | None = None,
+    ):
+        """
+        Initialize the file source.
+
+        Args:
+            path: Path of the WAV or raw PCM file
+            samplerate: Sample rate in Hz of raw PCM input (default: 16000)
+            channels: Number of channels of raw PCM input (default: 1)
+            sample_width: Bytes per sample of raw PCM input (default: 2)
+            blocksize: Number of frames per block (default: 20 ms of audio)
+            realtime: Deliver audio at its own rate (default: True); otherwise as fast as it is read
+            loop: Start over at the end of the file instead of finishing (default: False)
+            max_buffer_ms: Most unread audio to keep, in milliseconds (default: 2000)
+            meter: Optional level meter updated with every block
+
+        Raises:
+            AiolaFileError: If the file can't be read or its sample format is unsupported
+        """
+        with MappedAudioFile(path, sample_rate=samplerate, sample_width=sample_width, channels=channels) as audio:
+            samplerate, channels, sample_width = audio.sample_rate, audio.channels, audio.sample_width
+        if sample_width not in _SAMPLE_DTYPES:
+            raise AiolaFileError(f"Unsupported sample width: {sample_width} bytes")
+
+        super().__init__(
+            realtime=realtime,
+            channels=channels,
+            samplerate=samplerate,
+            blocksize=_block_frames(blocksize, samplerate),
+            dtype=_SAMPLE_DTYPES[sample_width],
+            max_buffer_ms=max_buffer_ms,
+            meter=meter,
+        )
+        self.path = path
+        self.sample_width = sample_width
+        self.loop = loop
+
+    def _produce(self, stopped: threading.Event) -> None:
+        push = self._pacer(stopped)
+        with MappedAudioFile(
+            self.path, sample_rate=self.samplerate, sample_width=self.sample_width, channels=self.channels
+        ) as audio:
+            usable = len(audio.data) - len(audio.data) % audio.block_align
+            samples = np.frombuffer(audio.data[:usable], dtype=self.dtype).reshape(-1, self.channels)
+            try:
+                while True:
+                    for start in range(0, len(samples), self.blocksize):
+                        if not push(samples[start : start + self.blocksize]):
+                            return
+                    if not self.loop or not len(samples):
+                        return
+            finally:
+                # Release the view before the mapping is closed
+                del samples
+
+
+class PipeSource(_ThreadedSource):
+    """
+    Streams raw PCM read from a binary pipe, e.g. ``arecord -f S16_LE | python app.py``.
+
+    Reading pauses while the buffer is full, so the writer is throttled by the consumer rather
+    than losing audio. The stream is not closed by :meth:`stop`, and a block read after it is
+    delivered when the source is started again.
+    """
+
+    _name = "Pipe source"
+    # A read blocked on the pipe can't be interrupted; the thread exits after its next read
+    _join_producer = False
+    _paces_itself = True
+
+    def __init__(
+        self,
+        stream: IO[bytes] | None = None,
+        *,
+        samplerate: int = 16000,
+        channels: int = 1,
+        dtype: str = "int16",
+        blocksize: int | None = None,
+        max_buffer_ms: float = MAX_BUFFER_MS,
+        meter: LevelMeter | None = None,
+    ):
+        """
+        Initialize the pipe source.
+
+        Args:
+            stream: Binary stream to read from (default: standard input)
+            samplerate: Sample rate in Hz (default: 16000)
+            channels: Number of audio channels (default: 1)
+            dtype: Sample data type (default: "int16")
+            blocksize: Number of frames per block (default: 20 ms of audio)
+            max_buffer_ms: Most unread audio to keep, in milliseconds (default: 2000)
+            meter: Optional level meter updated with every block
+        """
+        super().__init__(
+            realtime=False,
+            channels=channels,
+            samplerate=samplerate,
+            blocksize=_block_frames(blocksize, samplerate),
+            dtype=dtype,
+            max_buffer_ms=max_buffer_ms,
+            meter=meter,
+        )
+        self.stream = stream if stream is not None else sys.stdin.buffer
+
+    def _produce(self, stopped: threading.Event) -> None:
+        self._read_blocks(self.stream, stopped)
+
+
+class FfmpegSource(_ThreadedSource):
+    """
+    Decodes any input ffmpeg understands (files, URLs, devices) to PCM in a subprocess.
+
+    Requires an ``ffmpeg`` executable. The subprocess is terminated by :meth:`stop`.
+    """
+
+    _name = "ffmpeg source"
+    # With realtime, ffmpeg reads the input at its native rate (-re) and does the pacing
+    _paces_itself = True
+
+    def __init__(
+        self,
+        input: str,
+        *,
+        samplerate: int = 16000,
+        channels: int = 1,
+        blocksize: int | None = None,
+        realtime: bool = True,
+        input_args: Sequence[str] = (),
+        ffmpeg: str = "ffmpeg",
+        max_buffer_ms: float = MAX_BUFFER_MS,
+        meter: LevelMeter | None = None,
+    ):
+        """
+        Initialize the ffmpeg source.
+
+        Args:
+            input: Anything ffmpeg accepts after ``-i``
+            samplerate: Sample rate in Hz to resample to (default: 16000)
+            channels: Number of channels to mix to (default: 1)
+            blocksize: Number of frames per block (default: 20 ms of audio)
+            realtime: Let ffmpeg read the input at its native rate (``-re``, default: True)
+            input_args: Extra ffmpeg options placed before ``-i``, e.g. ``("-f", "pulse")``
+            ffmpeg: Name or path of the ffmpeg executable (default: "ffmpeg")
+            max_buffer_ms: Most unread audio to keep, in milliseconds (default: 2000)
+            meter: Optional level meter updated with every block
+        """
+        super().__init__(
+            realtime=realtime,
+            channels=channels,
+            samplerate=samplerate,
+            blocksize=_block_frames(blocksize, samplerate),
+            dtype="int16",
+            max_buffer_ms=max_buffer_ms,
+            meter=meter,
+        )
+        self.input = input
+        self.input_args = tuple(input_args)
+        self.ffmpeg = ffmpeg
+        self._process: subprocess.Popen[bytes] | None = None
+        self._stderr_reader: threading.Thread | None = None
+        # Last lines ffmpeg wrote to stderr, for the error message if it fails
+        self._stderr_tail: deque[bytes] = deque(maxlen=_STDERR_TAIL_LINES)
+
+    @property
+    def command(self) -> list[str]:
+        """The ffmpeg command line used to decode the input."""
+        return [
+            self.ffmpeg,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            *(["-re"] if self.realtime else []),
+            *self.input_args,
+            "-i",
+            self.input,
+            "-vn",
+            "-f",
+            "s16le",
+            "-acodec",
+            "pcm_s16le",
+            "-ac",
+            str(self.channels),
+            "-ar",
+            str(self.samplerate),
+            "pipe:1",
+        ]
+
+    def _open(self) -> None:
+        try:
+            self._process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except FileNotFoundError as exc:
+            raise AiolaError(f"ffmpeg executable not found: {self.ffmpeg}") from exc
+        # Drain stderr as it is written, so a chatty ffmpeg never blocks on a full pipe
+        self._stderr_tail = tail = deque(maxlen=_STDERR_TAIL_LINES)
+        self._stderr_reader = threading.Thread(target=tail.extend, args=(self._process.stderr,), daemon=True)
+        self._stderr_reader.start()
+        super()._open()
+
+    def _close(self) -> None:
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.terminate()
+        super()._close()
+        if process is not None:
+            process.wait()
+            self._stderr_reader.join()
+            process.stdout.close()
+            process.stderr.close()
+
+    def _produce(self, stopped: threading.Event) -> None:
+        process, stderr_reader = self._process, self._stderr_reader
+        self._read_blocks(process.stdout, stopped)
+        if not stopped.is_set() and process.wait() != 0:
+            stderr_reader.join()
+            message = b"".join(self._stderr_tail).decode(errors="replace").strip()
+            raise AiolaFileError(f"ffmpeg failed to decode {self.input}: {message}")
+
+
+class ToneSource(_ThreadedSource):
+    """
+    Generates a sine tone, for load tests and benchmarks that need no input at all.
+    """
+
+    _name = "Tone source"
+
+    def __init__(
+        self,
+        frequency: float = 440.0,
+        *,
+        samplerate: int = 16000,
+        channels: int = 1,
+        dtype: str = "int16",
+        amplitude: float = 0.5,
+        duration: float | None = None,
+        blocksize: int | None = None,
+        realtime: bool = True,
+        max_buffer_ms: float = MAX_BUFFER_MS,
+        meter: LevelMeter | None = None,
+    ):
+        """
+        Initialize the tone source.
+
+        Args:
+            frequency: Tone frequency in Hz (default: 440)
+            samplerate: Sample rate in Hz (default: 16000)
+            channels: Number of audio channels; all carry the same tone (default: 1)
+            dtype: Sample data type (default: "int16")
+            amplitude: Peak level relative to full scale, 0 to 1 (default: 0.5)
+            duration: Length of the tone in seconds (default: None for endless)
+            blocksize: Number of frames per block (default: 20 ms of audio)
+            realtime: Deliver audio at its own rate (default: True); otherwise as fast as it is read
+            max_buffer_ms: Most unread audio to keep, in milliseconds (default: 2000)
+            meter: Optional level meter updated with every block
+        """
+        super().__init__(
+            realtime=realtime,
+            channels=channels,
+            samplerate=samplerate,
+            blocksize=_block_frames(blocksize, samplerate),
+            dtype=dtype,
+            max_buffer_ms=max_buffer_ms,
+            meter=meter,
+        )
+        if dtype not in ("int16", "int32", "float32"):
+            raise ValueError(f"Unsupported dtype {dtype!r}; expected int16, int32 or float32")
+        if not 0 <= amplitude <= 1:
+            raise ValueError("amplitude must be between 0 and 1")
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.duration = duration
+
+    def _produce(self, stopped: threading.Event) -> None:
+        push = self._pacer(stopped)
+        kind = np.dtype(self.dtype)
+        scale = self.amplitude * (np.iinfo(kind).max if kind.kind == "i" else 1.0)
+        step = 2 * math.pi * self.frequency / self.samplerate
+        total = None if self.duration is None else round(self.duration * self.samplerate)
+        offsets = np.arange(self.blocksize)
+        block = np.empty((self.blocksize, 1), dtype=np.float64)
+        position = 0
+
+        while total is None or position < total:
+            frames = self.blocksize if total is None else min(self.blocksize, total - position)
+            # Reuse one buffer; the ring copies and converts it, broadcasting to every channel
+            np.multiply(offsets[:frames, None] + position, step, out=block[:frames])
+            np.sin(block[:frames], out=block[:frames])
+            block[:frames] *= scale
+            if not push(block[:frames]):
+                return
+            position += frames
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .decode import PcmDecoder
+from .g711 import g711_encode
+from .resample import Resampler
+from .wav import WAVE_FORMAT_ALAW, WAVE_FORMAT_MULAW, WAVE_FORMAT_PCM, WavStreamParser
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Sample rate of G.711 telephony audio
+TELEPHONY_SAMPLE_RATE = 8000
+
+# Encodings of headerless audio: format tag and bytes per sample
+_ENCODINGS = {
+    "pcm16": (WAVE_FORMAT_PCM, 2),
+    "mulaw": (WAVE_FORMAT_MULAW, 1),
+    "alaw": (WAVE_FORMAT_ALAW, 1),
+}
+
+
+class AudioTranscoder:
+    """Converts a stream of audio chunks to another sample rate and encoding, e.g. for telephony.
+
+    The input is WAV, whose header gives its format, or headerless audio in ``input_encoding``
+    at ``input_sample_rate`` (default: the output rate). It is decoded, mixed down to mono,
+    resampled with a :class:`Resampler` when the rates differ, and encoded as headerless
+    ``encoding``: ``"pcm16"``, ``"mulaw"`` or ``"alaw"``. Every step works on whole chunks in
+    NumPy, and samples split across chunks are carried over.
+
+    Turn TTS output into 8 kHz G.711 for a SIP gateway with the defaults, or decode G.711 from a
+    call into 16 kHz PCM for :meth:`StreamConnection.send` with
+    ``AudioTranscoder("pcm16", sample_rate=16000, input_encoding="mulaw", input_sample_rate=8000)``.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "mulaw",
+        *,
+        sample_rate: int = TELEPHONY_SAMPLE_RATE,
+        input_encoding: str = "pcm16",
+        input_sample_rate: int | None = None,
+        input_channels: int = 1,
+    ) -> None:
+        if np is None:
+            raise ImportError("numpy is required for transcoding. Install it with: pip install 'aiola[audio]'")
+        for name in (encoding, input_encoding):
+            if name not in _ENCODINGS:
+                raise ValueError(f"Unsupported encoding {name!r}; expected one of {list(_ENCODINGS)}")
+        if sample_rate <= 0 or input_channels <= 0 or (input_sample_rate is not None and input_sample_rate <= 0):
+            raise ValueError("sample_rate, input_sample_rate and input_channels must be positive")
+
+        self.encoding = encoding
+        self.sample_rate = sample_rate
+        self._input = (input_encoding, input_sample_rate or sample_rate, input_channels)
+        self._parser = WavStreamParser()
+        self._decoder: PcmDecoder | None = None
+        self._resampler: Resampler | None = None
+        self._block_align = 0
+        self._carry = b""
+
+    def _start(self) -> None:
+        info = self._parser.info
+        if info is not None:
+            self._decoder = PcmDecoder.from_wav_info(info, "float32")
+            input_rate = info.sample_rate
+        else:
+            input_encoding, input_rate, channels = self._input
+            format_tag, sample_width = _ENCODINGS[input_encoding]
+            self._decoder = PcmDecoder(
+                sample_width=sample_width, channels=channels, format_tag=format_tag, dtype="float32"
+            )
+        self._block_align = self._decoder.sample_width * self._decoder.channels
+        if input_rate != self.sample_rate:
+            self._resampler = Resampler(input_rate, self.sample_rate)
+
+    def _encode(self, samples: np.ndarray) -> bytes:
+        pcm = np.clip(np.rint(samples.reshape(-1) * 32768.0), -32768, 32767).astype("<i2")
+        return pcm.tobytes() if self.encoding == "pcm16" else g711_encode(pcm, self.encoding)
+
+    def _convert(self, payload: Any) -> bytes:
+        if self._decoder is None:
+            self._start()
+        assert self._decoder is not None
+        if self._carry:
+            payload = self._carry + payload
+        end = len(payload) - len(payload) % self._block_align
+        self._carry = bytes(payload[end:])
+        samples = self._decoder.decode(payload[:end])
+        if samples.shape[1] > 1:
+            samples = samples.mean(axis=1, keepdims=True)
+        if self._resampler is not None:
+            samples = self._resampler.push(samples)
+        return self._encode(samples)
+
+    def push(self, chunk: bytes | bytearray | memoryview) -> bytes:
+        """Add a chunk of input and return the output it completes (possibly none)."""
+        payload = self._parser.push(chunk)
+        return self._convert(payload) if len(payload) else b""
+
+    def flush(self) -> bytes:
+        """Return the rest of the output at the end of the input."""
+        tail = self._parser.flush()
+        output = self._convert(tail) if len(tail) else b""
+        if self._resampler is not None:
+            output += self._encode(self._resampler.flush())
+        return output
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_FULL_SCALE = {"int16": 32768.0, "int32": 2147483648.0, "float32": 1.0}
+
+
+@dataclass
+class VadGateStats:
+    """Byte counters of a :class:`VadGate`."""
+
+    bytes_in: int = 0
+    bytes_sent: int = 0
+    keepalive_bytes: int = 0
+    speech_segments: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_sent
+
+    @property
+    def saved_ratio(self) -> float:
+        return self.bytes_saved / self.bytes_in if self.bytes_in else 0.0
+
+
+class VadGate:
+    """Client-side energy gate that only lets speech through to the stream.
+
+    Each incoming block is split into ``frame_ms`` analysis frames whose RMS level is computed in
+    one vectorized pass; the block counts as speech when any frame exceeds ``threshold_db``
+    (dBFS). Blocks preceding speech onset are kept in a ``preroll_ms`` buffer and sent first, and
+    sending continues for ``hangover_ms`` after the last speech block so word endings survive.
+    While the gate is closed, one block is let through every ``keepalive_ms`` so the server
+    session stays alive (``None`` disables the trickle).
+
+    Durations are measured in audio time, so the gate behaves the same for live and file input.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 16000,
+        channels: int = 1,
+        dtype: str = "int16",
+        threshold_db: float = -45.0,
+        frame_ms: float = 10,
+        preroll_ms: float = 300,
+        hangover_ms: float = 500,
+        keepalive_ms: float | None = 1000,
+    ) -> None:
+        if np is None:
+            raise ImportError(
+                "numpy is required for voice activity gating. Install it with: pip install 'aiola[audio]'"
+            )
+        if dtype not in _FULL_SCALE:
+            raise ValueError(f"Unsupported dtype {dtype!r}; expected one of {sorted(_FULL_SCALE)}")
+        if sample_rate <= 0 or channels <= 0 or frame_ms <= 0:
+            raise ValueError("sample_rate, channels and frame_ms must be positive")
+
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self.threshold_db = threshold_db
+        self.preroll_ms = preroll_ms
+        self.hangover_ms = hangover_ms
+        self.keepalive_ms = keepalive_ms
+        self.stats = VadGateStats()
+
+        self._frame_samples = max(1, round(sample_rate * frame_ms / 1000)) * channels
+        # Compare mean squares (energy) against a precomputed linear threshold instead of taking logs
+        self._energy_threshold = (_FULL_SCALE[dtype] * 10 ** (threshold_db / 20)) ** 2
+        self._bytes_per_ms = sample_rate * channels * self.dtype.itemsize / 1000
+        self._preroll: deque[bytes] = deque()
+        self._preroll_bytes = 0
+        self._hangover_left_ms = 0.0
+        self._since_keepalive_ms = 0.0
+        self._open = False
+
+    @property
+    def is_open(self) -> bool:
+        """``True`` while speech (or its hang-over) is being passed through."""
+        return self._open
+
+    def is_speech(self, chunk: bytes | bytearray | memoryview) -> bool:
+        """Return ``True`` if any analysis frame of *chunk* is above the threshold."""
+        samples = np.frombuffer(chunk, dtype=self.dtype)
+        if samples.size == 0:
+            return False
+        usable = samples.size - samples.size % self._frame_samples
+        if usable:
+            frames = samples[:usable].reshape(-1, self._frame_samples).astype(np.float32)
+            if float(np.einsum("ij,ij->i", frames, frames).max()) / self._frame_samples > self._energy_threshold:
+                return True
+        tail = samples[usable:].astype(np.float32)
+        return bool(tail.size) and float(np.dot(tail, tail)) / tail.size > self._energy_threshold
+
+    def process(self, chunk: bytes) -> list[bytes]:
+        """Feed one block of audio and return the blocks that should be sent, in order."""
+        duration_ms = len(chunk) / self._bytes_per_ms
+        self.stats.bytes_in += len(chunk)
+
+        if self.is_speech(chunk):
+            out = []
+            if not self._open:
+                self._open = True
+                self.stats.speech_segments += 1
+                out.extend(self._preroll)
+                self._preroll.clear()
+                self._preroll_bytes = 0
+            out.append(chunk)
+            self._hangover_left_ms = self.hangover_ms
+            return self._sent(out)
+
+        if self._open and self._hangover_left_ms > 0:
+            self._hangover_left_ms -= duration_ms
+            return self._sent([chunk])
+
+        self._open = False
+        if self.keepalive_ms is not None:
+            self._since_keepalive_ms += duration_ms
+            if self._since_keepalive_ms >= self.keepalive_ms:
+                self._since_keepalive_ms = 0.0
+                self.stats.keepalive_bytes += len(chunk)
+                # Audio older than the keep-alive must not be sent after it at the next onset
+                self._preroll.clear()
+                self._preroll_bytes = 0
+                return self._sent([chunk])
+
+        self._remember(chunk)
+        return []
+
+    def _remember(self, chunk: bytes) -> None:
+        if self.preroll_ms <= 0:
+            return
+        self._preroll.append(chunk)
+        self._preroll_bytes += len(chunk)
+        limit = self.preroll_ms * self._bytes_per_ms
+        while self._preroll_bytes - len(self._preroll[0]) >= limit:
+            self._preroll_bytes -= len(self._preroll.popleft())
+
+    def _sent(self, chunks: list[bytes]) -> list[bytes]:
+        self._since_keepalive_ms = 0.0
+        self.stats.bytes_sent += sum(len(chunk) for chunk in chunks)
+        return chunks
+
+    def reset(self) -> None:
+        """Close the gate and forget buffered audio (counters are kept)."""
+        self._preroll.clear()
+        self._preroll_bytes = 0
+        self._hangover_left_ms = 0.0
+        self._since_keepalive_ms = 0.0
+        self._open = False
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+
+from ..errors import AiolaFileError
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_ALAW = 0x0006
+WAVE_FORMAT_MULAW = 0x0007
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Size placeholder used by streaming writers that don't know the final length
+UNKNOWN_SIZE = 0xFFFFFFFF
+
+
+@dataclass
+class WavInfo:
+    """Format and payload location of a RIFF/WAVE container."""
+
+    format_tag: int
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+    block_align: int
+    data_offset: int
+    data_size: int | None  # None when the header doesn't state a usable length
+
+    @property
+    def sample_width(self) -> int:
+        return self.bits_per_sample // 8
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self.sample_rate * self.block_align
+
+
+def is_wav(buffer: bytes | bytearray | memoryview) -> bool:
+    """Return ``True`` if *buffer* starts with a RIFF/WAVE header."""
+    return len(buffer) >= 12 and bytes(buffer[0:4]) == b"RIFF" and bytes(buffer[8:12]) == b"WAVE"
+
+
+def parse_wav_header(buffer: bytes | bytearray | memoryview) -> WavInfo:
+    """Parse the header of a WAV file held in *buffer* (bytes, mmap or memoryview).
+
+    Only the header is inspected; the audio payload is located but not copied.
+
+    Raises:
+        AiolaFileError: If the buffer is not a WAV file or its header is incomplete
+    """
+    view = memoryview(buffer)
+    if not is_wav(view):
+        raise AiolaFileError("Not a RIFF/WAVE file")
+
+    fmt: tuple[int, int, int, int, int] | None = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset : offset + 4])
+        (chunk_size,) = struct.unpack_from("<I", view, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or body + 16 > len(view):
+                raise AiolaFileError("Truncated WAV fmt chunk")
+            format_tag, channels, sample_rate, _, block_align, bits = struct.unpack_from("<HHIIHH", view, body)
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40 and body + 26 <= len(view):
+                (format_tag,) = struct.unpack_from("<H", view, body + 24)
+            fmt = (format_tag, channels, sample_rate, block_align, bits)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise AiolaFileError("WAV data chunk precedes fmt chunk")
+            format_tag, channels, sample_rate, block_align, bits = fmt
+            if channels <= 0 or sample_rate <= 0 or block_align <= 0:
+                raise AiolaFileError("Invalid WAV format values")
+            data_size: int | None = chunk_size
+            if chunk_size in (0, UNKNOWN_SIZE):
+                data_size = None
+            return WavInfo(
+                format_tag=format_tag,
+                channels=channels,
+                sample_rate=sample_rate,
+                bits_per_sample=bits,
+                block_align=block_align,
+                data_offset=body,
+                data_size=data_size,
+            )
+        offset = body + chunk_size + (chunk_size & 1)  # Chunks are word aligned
+
+    raise AiolaFileError("WAV header has no data chunk")
+
+
+class WavStreamParser:
+    """Separates the header of a WAV stream that arrives in chunks from its audio payload.
+
+    :meth:`push` holds chunks back until the header is complete, then returns the payload
+    bytes they contain; later chunks are returned as views of themselves, without a copy. A
+    stream that doesn't start with a RIFF/WAVE header is passed through unchanged and
+    :attr:`info` stays ``None``. Bytes after a data chunk of known length are dropped.
+    """
+
+    def __init__(self, max_header_bytes: int = 65536) -> None:
+        self.max_header_bytes = max_header_bytes
+        self.info: WavInfo | None = None
+        self._head: bytearray | None = bytearray()
+        self._remaining: int | None = None
+
+    @property
+    def header_done(self) -> bool:
+        """``True`` once the header was parsed or the stream turned out not to be WAV."""
+        return self._head is None
+
+    def push(self, chunk: bytes | bytearray | memoryview) -> memoryview:
+        """Add a chunk and return the payload bytes it completes (possibly none)."""
+        if self._head is None:
+            return self._limit(memoryview(chunk).cast("B"))
+
+        self._head += chunk
+        if len(self._head) < 12:
+            return memoryview(b"")
+        head, self._head = self._head, None
+        if not is_wav(head):
+            return memoryview(head)
+        try:
+            info = parse_wav_header(head)
+        except AiolaFileError:
+            if len(head) > self.max_header_bytes:
+                raise
+            self._head = head
+            return memoryview(b"")
+        self.info = info
+        self._remaining = info.data_size
+        return self._limit(memoryview(head)[info.data_offset :])
+
+    def _limit(self, view: memoryview) -> memoryview:
+        if self._remaining is None:
+            return view
+        view = view[: self._remaining]
+        self._remaining -= len(view)
+        return view
+
+    def flush(self) -> memoryview:
+        """Return bytes still held back at the end of the stream: a stream too short to be WAV."""
+        head, self._head = self._head, None
+        if head is None or is_wav(head):
+            return memoryview(b"")
+        return memoryview(head)
+
+
+def wav_header(
+    *,
+    sample_rate: int,
+    channels: int = 1,
+    sample_width: int = 2,
+    format_tag: int = WAVE_FORMAT_PCM,
+    data_size: int | None = None,
+) -> bytes:
+    """Return a canonical 44-byte WAV header for a payload of ``data_size`` bytes.
+
+    Without a ``data_size`` both sizes are :data:`UNKNOWN_SIZE`, as streaming writers do.
+    """
+    if sample_rate <= 0 or channels <= 0 or sample_width <= 0:
+        raise ValueError("sample_rate, channels and sample_width must be positive")
+    block_align = channels * sample_width
+    if data_size is None:
+        riff_size = data_size = UNKNOWN_SIZE
+    else:
+        riff_size = 36 + data_size + (data_size & 1)
+    return (
+        struct.pack("<4sI4s", b"RIFF", riff_size, b"WAVE")
+        + struct.pack(
+            "<4sIHHIIHH",
+            b"fmt ",
+            16,
+            format_tag,
+            channels,
+            sample_rate,
+            sample_rate * block_align,
+            block_align,
+            sample_width * 8,
+        )
+        + struct.pack("<4sI", b"data", data_size)
+    )
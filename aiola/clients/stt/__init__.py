@@ -1,5 +1,6 @@
-from ...types import TasksConfig, TranscriptionResponse
+from ...types import OverflowPolicy, ReplayConfig, StreamEvent, TasksConfig, TranscriptionResponse
 from .client import AsyncSttClient, SttClient
+from .events import AsyncEventStream, EventStream
 from .stream_client import AsyncStreamConnection, StreamConnection
 
 __all__ = [
@@ -8,5 +9,10 @@ __all__ = [
     "StreamConnection",
     "AsyncStreamConnection",
     "TasksConfig",
+    "ReplayConfig",
+    "EventStream",
+    "AsyncEventStream",
+    "StreamEvent",
+    "OverflowPolicy",
     "TranscriptionResponse",
 ]
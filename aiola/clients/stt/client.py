@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import uuid
+from concurrent.futures import Executor
 from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
@@ -17,7 +18,7 @@ from ...errors import (
     AiolaValidationError,
 )
 from ...http_client import create_async_authenticated_client, create_authenticated_client
-from ...types import AiolaClientOptions, File, TasksConfig, TranscriptionResponse, VadConfig
+from ...types import AiolaClientOptions, File, ReplayConfig, TasksConfig, TranscriptionResponse, VadConfig
 from .stream_client import AsyncStreamConnection, StreamConnection
 
 if TYPE_CHECKING:
@@ -109,6 +110,15 @@ class _BaseStt:
         if vad_config is not None and not isinstance(vad_config, dict | VadConfig):
             raise AiolaValidationError("vad_config must be a dictionary or a VadConfig object")
 
+    def _validate_connection_params(
+        self, replay_config: ReplayConfig | None, handler_executor: Executor | None
+    ) -> None:
+        """Validate client-side options of the stream connection."""
+        if replay_config is not None and not isinstance(replay_config, ReplayConfig):
+            raise AiolaValidationError("replay_config must be a ReplayConfig object")
+        if handler_executor is not None and not isinstance(handler_executor, Executor):
+            raise AiolaValidationError("handler_executor must be a concurrent.futures.Executor")
+
 
 class SttClient(_BaseStt):
     """STT client."""
@@ -126,6 +136,8 @@ class SttClient(_BaseStt):
         keywords: dict[str, str] | None = None,
         tasks_config: TasksConfig | None = None,
         vad_config: VadConfig | None = None,
+        replay_config: ReplayConfig | None = None,
+        handler_executor: Executor | None = None,
     ) -> StreamConnection:
         """Create a streaming connection for real-time transcription.
 
@@ -137,6 +149,9 @@ class SttClient(_BaseStt):
             time_zone: Time zone for timestamps (default: "UTC").
             keywords: Optional keywords dictionary for enhanced transcription.
             tasks_config: Optional configuration for additional AI tasks.
+            replay_config: Optional client-side audio replay across reconnects. Disabled by default.
+            handler_executor: Optional executor that runs event handlers off the socket receive thread.
+                        Handlers of one connection still run one at a time, in event order.
 
         Returns:
             StreamConnection: A connection object for real-time streaming.
@@ -145,6 +160,7 @@ class SttClient(_BaseStt):
             self._validate_stream_params(
                 workflow_id, execution_id, lang_code, time_zone, keywords, tasks_config, vad_config
             )
+            self._validate_connection_params(replay_config, handler_executor)
 
             # Resolve workflow_id with proper precedence
             resolved_workflow_id = self._resolve_workflow_id(workflow_id)
@@ -164,7 +180,13 @@ class SttClient(_BaseStt):
             url = self._build_url(query)
 
             return StreamConnection(
-                options=self._options, url=url, headers=headers, socketio_path=self._path, namespace=self._namespace
+                options=self._options,
+                url=url,
+                headers=headers,
+                socketio_path=self._path,
+                namespace=self._namespace,
+                replay_config=replay_config,
+                handler_executor=handler_executor,
             )
         except (AiolaError, AiolaValidationError):
             raise
@@ -244,6 +266,8 @@ class AsyncSttClient(_BaseStt):
         keywords: dict[str, str] | None = None,
         tasks_config: TasksConfig | None = None,
         vad_config: VadConfig | None = None,
+        replay_config: ReplayConfig | None = None,
+        handler_executor: Executor | None = None,
     ) -> AsyncStreamConnection:
         """Create an async streaming connection for real-time transcription.
 
@@ -255,6 +279,10 @@ class AsyncSttClient(_BaseStt):
             time_zone: Time zone for timestamps (default: "UTC").
             keywords: Optional keywords dictionary for enhanced transcription.
             tasks_config: Optional configuration for additional AI tasks.
+            replay_config: Optional client-side audio replay across reconnects. Disabled by default.
+            handler_executor: Optional executor for sync event handlers. When set, handlers run in a
+                        per-connection worker task instead of the socket receive task, one at a time
+                        and in event order.
 
         Returns:
             AsyncStreamConnection: A connection object for real-time async streaming.
@@ -263,6 +291,7 @@ class AsyncSttClient(_BaseStt):
             self._validate_stream_params(
                 workflow_id, execution_id, lang_code, time_zone, keywords, tasks_config, vad_config
             )
+            self._validate_connection_params(replay_config, handler_executor)
 
             # Resolve workflow_id with proper precedence
             resolved_workflow_id = self._resolve_workflow_id(workflow_id)
@@ -282,7 +311,13 @@ class AsyncSttClient(_BaseStt):
             url = self._build_url(query)
 
             return AsyncStreamConnection(
-                options=self._options, url=url, headers=headers, socketio_path=self._path, namespace=self._namespace
+                options=self._options,
+                url=url,
+                headers=headers,
+                socketio_path=self._path,
+                namespace=self._namespace,
+                replay_config=replay_config,
+                handler_executor=handler_executor,
             )
         except (AiolaError, AiolaValidationError):
             raise
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any
+
+from ...types import HandlerMetrics, LiveEvents
+
+logger = logging.getLogger(__name__)
+
+_Job = tuple[LiveEvents, Callable[..., Any], tuple, float]
+
+
+def _call_handler(event: LiveEvents, handler: Callable[..., Any], args: tuple) -> Any:
+    """Invoke a user handler, mirroring socketio's fallback for legacy disconnect handlers."""
+    try:
+        return handler(*args)
+    except TypeError:
+        # the legacy disconnect event does not take a reason argument
+        if event == LiveEvents.Disconnect and args:
+            return handler(*args[:-1])
+        raise
+
+
+class SerialHandlerDispatcher:
+    """Runs one connection's handlers on a shared executor, one at a time and in arrival order.
+
+    Only a single drain job per connection is in flight, so a slow handler delays later events of
+    the same stream but never blocks the socket receive thread or other streams on the executor.
+    """
+
+    def __init__(self, executor: Executor, metrics: HandlerMetrics) -> None:
+        self._executor = executor
+        self._metrics = metrics
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._jobs: deque[_Job] = deque()
+        self._running = False
+        self._drain_thread: threading.Thread | None = None
+
+    def submit(self, event: LiveEvents, handler: Callable[..., Any], args: tuple) -> None:
+        with self._lock:
+            self._jobs.append((event, handler, args, time.perf_counter()))
+            self._metrics.pending += 1
+            if self._running:
+                return
+            self._running = True
+        try:
+            self._executor.submit(self._drain)
+        except Exception:
+            with self._lock:
+                self._running = False
+            raise
+
+    def _drain(self) -> None:
+        self._drain_thread = threading.current_thread()
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    self._running = False
+                    self._drain_thread = None
+                    self._idle.notify_all()
+                    return
+                event, handler, args, enqueued_at = self._jobs.popleft()
+                self._metrics.pending -= 1
+            started = time.perf_counter()
+            try:
+                _call_handler(event, handler, args)
+            except Exception:
+                self._metrics.errors += 1
+                logger.exception("Event handler for '%s' raised", event.value)
+            finally:
+                self._metrics.record(time.perf_counter() - started, started - enqueued_at)
+
+    def close(self) -> None:
+        """Wait until the queued handlers have run, so none outlives the connection.
+
+        Called from one of the handlers, it returns at once instead of waiting for itself.
+        """
+        with self._lock:
+            if self._drain_thread is threading.current_thread():
+                return
+            self._idle.wait_for(lambda: not self._running)
+
+
+class AsyncSerialHandlerDispatcher:
+    """Runs one async connection's handlers in a worker task, one at a time and in arrival order.
+
+    Coroutine handlers are awaited in the worker task; plain functions run on *executor* so they
+    don't block the event loop.
+    """
+
+    def __init__(self, executor: Executor, metrics: HandlerMetrics) -> None:
+        self._executor = executor
+        self._metrics = metrics
+        self._jobs: asyncio.Queue[_Job | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def submit(self, event: LiveEvents, handler: Callable[..., Any], args: tuple) -> None:
+        if self._task is None or self._task.done():
+            self._jobs = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run(self._jobs))
+        self._jobs.put_nowait((event, handler, args, time.perf_counter()))
+        self._metrics.pending += 1
+
+    async def _run(self, jobs: asyncio.Queue[_Job | None]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await jobs.get()
+            if job is None:
+                return
+            event, handler, args, enqueued_at = job
+            self._metrics.pending -= 1
+            started = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    await _call_handler(event, handler, args)
+                else:
+                    result = await loop.run_in_executor(self._executor, _call_handler, event, handler, args)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception:
+                self._metrics.errors += 1
+                logger.exception("Event handler for '%s' raised", event.value)
+            finally:
+                self._metrics.record(time.perf_counter() - started, started - enqueued_at)
+
+    def close(self) -> None:
+        """Let the worker finish queued handlers, then stop."""
+        if self._task is not None and not self._task.done():
+            self._jobs.put_nowait(None)
+        self._task = None
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from ...errors import AiolaValidationError
+from ...types import LiveEvents, OverflowPolicy, StreamEvent
+
+DEFAULT_EVENT_QUEUE_SIZE = 256
+
+_END = object()  # Sentinel closing an event stream
+
+
+def _resolve_event_stream_params(
+    maxsize: int, overflow: OverflowPolicy | str, event_types: Iterable[LiveEvents] | None
+) -> tuple[OverflowPolicy, frozenset[LiveEvents]]:
+    if not isinstance(maxsize, int) or maxsize <= 0:
+        raise AiolaValidationError("maxsize must be a positive integer")
+    try:
+        policy = OverflowPolicy(overflow)
+    except ValueError as exc:
+        raise AiolaValidationError(f"Unknown overflow policy: {overflow!r}") from exc
+    types = frozenset(LiveEvents) if event_types is None else frozenset(event_types)
+    if not types or not all(isinstance(event, LiveEvents) for event in types):
+        raise AiolaValidationError("event_types must be a non-empty collection of LiveEvents")
+    return policy, types
+
+
+def _make_event(event: LiveEvents, args: tuple) -> StreamEvent:
+    if not args:
+        return StreamEvent(type=event)
+    return StreamEvent(type=event, data=args[0] if len(args) == 1 else args)
+
+
+class EventStream:
+    """Blocking iterator over the events of a :class:`StreamConnection`.
+
+    Events are queued by the socket receive thread and consumed with ``for event in stream``.
+    Iteration ends when the connection is disconnected or :meth:`close` is called.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: OverflowPolicy,
+        event_types: frozenset[LiveEvents],
+        on_close: Callable[[EventStream], None],
+    ) -> None:
+        self._events: deque[StreamEvent] = deque()
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._on_close = on_close
+        self._cond = threading.Condition()
+        self.event_types = event_types
+        self.dropped = 0
+        self._closed = False
+
+    def _publish(self, event: StreamEvent) -> None:
+        with self._cond:
+            if self._overflow == OverflowPolicy.Block:
+                self._cond.wait_for(lambda: self._closed or len(self._events) < self._maxsize)
+            if self._closed:
+                return
+            if len(self._events) >= self._maxsize:
+                self.dropped += 1
+                if self._overflow == OverflowPolicy.DropNewest:
+                    return
+                self._events.popleft()
+            self._events.append(event)
+            self._cond.notify_all()
+
+    def _finish(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def get(self, timeout: float | None = None) -> StreamEvent | None:
+        """Return the next event, or ``None`` once the stream has ended and is drained.
+
+        Raises:
+            queue.Empty: If timeout is reached
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._events or self._closed, timeout):
+                raise queue.Empty
+            if not self._events:
+                return None
+            event = self._events.popleft()
+            self._cond.notify_all()
+            return event
+
+    def close(self) -> None:
+        """Stop receiving events and end the iteration once queued events are consumed."""
+        self._on_close(self)
+        self._finish()
+
+    def __iter__(self) -> EventStream:
+        return self
+
+    def __next__(self) -> StreamEvent:
+        event = self.get()
+        if event is None:
+            raise StopIteration
+        return event
+
+    def __enter__(self) -> EventStream:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class AsyncEventStream:
+    """Async iterator over the events of an :class:`AsyncStreamConnection`.
+
+    Events are consumed with ``async for event in stream``. Iteration ends when the
+    connection is disconnected or :meth:`aclose` is called.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: OverflowPolicy,
+        event_types: frozenset[LiveEvents],
+        on_close: Callable[[AsyncEventStream], None],
+    ) -> None:
+        # The queue itself is unbounded so the end marker always fits; ``_slots`` enforces maxsize
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(maxsize)
+        self._overflow = overflow
+        self._on_close = on_close
+        self.event_types = event_types
+        self.dropped = 0
+        self._closed = False
+
+    async def _publish(self, event: StreamEvent) -> None:
+        if self._closed:
+            return
+        if self._overflow == OverflowPolicy.Block:
+            await self._slots.acquire()
+            if self._closed:
+                return
+        elif self._slots.locked():
+            self.dropped += 1
+            if self._overflow == OverflowPolicy.DropNewest:
+                return
+            self._queue.get_nowait()  # The new event takes over the oldest event's slot
+        else:
+            await self._slots.acquire()
+        self._queue.put_nowait(event)
+
+    def _finish(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._queue.put_nowait(_END)
+            self._slots.release()  # Wake a receive task blocked on a full queue
+
+    async def get(self) -> StreamEvent | None:
+        """Return the next event, or ``None`` once the stream has ended and is drained."""
+        item = await self._queue.get()
+        if item is _END:
+            self._queue.put_nowait(_END)  # Keep later calls returning None
+            return None
+        self._slots.release()
+        return item
+
+    async def aclose(self) -> None:
+        """Stop receiving events and end the iteration once queued events are consumed."""
+        self._on_close(self)
+        self._finish()
+
+    def __aiter__(self) -> AsyncEventStream:
+        return self
+
+    async def __anext__(self) -> StreamEvent:
+        event = await self.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    async def __aenter__(self) -> AsyncEventStream:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter, deque
+from typing import Any
+
+from ...types import ReplayConfig, ReplayStats
+
+# Transcript fields that place it in the audio, so a replayed transcript matches its original
+_POSITION_FIELDS = ("segment_id", "segment", "offset", "start", "end")
+
+
+class AudioReplayBuffer:
+    """Bounded history of sent audio plus audio queued while the socket is down.
+
+    The buffer is not thread-safe; callers serialize access with their own lock.
+    """
+
+    def __init__(self, config: ReplayConfig) -> None:
+        self._history_limit = int(config.history_ms * config.bytes_per_ms)
+        self._pending_limit = int(config.max_pending_ms * config.bytes_per_ms)
+        self._history: deque[bytes] = deque()
+        self._history_bytes = 0
+        self._pending: deque[bytes] = deque()
+        self._pending_bytes = 0
+        self.stats = ReplayStats()
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def record_sent(self, data: bytes) -> None:
+        """Remember audio that was handed to the socket."""
+        if self._history_limit <= 0:
+            return
+        self._history.append(data)
+        self._history_bytes += len(data)
+        while self._history_bytes > self._history_limit and len(self._history) > 1:
+            self._history_bytes -= len(self._history.popleft())
+
+    def buffer(self, data: bytes) -> None:
+        """Queue audio sent while disconnected, dropping the oldest audio past the limit."""
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        self.stats.buffered_bytes += len(data)
+        while self._pending_bytes > self._pending_limit and self._pending:
+            dropped = self._pending.popleft()
+            self._pending_bytes -= len(dropped)
+            self.stats.dropped_bytes += len(dropped)
+
+    def pending(self) -> list[bytes]:
+        """Return queued audio in send order, without removing it."""
+        return list(self._pending)
+
+    def replay(self) -> list[bytes]:
+        """Return the recent history followed by queued audio, for re-sending after a reconnect."""
+        return list(self._history) + list(self._pending)
+
+    def mark_replayed(self, chunks: list[bytes]) -> None:
+        """Record that *chunks*, from :meth:`replay` or :meth:`pending`, reached the socket.
+
+        Queued audio moves into the history. Until this is called nothing is removed, so a
+        replay interrupted by another drop is re-sent in full on the next reconnect.
+        """
+        self.stats.replayed_bytes += sum(len(chunk) for chunk in chunks)
+        for chunk in self._pending:
+            self.record_sent(chunk)
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    def clear(self) -> None:
+        self._history.clear()
+        self._history_bytes = 0
+        self._pending.clear()
+        self._pending_bytes = 0
+
+
+class TranscriptDeduplicator:
+    """Suppresses transcripts the server repeats after replayed audio.
+
+    Only transcripts received before the reconnect are candidates: each one can suppress a
+    single matching transcript during the replay window, so speech repeated after the
+    reconnect (two "yes" answers, say) is never suppressed against itself. Transcripts match
+    on their position in the audio (segment or offset fields) when the server sends one, and
+    otherwise on their normalized text.
+    """
+
+    def __init__(self, window_s: float, max_entries: int = 64) -> None:
+        self._window_s = window_s
+        self._recent: deque[tuple[float, tuple[Any, ...]]] = deque(maxlen=max_entries)
+        self._replayed: Counter[tuple[Any, ...]] = Counter()
+        self._armed_until = 0.0
+
+    @staticmethod
+    def _key(payload: Any) -> tuple[Any, ...]:
+        if isinstance(payload, dict) and "transcript" in payload:
+            text = " ".join(str(payload["transcript"]).split()).lower()
+            return (text, *(payload.get(field) for field in _POSITION_FIELDS))
+        try:
+            return (json.dumps(payload, sort_keys=True, default=str),)
+        except (TypeError, ValueError):
+            return (repr(payload),)
+
+    def arm(self) -> None:
+        """Start suppressing repeats of recent transcripts for ``window_s`` seconds (called after a replay)."""
+        now = time.monotonic()
+        self._armed_until = now + self._window_s
+        self._replayed = Counter(key for seen_at, key in self._recent if now - seen_at <= self._window_s)
+
+    def is_duplicate(self, payload: Any) -> bool:
+        """Return ``True`` if *payload* repeats a transcript received before the last reconnect."""
+        now = time.monotonic()
+        if now >= self._armed_until:
+            self._replayed.clear()
+        key = self._key(payload)
+        if self._replayed[key] > 0:
+            self._replayed[key] -= 1
+            return True
+        self._recent.append((now, key))
+        return False
+
+    def clear(self) -> None:
+        self._recent.clear()
+        self._replayed.clear()
+        self._armed_until = 0.0
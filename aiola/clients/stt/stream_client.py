@@ -1,14 +1,37 @@
-from collections.abc import Callable
+import asyncio
+import inspect
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
 from typing import Any
 
 import socketio
 
+from ...audio.files import MappedAudioFile
 from ...errors import AiolaError, AiolaStreamingError, AiolaValidationError
-from ...types import AiolaClientOptions, LiveEvents
+from ...types import AiolaClientOptions, HandlerMetrics, LiveEvents, OverflowPolicy, ReplayConfig, ReplayStats
+from .dispatch import AsyncSerialHandlerDispatcher, SerialHandlerDispatcher, _call_handler
+from .events import (
+    DEFAULT_EVENT_QUEUE_SIZE,
+    AsyncEventStream,
+    EventStream,
+    _make_event,
+    _resolve_event_stream_params,
+)
+from .replay import AudioReplayBuffer, TranscriptDeduplicator
 
+# Fired by python-socketio once it gives up reconnecting a namespace (also when the reconnect
+# task is aborted), in every release since 5.11, the oldest one the SDK supports
+_DISCONNECT_FINAL_EVENT = "__disconnect_final"
 
-class StreamConnection:
-    """Stream connection for the STT client."""
+
+class _BaseStreamConnection(ABC):
+    """State and handler bookkeeping shared by the sync and async stream connections."""
+
+    _sio: Any
 
     def __init__(
         self,
@@ -17,17 +40,207 @@ class StreamConnection:
         headers: dict[str, str],
         socketio_path: str,
         namespace: str = "/events",
+        replay_config: ReplayConfig | None = None,
     ):
         self._options = options
         self._url = url
         self._headers = headers
         self._socketio_path = socketio_path
         self._namespace = namespace
+        self._handlers: dict[LiveEvents, Callable[..., Any]] = {}
+        self._dispatched_events: set[LiveEvents] = set()
+        self._event_streams: list[Any] = []
+        self._session_active = False
+        self._handler_metrics = HandlerMetrics()
+
+        self._replay: AudioReplayBuffer | None = None
+        self._dedupe: TranscriptDeduplicator | None = None
+        if replay_config is not None and replay_config.enabled:
+            self._replay = AudioReplayBuffer(replay_config)
+            if replay_config.dedupe_transcripts:
+                self._dedupe = TranscriptDeduplicator(replay_config.dedupe_window_s)
+
+    def _install_hooks(self) -> None:
+        """Register the internal socket handlers replay and event streams rely on."""
+        self._sio.on(_DISCONNECT_FINAL_EVENT, self._on_disconnect_final, namespace=self._namespace)
+        if self._replay is None:
+            return
+        # Route connect/transcript events through the dispatcher so replay can observe them
+        self._ensure_dispatcher(LiveEvents.Connect)
+        if self._dedupe is not None:
+            self._ensure_dispatcher(LiveEvents.Transcript)
+
+    @abstractmethod
+    def _make_dispatcher(self, event: LiveEvents) -> Callable[..., Any]:
+        """Return the socket handler that hands *event* to the user's handler."""
+
+    def _ensure_dispatcher(self, event: LiveEvents) -> None:
+        if event in self._dispatched_events:
+            return
+        self._sio.on(event, self._make_dispatcher(event), namespace=self._namespace)
+        self._dispatched_events.add(event)
+
+    def _add_handler(self, event: LiveEvents, handler: Callable[..., Any]) -> None:
+        if not callable(handler):
+            raise AiolaValidationError("Event handler must be callable")
+        self._handlers[event] = handler
+        self._ensure_dispatcher(event)
+
+    def _is_duplicate(self, event: LiveEvents, args: tuple) -> bool:
+        if self._dedupe is None or event != LiveEvents.Transcript or not args:
+            return False
+        if self._dedupe.is_duplicate(args[0]):
+            if self._replay is not None:
+                self._replay.stats.duplicates_suppressed += 1
+            return True
+        return False
+
+    def _on_disconnect_final(self, *args: Any) -> None:
+        # socketio stopped reconnecting: further sends should fail instead of buffering
+        self._session_active = False
+        self._reset_replay()
+        self._finish_event_streams()
+
+    def _subscribe(self, stream: Any) -> Any:
+        for event in stream.event_types:
+            self._ensure_dispatcher(event)
+        self._event_streams.append(stream)
+        return stream
+
+    def _unsubscribe(self, stream: Any) -> None:
+        if stream in self._event_streams:
+            self._event_streams.remove(stream)
+
+    def _finish_event_streams(self) -> None:
+        streams, self._event_streams = self._event_streams, []
+        for stream in streams:
+            stream._finish()
+
+    def _reset_replay(self) -> None:
+        if self._replay is not None:
+            self._replay.clear()
+        if self._dedupe is not None:
+            self._dedupe.clear()
+
+    def on(self, event: LiveEvents, handler: Callable[..., Any] | None = None) -> Callable[..., Any]:
+        """Register an event handler."""
+        if not isinstance(event, LiveEvents) or not event:
+            raise AiolaValidationError("Event name must be a non-empty string")
+
+        try:
+            if handler is None:
+                # Decorator usage: @connection.on(LiveEvents.Transcript)
+                def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+                    self._add_handler(event, func)
+                    return func
+
+                return decorator
+            else:
+                # Direct usage: connection.on(LiveEvents.Transcript, lambda x: print(x))
+                self._add_handler(event, handler)
+                return handler
+        except (AiolaError, AiolaValidationError):
+            raise
+        except Exception as exc:
+            raise AiolaStreamingError(f"Failed to register event handler for '{event}'") from exc
+
+    @staticmethod
+    def _frame_interval(audio: MappedAudioFile, frame_ms: float, speed: float | None) -> float:
+        """Seconds between frame sends, or 0 to send as fast as possible."""
+        if speed is not None and (not isinstance(speed, int | float) or speed < 0):
+            raise AiolaValidationError("speed must be a non-negative number or None")
+        if not speed:
+            return 0.0
+        return audio.frame_bytes(frame_ms) / (audio.sample_rate * audio.block_align) / speed
+
+    @property
+    def connected(self) -> bool:
+        """Check if the connection is active."""
+        return self._sio.connected
+
+    @property
+    def reconnecting(self) -> bool:
+        """Check if the socket dropped and audio is being buffered until it reconnects."""
+        return self._replay is not None and self._session_active and not self._sio.connected
+
+    @property
+    def handler_metrics(self) -> HandlerMetrics:
+        """Latency counters of the registered event handlers."""
+        return self._handler_metrics
+
+    @property
+    def replay_stats(self) -> ReplayStats | None:
+        """Replay counters, or ``None`` when replay is disabled."""
+        return self._replay.stats if self._replay is not None else None
+
+
+class StreamConnection(_BaseStreamConnection):
+    """Stream connection for the STT client."""
+
+    def __init__(
+        self,
+        options: AiolaClientOptions,
+        url: str,
+        headers: dict[str, str],
+        socketio_path: str,
+        namespace: str = "/events",
+        replay_config: ReplayConfig | None = None,
+        handler_executor: Executor | None = None,
+    ):
+        super().__init__(options, url, headers, socketio_path, namespace, replay_config)
+        self._replay_lock = threading.Lock()
+        self._serial_dispatcher: SerialHandlerDispatcher | None = None
+        if handler_executor is not None:
+            self._serial_dispatcher = SerialHandlerDispatcher(handler_executor, self._handler_metrics)
         self._sio: socketio.Client = socketio.Client(
             reconnection=True,
             reconnection_attempts=3,
             reconnection_delay=1,
         )
+        self._install_hooks()
+
+    def _make_dispatcher(self, event: LiveEvents) -> Callable[..., Any]:
+        def dispatch(*args: Any) -> Any:
+            if event == LiveEvents.Connect:
+                self._on_socket_connect()
+            if self._is_duplicate(event, args):
+                return None
+            for stream in list(self._event_streams):
+                if event in stream.event_types:
+                    stream._publish(_make_event(event, args))
+            handler = self._handlers.get(event)
+            if handler is None:
+                return None
+            if self._serial_dispatcher is not None:
+                self._serial_dispatcher.submit(event, handler, args)
+                return None
+            started = time.perf_counter()
+            try:
+                return _call_handler(event, handler, args)
+            except Exception:
+                self._handler_metrics.errors += 1
+                raise
+            finally:
+                self._handler_metrics.record(time.perf_counter() - started)
+
+        return dispatch
+
+    def _on_socket_connect(self) -> None:
+        if self._replay is None or not self._session_active:
+            return  # Initial connect, nothing to replay
+
+        with self._replay_lock:
+            self._replay.stats.reconnects += 1
+            chunks = self._replay.replay()
+            if self._dedupe is not None:
+                self._dedupe.arm()
+            try:
+                for chunk in chunks:
+                    self._sio.emit("binary_data", chunk, namespace=self._namespace)
+            except Exception:
+                # The socket dropped again mid-replay; the audio stays queued for the next attempt
+                return
+            self._replay.mark_replayed(chunks)
 
     def connect(self) -> None:
         """Establish the socket connection using stored parameters."""
@@ -43,47 +256,109 @@ class StreamConnection:
                 wait=True,
                 transports=["polling", "websocket"],
             )
+            self._session_active = True
         except Exception as exc:
             raise AiolaStreamingError("Failed to connect to Streaming service") from exc
 
-    def on(self, event: LiveEvents, handler: Callable[..., Any] | None = None) -> Callable[..., Any]:
-        """Register an event handler."""
-        if not isinstance(event, LiveEvents) or not event:
-            raise AiolaValidationError("Event name must be a non-empty string")
-
-        try:
-            if handler is None:
-                # Decorator usage: @connection.on(LiveEvents.Transcript)
-                def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-                    if not callable(func):
-                        raise AiolaValidationError("Event handler must be callable")
-                    self._sio.on(event, func, namespace=self._namespace)
-                    return func
-
-                return decorator
-            else:
-                # Direct usage: connection.on(LiveEvents.Transcript, lambda x: print(x))
-                if not callable(handler):
-                    raise AiolaValidationError("Event handler must be callable")
-                self._sio.on(event, handler, namespace=self._namespace)
-                return handler
-        except (AiolaError, AiolaValidationError):
-            raise
-        except Exception as exc:
-            raise AiolaStreamingError(f"Failed to register event handler for '{event}'") from exc
-
     def send(self, data: bytes) -> None:
-        """Send binary audio data."""
-        if not self.connected:
+        """Send binary audio data.
+
+        With replay enabled, audio sent while the socket is reconnecting is buffered and
+        delivered once the connection is re-established instead of raising.
+        """
+        if not self.connected and not self.reconnecting:
             raise AiolaError("Connection not established")
 
         if not isinstance(data, bytes):
             raise AiolaValidationError("Data must be bytes")
 
-        try:
-            self._sio.emit("binary_data", data, namespace=self._namespace)
-        except Exception as exc:
-            raise AiolaStreamingError("Failed to send audio data") from exc
+        if self._replay is None:
+            try:
+                self._sio.emit("binary_data", data, namespace=self._namespace)
+            except Exception as exc:
+                raise AiolaStreamingError("Failed to send audio data") from exc
+            return
+
+        with self._replay_lock:
+            if not self.connected:
+                self._replay.buffer(data)
+                return
+            try:
+                pending = self._replay.pending()
+                for chunk in pending:
+                    self._sio.emit("binary_data", chunk, namespace=self._namespace)
+                if pending:
+                    self._replay.mark_replayed(pending)
+                self._sio.emit("binary_data", data, namespace=self._namespace)
+                self._replay.record_sent(data)
+            except Exception as exc:
+                raise AiolaStreamingError("Failed to send audio data") from exc
+
+    def events(
+        self,
+        maxsize: int = DEFAULT_EVENT_QUEUE_SIZE,
+        overflow: OverflowPolicy | str = OverflowPolicy.DropOldest,
+        event_types: Iterable[LiveEvents] | None = None,
+    ) -> EventStream:
+        """Return a blocking iterator over received events.
+
+        Args:
+            maxsize: Maximum number of queued events.
+            overflow: What to do when the queue is full. ``OverflowPolicy.Block`` pauses the
+                socket receive thread until the consumer catches up.
+            event_types: Events to queue (default: all ``LiveEvents``).
+
+        Example:
+            ```python
+            for event in connection.events():
+                if event.type == LiveEvents.Transcript:
+                    print(event.data)
+            ```
+        """
+        policy, types = _resolve_event_stream_params(maxsize, overflow, event_types)
+        return self._subscribe(EventStream(maxsize, policy, types, self._unsubscribe))
+
+    def stream_file(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        speed: float | None = 1.0,
+        frame_ms: float = 20,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        channels: int = 1,
+    ) -> int:
+        """Stream a WAV or raw PCM file, paced like live audio.
+
+        The file is memory-mapped and sent in fixed ``frame_ms`` frames against a monotonic-clock
+        schedule, so pacing doesn't drift with the time spent sending. The audio must already be in
+        the format the stream expects; WAV headers are stripped.
+
+        Args:
+            path: Path of a WAV file, or of a headerless PCM file.
+            speed: Playback rate multiplier (2.0 sends twice as fast as real time). ``None`` or 0
+                sends as fast as possible.
+            frame_ms: Duration of each sent frame in milliseconds.
+            sample_rate: Sample rate of a raw PCM file (WAV files use their header).
+            sample_width: Bytes per sample of a raw PCM file.
+            channels: Channel count of a raw PCM file.
+
+        Returns:
+            Number of audio bytes sent.
+        """
+        sent = 0
+        with MappedAudioFile(path, sample_rate=sample_rate, sample_width=sample_width, channels=channels) as audio:
+            interval = self._frame_interval(audio, frame_ms, speed)
+            start = time.monotonic()
+            for index, frame in enumerate(audio.frames(frame_ms)):
+                if interval:
+                    delay = start + index * interval - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                with frame:
+                    self.send(frame.tobytes())
+                    sent += len(frame)
+        return sent
 
     def set_keywords(self, keywords: dict[str, str]) -> None:
         """Send keywords list to the server."""
@@ -100,19 +375,19 @@ class StreamConnection:
 
     def disconnect(self) -> None:
         """Disconnect the socket connection."""
+        self._session_active = False
+        self._reset_replay()
+        self._finish_event_streams()
+        if self._serial_dispatcher is not None:
+            self._serial_dispatcher.close()
         if self._sio.connected:
             try:
                 self._sio.disconnect()
             except Exception as exc:
                 raise AiolaStreamingError("Failed to disconnect cleanly") from exc
 
-    @property
-    def connected(self) -> bool:
-        """Check if the connection is active."""
-        return self._sio.connected
-
 
-class AsyncStreamConnection:
+class AsyncStreamConnection(_BaseStreamConnection):
     """Async stream connection for the STT client."""
 
     def __init__(
@@ -122,17 +397,66 @@ class AsyncStreamConnection:
         headers: dict[str, str],
         socketio_path: str,
         namespace: str = "/events",
+        replay_config: ReplayConfig | None = None,
+        handler_executor: Executor | None = None,
     ):
-        self._options = options
-        self._url = url
-        self._headers = headers
-        self._socketio_path = socketio_path
-        self._namespace = namespace
+        super().__init__(options, url, headers, socketio_path, namespace, replay_config)
+        self._replay_lock = asyncio.Lock()
+        self._serial_dispatcher: AsyncSerialHandlerDispatcher | None = None
+        if handler_executor is not None:
+            self._serial_dispatcher = AsyncSerialHandlerDispatcher(handler_executor, self._handler_metrics)
         self._sio: socketio.AsyncClient = socketio.AsyncClient(
             reconnection=True,
             reconnection_attempts=3,
             reconnection_delay=1,
         )
+        self._install_hooks()
+
+    def _make_dispatcher(self, event: LiveEvents) -> Callable[..., Any]:
+        async def dispatch(*args: Any) -> Any:
+            if event == LiveEvents.Connect:
+                await self._on_socket_connect()
+            if self._is_duplicate(event, args):
+                return None
+            for stream in list(self._event_streams):
+                if event in stream.event_types:
+                    await stream._publish(_make_event(event, args))
+            handler = self._handlers.get(event)
+            if handler is None:
+                return None
+            if self._serial_dispatcher is not None:
+                self._serial_dispatcher.submit(event, handler, args)
+                return None
+            started = time.perf_counter()
+            try:
+                result = _call_handler(event, handler, args)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except Exception:
+                self._handler_metrics.errors += 1
+                raise
+            finally:
+                self._handler_metrics.record(time.perf_counter() - started)
+
+        return dispatch
+
+    async def _on_socket_connect(self) -> None:
+        if self._replay is None or not self._session_active:
+            return  # Initial connect, nothing to replay
+
+        async with self._replay_lock:
+            self._replay.stats.reconnects += 1
+            chunks = self._replay.replay()
+            if self._dedupe is not None:
+                self._dedupe.arm()
+            try:
+                for chunk in chunks:
+                    await self._sio.emit("binary_data", chunk, namespace=self._namespace)
+            except Exception:
+                # The socket dropped again mid-replay; the audio stays queued for the next attempt
+                return
+            self._replay.mark_replayed(chunks)
 
     async def connect(self) -> None:
         """Establish the socket connection using stored parameters."""
@@ -148,47 +472,110 @@ class AsyncStreamConnection:
                 wait=True,
                 transports=["polling", "websocket"],
             )
+            self._session_active = True
         except Exception as exc:
             raise AiolaStreamingError("Failed to connect to Streaming service") from exc
 
-    def on(self, event: LiveEvents, handler: Callable[..., Any] | None = None) -> Callable[..., Any]:
-        """Register an event handler."""
-        if not isinstance(event, LiveEvents) or not event:
-            raise AiolaValidationError("Event name must be a non-empty string")
-
-        try:
-            if handler is None:
-                # Decorator usage: @connection.on(LiveEvents.Transcript)
-                def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-                    if not callable(func):
-                        raise AiolaValidationError("Event handler must be callable")
-                    self._sio.on(event, func, namespace=self._namespace)
-                    return func
-
-                return decorator
-            else:
-                # Direct usage: connection.on(LiveEvents.Transcript, lambda x: print(x))
-                if not callable(handler):
-                    raise AiolaValidationError("Event handler must be callable")
-                self._sio.on(event, handler, namespace=self._namespace)
-                return handler
-        except (AiolaError, AiolaValidationError):
-            raise
-        except Exception as exc:
-            raise AiolaStreamingError(f"Failed to register event handler for '{event}'") from exc
-
     async def send(self, data: bytes) -> None:
-        """Send binary audio data."""
-        if not self.connected:
+        """Send binary audio data.
+
+        With replay enabled, audio sent while the socket is reconnecting is buffered and
+        delivered once the connection is re-established instead of raising.
+        """
+        if not self.connected and not self.reconnecting:
             raise AiolaError("Connection not established")
 
         if not isinstance(data, bytes):
             raise AiolaValidationError("Data must be bytes")
 
-        try:
-            await self._sio.emit("binary_data", data, namespace=self._namespace)
-        except Exception as exc:
-            raise AiolaStreamingError("Failed to send audio data") from exc
+        if self._replay is None:
+            try:
+                await self._sio.emit("binary_data", data, namespace=self._namespace)
+            except Exception as exc:
+                raise AiolaStreamingError("Failed to send audio data") from exc
+            return
+
+        async with self._replay_lock:
+            if not self.connected:
+                self._replay.buffer(data)
+                return
+            try:
+                pending = self._replay.pending()
+                for chunk in pending:
+                    await self._sio.emit("binary_data", chunk, namespace=self._namespace)
+                if pending:
+                    self._replay.mark_replayed(pending)
+                await self._sio.emit("binary_data", data, namespace=self._namespace)
+                self._replay.record_sent(data)
+            except Exception as exc:
+                raise AiolaStreamingError("Failed to send audio data") from exc
+
+    def events(
+        self,
+        maxsize: int = DEFAULT_EVENT_QUEUE_SIZE,
+        overflow: OverflowPolicy | str = OverflowPolicy.DropOldest,
+        event_types: Iterable[LiveEvents] | None = None,
+    ) -> AsyncEventStream:
+        """Return an async iterator over received events.
+
+        Args:
+            maxsize: Maximum number of queued events.
+            overflow: What to do when the queue is full. ``OverflowPolicy.Block`` pauses the
+                socket receive task until the consumer catches up.
+            event_types: Events to queue (default: all ``LiveEvents``).
+
+        Example:
+            ```python
+            async for event in connection.events():
+                if event.type == LiveEvents.Transcript:
+                    print(event.data)
+            ```
+        """
+        policy, types = _resolve_event_stream_params(maxsize, overflow, event_types)
+        return self._subscribe(AsyncEventStream(maxsize, policy, types, self._unsubscribe))
+
+    async def stream_file(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        speed: float | None = 1.0,
+        frame_ms: float = 20,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        channels: int = 1,
+    ) -> int:
+        """Stream a WAV or raw PCM file, paced like live audio.
+
+        The file is memory-mapped and sent in fixed ``frame_ms`` frames against a monotonic-clock
+        schedule, so pacing doesn't drift with the time spent sending. The audio must already be in
+        the format the stream expects; WAV headers are stripped.
+
+        Args:
+            path: Path of a WAV file, or of a headerless PCM file.
+            speed: Playback rate multiplier (2.0 sends twice as fast as real time). ``None`` or 0
+                sends as fast as possible.
+            frame_ms: Duration of each sent frame in milliseconds.
+            sample_rate: Sample rate of a raw PCM file (WAV files use their header).
+            sample_width: Bytes per sample of a raw PCM file.
+            channels: Channel count of a raw PCM file.
+
+        Returns:
+            Number of audio bytes sent.
+        """
+        sent = 0
+        loop = asyncio.get_running_loop()
+        with MappedAudioFile(path, sample_rate=sample_rate, sample_width=sample_width, channels=channels) as audio:
+            interval = self._frame_interval(audio, frame_ms, speed)
+            start = loop.time()
+            for index, frame in enumerate(audio.frames(frame_ms)):
+                if interval:
+                    delay = start + index * interval - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                with frame:
+                    await self.send(frame.tobytes())
+                    sent += len(frame)
+        return sent
 
     async def set_keywords(self, keywords: dict[str, str]) -> None:
         """Send keywords list to the server."""
@@ -205,13 +592,13 @@ class AsyncStreamConnection:
 
     async def disconnect(self) -> None:
         """Disconnect the socket connection."""
+        self._session_active = False
+        self._reset_replay()
+        self._finish_event_streams()
+        if self._serial_dispatcher is not None:
+            self._serial_dispatcher.close()
         if self._sio.connected:
             try:
                 await self._sio.disconnect()
             except Exception as exc:
                 raise AiolaStreamingError("Failed to disconnect") from exc
-
-    @property
-    def connected(self) -> bool:
-        """Check if the connection is active."""
-        return self._sio.connected
@@ -1,3 +1,19 @@
+from ...types import TtsTimings
+from .bulk import TtsItem, TtsItemResult
+from .cache import TtsCache
 from .client import AsyncTtsClient, TtsClient
+from .segment import SentenceBuffer, split_sentences
+from .stream import AsyncTtsStream, TtsStream
 
-__all__ = ["TtsClient", "AsyncTtsClient"]
+__all__ = [
+    "TtsClient",
+    "AsyncTtsClient",
+    "TtsStream",
+    "AsyncTtsStream",
+    "TtsCache",
+    "TtsItem",
+    "TtsItemResult",
+    "TtsTimings",
+    "SentenceBuffer",
+    "split_sentences",
+]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import BinaryIO, Union
+
+from ...errors import AiolaError
+from .cache import TtsCache
+
+# Requests synthesize_many runs at the same time
+DEFAULT_BULK_CONCURRENCY = 8
+
+# Where synthesize_many puts each result: a cache, or a function opening a file for an item
+TtsSink = Union[TtsCache, Callable[["TtsItem"], BinaryIO], None]
+
+
+@dataclass(frozen=True)
+class TtsItem:
+    """One prompt for :meth:`TtsClient.synthesize_many`."""
+
+    text: str
+    voice: str
+    language: str | None = None
+
+
+@dataclass
+class TtsItemResult:
+    """Outcome of one :class:`TtsItem`. Times are in seconds from the start of its request."""
+
+    item: TtsItem
+    size: int = 0
+    first_byte_s: float | None = None
+    elapsed_s: float = 0.0
+    error: AiolaError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _ItemSink:
+    """Writes the audio of one item to a :data:`TtsSink` as it arrives."""
+
+    def __init__(self, sink: TtsSink, item: TtsItem) -> None:
+        self._sink = sink
+        self._item = item
+        self._buffer = bytearray() if isinstance(sink, TtsCache) else None
+        self._file = sink(item) if callable(sink) else None
+
+    def write(self, chunk: bytes) -> None:
+        if self._buffer is not None:
+            self._buffer += chunk
+        elif self._file is not None:
+            self._file.write(chunk)
+
+    def close(self) -> None:
+        """Finish a complete item."""
+        if self._file is not None:
+            self._file.close()
+        if isinstance(self._sink, TtsCache) and self._buffer is not None:
+            self._sink.put(self._item.text, self._item.voice, self._item.language, bytes(self._buffer))
+
+    def discard(self) -> None:
+        """Finish a failed item: a cache receives nothing and a partial file is removed."""
+        if self._file is None:
+            return
+        with suppress(OSError):
+            self._file.close()
+        name = getattr(self._file, "name", None)
+        if isinstance(name, (str, os.PathLike)):
+            with suppress(OSError):
+                os.unlink(name)
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import suppress
+from pathlib import Path
+
+# Size of the chunks cached audio is yielded in, in bytes
+DEFAULT_CHUNK_SIZE = 8192
+DEFAULT_MEMORY_BYTES = 32 * 1024 * 1024
+DEFAULT_DISK_BYTES = 1024 * 1024 * 1024
+
+_SUFFIX = ".audio"
+
+
+class TtsCache:
+    """
+    Two-tier cache of synthesized audio, keyed by text, voice and language.
+
+    Recently used audio is kept in memory, up to ``memory_bytes``. With a ``directory``, every
+    result is also written to disk, up to ``disk_bytes``, and survives restarts; hits there are
+    read through a memory map and moved back into memory. Both tiers evict the least recently
+    used entries first. Hits are yielded in chunks of ``chunk_size`` bytes.
+
+    Pass the cache to :meth:`TtsClient.synthesize` or :meth:`AsyncTtsClient.synthesize`; only
+    complete results are stored. Several processes may share a directory: each one evicts the
+    files it knows of, which are the ones it wrote or read and those present when it started.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        disk_bytes: int = DEFAULT_DISK_BYTES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory for the disk tier, created if needed (default: memory only)
+            memory_bytes: Most audio kept in memory, in bytes (default: 32 MiB)
+            disk_bytes: Most audio kept on disk, in bytes (default: 1 GiB)
+            chunk_size: Size of the chunks hits are yielded in, in bytes (default: 8192)
+        """
+        if memory_bytes < 0 or disk_bytes < 0:
+            raise ValueError("memory_bytes and disk_bytes must not be negative")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.chunk_size = chunk_size
+        self.directory = Path(directory) if directory is not None else None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # key -> audio and key -> file size, least recently used first
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_size = 0
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            files = [(path.stat(), path.name[: -len(_SUFFIX)]) for path in self.directory.glob(f"*{_SUFFIX}")]
+            for stat, key in sorted(files, key=lambda item: item[0].st_mtime):
+                self._disk[key] = stat.st_size
+                self._disk_size += stat.st_size
+            self._evict_disk()
+
+    @staticmethod
+    def key(text: str, voice: str, language: str | None) -> str:
+        """Return the cache key of a synthesis request."""
+        return hashlib.sha256(json.dumps([text, voice, language]).encode()).hexdigest()
+
+    @property
+    def memory_size(self) -> int:
+        """Bytes of audio held in memory."""
+        return self._memory_size
+
+    @property
+    def disk_size(self) -> int:
+        """Bytes of audio held on disk, as far as this process knows."""
+        return self._disk_size
+
+    def _path(self, key: str) -> Path:
+        if self.directory is None:
+            raise RuntimeError("TtsCache has no directory for its disk tier")
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _chunks(self, audio: bytes | mmap.mmap) -> Iterator[bytes]:
+        for start in range(0, len(audio), self.chunk_size):
+            yield audio[start : start + self.chunk_size]
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        # Called with the lock held
+        if len(audio) > self.memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_size -= len(self._memory.pop(key))
+        self._memory[key] = audio
+        self._memory_size += len(audio)
+        while self._memory_size > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def _evict_disk(self) -> None:
+        # Called with the lock held
+        while self._disk_size > self.disk_bytes:
+            key, size = self._disk.popitem(last=False)
+            self._disk_size -= size
+            with suppress(OSError):
+                self._path(key).unlink()
+
+    def _open_file(self, key: str) -> mmap.mmap | None:
+        # Called with the lock held
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            # Keep recently used files last when the directory is scanned again
+            os.utime(path)
+        except (OSError, ValueError):
+            # Evicted by another process, or empty
+            if key in self._disk:
+                self._disk_size -= self._disk.pop(key)
+            return None
+        if key not in self._disk:
+            # Written by another process
+            self._disk_size += len(mapped)
+        self._disk[key] = len(mapped)
+        self._disk.move_to_end(key)
+        return mapped
+
+    def get(self, text: str, voice: str, language: str | None = None) -> Iterator[bytes] | None:
+        """Return the cached audio as an iterator of chunks, or ``None`` on a miss.
+
+        A disk hit too large for memory is streamed from its memory map; close the iterator when
+        stopping early to release the mapping right away.
+        """
+        key = self.key(text, voice, language)
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._chunks(audio)
+
+            mapped = self._open_file(key) if self.directory is not None else None
+            if mapped is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            if len(mapped) <= self.memory_bytes:
+                # Serve the copy kept in memory and release the mapping at once
+                with mapped:
+                    audio = mapped[:]
+                self._remember(key, audio)
+                return self._chunks(audio)
+
+        def read() -> Iterator[bytes]:
+            try:
+                yield from self._chunks(mapped)
+            finally:
+                mapped.close()
+
+        return read()
+
+    def put(self, text: str, voice: str, language: str | None, audio: bytes) -> None:
+        """Store the complete audio of a synthesis request."""
+        if not audio:
+            return
+        key = self.key(text, voice, language)
+        with self._lock:
+            self._remember(key, audio)
+        if self.directory is None or len(audio) > self.disk_bytes:
+            return
+        # Write to a temporary file first, so readers never see a partial file; only the rename
+        # and the bookkeeping need the lock. A full or read-only directory leaves it uncached.
+        temp = None
+        try:
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(audio)
+            with self._lock:
+                os.replace(temp, self._path(key))
+                if key in self._disk:
+                    self._disk_size -= self._disk.pop(key)
+                self._disk[key] = len(audio)
+                self._disk_size += len(audio)
+                self._evict_disk()
+        except OSError:
+            if temp is not None:
+                with suppress(OSError):
+                    os.unlink(temp)
+
+    def clear(self) -> None:
+        """Remove every entry from memory and every file this process knows of from disk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            for key in self._disk:
+                with suppress(OSError):
+                    self._path(key).unlink()
+            self._disk.clear()
+            self._disk_size = 0
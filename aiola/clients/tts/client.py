@@ -1,36 +1,163 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator
-from typing import TYPE_CHECKING
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from ...errors import AiolaAuthenticationError, AiolaConnectionError, AiolaError, AiolaServerError, AiolaValidationError
 from ...http_client import create_async_authenticated_client, create_authenticated_client
-from ...types import AiolaClientOptions
+from ...types import AiolaClientOptions, TtsTimings
+from .bulk import DEFAULT_BULK_CONCURRENCY, TtsItem, TtsItemResult, TtsSink, _ItemSink
+from .cache import TtsCache
+from .segment import DEFAULT_MAX_CHARS, SentenceBuffer, split_sentences
+from .stream import AsyncTtsStream, TtsStream, _Transfers
 
 if TYPE_CHECKING:
     from ...clients.auth.client import AsyncAuthClient, AuthClient
 
+logger = logging.getLogger(__name__)
+
+# Pieces synthesized ahead of the one being played by the pipelined methods
+DEFAULT_PIPELINE_CONCURRENCY = 3
+# Longest wait for the end of a sentence before stream_incremental speaks the words so far, in seconds
+DEFAULT_FLUSH_TIMEOUT = 1.0
+
+# Marks the end of a piece in the pipelined methods' queues
+_DONE = object()
+# Put into the pipelined methods' queues to wake the consumer when the stream is cancelled
+_CANCELLED = object()
+
+
+@contextmanager
+def _map_errors(operation: str) -> Iterator[None]:
+    """Translate HTTP and unexpected errors raised while ``operation`` runs into Aiola errors."""
+    try:
+        yield
+    except AiolaError:
+        raise
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code == 401:
+            raise AiolaAuthenticationError.from_response(exc.response) from exc
+        elif exc.response.status_code >= 500:
+            raise AiolaServerError.from_response(exc.response) from exc
+        else:
+            raise AiolaError.from_response(exc.response) from exc
+    except httpx.RequestError as exc:
+        raise AiolaConnectionError(f"Network error during {operation}: {str(exc)}") from exc
+    except Exception as exc:
+        raise AiolaError(f"{operation[0].upper()}{operation[1:]} failed: {str(exc)}") from exc
+
+
+class _TimingRecorder:
+    """Fills in the :class:`TtsTimings` of one request, partly from httpcore trace events."""
+
+    def __init__(self, timings: TtsTimings) -> None:
+        self.timings = timings
+        self._start = time.perf_counter()
+
+    def mark(self, field: str) -> None:
+        if getattr(self.timings, field) is None:
+            setattr(self.timings, field, time.perf_counter() - self._start)
+
+    def trace(self, event: str, info: dict[str, Any]) -> None:
+        if event.startswith("connection.connect_tcp."):
+            self.timings.new_connection = True
+        elif event.endswith(".send_request_headers.started"):
+            self.mark("connected_s")
+        elif event.endswith(".send_request_body.complete"):
+            self.mark("request_sent_s")
+        elif event.endswith(".receive_response_headers.complete"):
+            self.mark("response_s")
+
+    async def atrace(self, event: str, info: dict[str, Any]) -> None:
+        self.trace(event, info)
+
+    def response(self, response: httpx.Response) -> None:
+        self.mark("response_s")
+        self.timings.status_code = response.status_code
+
+    def chunk(self, chunk: bytes) -> None:
+        self.mark("first_byte_s")
+        self.timings.last_byte_s = time.perf_counter() - self._start
+        self.timings.bytes_received += len(chunk)
+
+
+class _CacheHit:
+    """Counts the audio of a cache hit in the timings of the request it replaces."""
+
+    def __init__(self, timings: TtsTimings) -> None:
+        self.timings = timings
+
+    def chunks(self, cached: Iterator[bytes]) -> Iterator[bytes]:
+        try:
+            for chunk in cached:
+                self.timings.bytes_received += len(chunk)
+                yield chunk
+        except Exception as exc:
+            self.timings.error = exc
+            raise
+        finally:
+            # Release a disk hit's memory map when the stream is cancelled or closed early
+            close = getattr(cached, "close", None)
+            if close is not None:
+                close()
+        self.timings.completed = True
+
 
 class BaseTts:
     def __init__(self, options: AiolaClientOptions, auth: AuthClient | AsyncAuthClient) -> None:
         self._options = options
         self._auth = auth
+        # Called with the TtsTimings of every stream/synthesize request once it ends
+        self.metrics_hook: Callable[[TtsTimings], None] | None = None
+
+    def _report(self, timings: TtsTimings) -> None:
+        if self.metrics_hook is None:
+            return
+        try:
+            self.metrics_hook(timings)
+        except Exception:
+            logger.exception("TTS metrics hook raised")
 
     @staticmethod
     def _make_headers() -> dict[str, str]:
         return {"Accept": "audio/*"}
 
+    @staticmethod
+    def _make_payload(text: str, voice: str, language: str | None) -> dict[str, Any]:
+        return {
+            "text": text,
+            "voice": voice,
+            "language": language,
+        }
+
     def _validate_tts_params(self, text: str, voice: str, language: str | None) -> None:
         """Validate TTS parameters."""
         if not text or not isinstance(text, str):
             raise AiolaValidationError("text must be a non-empty string")
+        self._validate_voice_params(voice, language)
+
+    def _validate_voice_params(self, voice: str, language: str | None) -> None:
         if not voice or not isinstance(voice, str):
             raise AiolaValidationError("voice must be a non-empty string")
         if language is not None and not isinstance(language, str):
             raise AiolaValidationError("language must be a string")
 
+    @staticmethod
+    def _validate_pipeline_params(max_concurrency: int, max_chars: int) -> None:
+        if max_concurrency < 1:
+            raise AiolaValidationError("max_concurrency must be at least 1")
+        if max_chars < 1:
+            raise AiolaValidationError("max_chars must be at least 1")
+
 
 class TtsClient(BaseTts):
     """TTS client."""
@@ -39,77 +166,360 @@ class TtsClient(BaseTts):
         super().__init__(options, auth)
         self._auth: AuthClient = auth  # Type narrowing
 
-    def stream(self, *, text: str, voice: str, language: str | None = None) -> Iterator[bytes]:
-        """Stream synthesized audio in real-time."""
+    def _request(
+        self,
+        path: str,
+        text: str,
+        voice: str,
+        language: str | None,
+        operation: str,
+        transfers: _Transfers,
+        timings: TtsTimings,
+    ) -> Iterator[bytes]:
+        recorder = _TimingRecorder(timings)
+        try:
+            with _map_errors(operation):
+                # Create authenticated HTTP client and make the streaming request
+                client = create_authenticated_client(self._options, self._auth)
+                recorder.mark("token_s")
+                with (
+                    client,
+                    client.stream(
+                        "POST",
+                        path,
+                        json=self._make_payload(text, voice, language),
+                        headers=self._make_headers(),
+                        extensions={"trace": recorder.trace},
+                    ) as response,
+                    transfers.track(response),
+                ):
+                    recorder.response(response)
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes():
+                        recorder.chunk(chunk)
+                        yield chunk
+            timings.completed = True
+        except Exception as exc:
+            if not transfers.aborted:
+                timings.error = exc
+            raise
+        finally:
+            timings.cancelled = transfers.aborted and not timings.completed
+            self._report(timings)
+
+    def stream(self, *, text: str, voice: str, language: str | None = None) -> TtsStream:
+        """
+        Stream synthesized audio in real-time.
+
+        Returns a :class:`TtsStream`: iterate it for the audio, and cancel or close it to end the
+        request early, e.g. when the listener interrupts. Its ``timings`` fill in as the request
+        progresses and are passed to :attr:`metrics_hook` when it ends.
+        """
         self._validate_tts_params(text, voice, language)
+        timings = TtsTimings("/api/tts/stream")
+        return TtsStream(
+            lambda transfers: self._request(timings.path, text, voice, language, "TTS streaming", transfers, timings),
+            timings,
+        )
 
-        try:
-            # Create authenticated HTTP client and make the streaming request
-            with (
-                create_authenticated_client(self._options, self._auth) as client,
-                client.stream(
-                    "POST",
-                    "/api/tts/stream",
-                    json={
-                        "text": text,
-                        "voice": voice,
-                        "language": language,
-                    },
-                    headers=self._make_headers(),
-                ) as response,
-            ):
-                response.raise_for_status()
-                yield from response.iter_bytes()
+    def _synthesize(
+        self,
+        text: str,
+        voice: str,
+        language: str | None,
+        cache: TtsCache | None,
+        transfers: _Transfers,
+        timings: TtsTimings,
+    ) -> Iterator[bytes]:
+        if cache is None:
+            yield from self._request(timings.path, text, voice, language, "TTS synthesis", transfers, timings)
+            return
 
-        except AiolaError:
-            raise
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 401:
-                raise AiolaAuthenticationError.from_response(exc.response) from exc
-            elif exc.response.status_code >= 500:
-                raise AiolaServerError.from_response(exc.response) from exc
-            else:
-                raise AiolaError.from_response(exc.response) from exc
-        except httpx.RequestError as exc:
-            raise AiolaConnectionError(f"Network error during TTS streaming: {str(exc)}") from exc
-        except Exception as exc:
-            raise AiolaError(f"TTS streaming failed: {str(exc)}") from exc
+        cached = cache.get(text, voice, language)
+        if cached is not None:
+            try:
+                yield from _CacheHit(timings).chunks(cached)
+            finally:
+                timings.cancelled = transfers.aborted and not timings.completed
+                self._report(timings)
+            return
+        audio = bytearray()
+        for chunk in self._request(timings.path, text, voice, language, "TTS synthesis", transfers, timings):
+            audio += chunk
+            yield chunk
+        cache.put(text, voice, language, bytes(audio))
+
+    def synthesize(
+        self, *, text: str, voice: str, language: str | None = None, cache: TtsCache | None = None
+    ) -> TtsStream:
+        """
+        Synthesize audio and return as iterator of bytes.
 
-    def synthesize(self, *, text: str, voice: str, language: str | None = None) -> Iterator[bytes]:
-        """Synthesize audio and return as iterator of bytes."""
+        With a ``cache``, a request seen before is answered from it without a round-trip, and a
+        new one is stored once its audio has been received completely. Like :meth:`stream`,
+        the returned :class:`TtsStream` can be cancelled and carries the request's ``timings``.
+        """
         self._validate_tts_params(text, voice, language)
+        timings = TtsTimings("/api/tts/synthesize")
+        return TtsStream(lambda transfers: self._synthesize(text, voice, language, cache, transfers, timings), timings)
+
+    def _pipeline(
+        self,
+        pieces: Iterator[str],
+        voice: str,
+        language: str | None,
+        max_concurrency: int,
+        operation: str,
+        transfers: _Transfers,
+    ) -> Iterator[bytes]:
+        """Render pieces concurrently, up to ``max_concurrency`` ahead, and yield their audio in order."""
+        headers = self._make_headers()
+        cancelled = threading.Event()
+        # One slot per piece rendering or waiting to be yielded
+        slots = threading.Semaphore(max_concurrency)
+        # Per-piece chunk queues in text order, then _DONE, or the error raised by ``pieces``
+        order: queue.Queue = queue.Queue()
+
+        with (
+            _map_errors(operation),
+            create_authenticated_client(self._options, self._auth) as client,
+            ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="aiola-tts") as pool,
+        ):
+
+            def render(piece: str, out: queue.Queue) -> None:
+                try:
+                    with (
+                        client.stream(
+                            "POST", "/api/tts/stream", json=self._make_payload(piece, voice, language), headers=headers
+                        ) as response,
+                        transfers.track(response),
+                    ):
+                        response.raise_for_status()
+                        for chunk in response.iter_bytes():
+                            if cancelled.is_set():
+                                return
+                            out.put(chunk)
+                    out.put(_DONE)
+                except Exception as exc:
+                    out.put(exc)
+
+            def feed() -> None:
+                try:
+                    for piece in pieces:
+                        slots.acquire()
+                        if cancelled.is_set():
+                            return
+                        out: queue.Queue = queue.Queue()
+                        pool.submit(render, piece, out)
+                        order.put(out)
+                    order.put(_DONE)
+                except Exception as exc:
+                    order.put(exc)
+
+            # The queue being waited on, which a cancel from another thread has to wake up too
+            current: list[queue.Queue] = []
+
+            def wake() -> None:
+                order.put(_CANCELLED)
+                for out in current:
+                    out.put(_CANCELLED)
+
+            transfers.on_abort(wake)
+            # Daemon: ``pieces`` may block on a caller's iterator that never ends
+            threading.Thread(target=feed, daemon=True, name="aiola-tts-feed").start()
+            try:
+                while (out := order.get()) is not _DONE:
+                    if out is _CANCELLED:
+                        return
+                    if isinstance(out, Exception):
+                        raise out
+                    current[:] = [out]
+                    if transfers.aborted:
+                        # Cancelled before ``out`` could be woken
+                        return
+                    while (item := out.get()) is not _DONE:
+                        if item is _CANCELLED:
+                            return
+                        if isinstance(item, Exception):
+                            raise item
+                        yield item
+                    slots.release()
+            finally:
+                # Stop the pieces still rendering and let the feeder stop at its next piece
+                cancelled.set()
+                transfers.abort()
+                slots.release(max_concurrency)
+
+    def stream_pipelined(
+        self,
+        *,
+        text: str,
+        voice: str,
+        language: str | None = None,
+        max_concurrency: int = DEFAULT_PIPELINE_CONCURRENCY,
+        max_chars: int = DEFAULT_MAX_CHARS,
+    ) -> TtsStream:
+        """
+        Stream synthesized audio for long text, rendering sentences in parallel.
+
+        The text is split into sentences (see :func:`split_sentences`) and each one is streamed
+        in its own request over one shared connection pool. Up to ``max_concurrency`` sentences
+        render at a time, starting with the first, and their audio is yielded strictly in order:
+        the first sentence plays as it arrives while the next ones are already rendering, and
+        their audio is held until their turn. Every sentence is a complete response, so with a
+        container format each one starts with its own header.
+
+        Args:
+            text: The text to synthesize
+            voice: The voice to use
+            language: Optional language code
+            max_concurrency: Sentences rendering at the same time, including the one being
+                yielded (default: 3)
+            max_chars: Longest piece sent in one request, in characters (default: 250)
+        """
+        self._validate_tts_params(text, voice, language)
+        self._validate_pipeline_params(max_concurrency, max_chars)
+        pieces = split_sentences(text, max_chars=max_chars)
+        return TtsStream(
+            lambda transfers: self._pipeline(
+                iter(pieces), voice, language, max_concurrency, "pipelined TTS streaming", transfers
+            )
+        )
+
+    def _incremental_pieces(self, text_iter: Iterable[str], flush_timeout: float, max_chars: int) -> Iterator[str]:
+        tokens: queue.Queue = queue.Queue()
+
+        def read() -> None:
+            try:
+                for token in text_iter:
+                    tokens.put(token)
+                tokens.put(_DONE)
+            except Exception as exc:
+                tokens.put(exc)
 
+        # Daemon: the caller's iterator may block for as long as it likes
+        threading.Thread(target=read, daemon=True, name="aiola-tts-text").start()
+        buffer = SentenceBuffer(max_chars=max_chars)
+        deadline: float | None = None
+        while True:
+            try:
+                token = tokens.get(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                # Nothing ended the sentence in time: speak the words so far
+                if (piece := buffer.pop_words()) is not None:
+                    yield piece
+                deadline = None
+                continue
+            if token is _DONE:
+                if (piece := buffer.flush()) is not None:
+                    yield piece
+                return
+            if isinstance(token, Exception):
+                raise token
+            yield from buffer.push(token)
+            if not buffer.pending:
+                deadline = None
+            elif deadline is None:
+                deadline = time.monotonic() + flush_timeout
+
+    def stream_incremental(
+        self,
+        *,
+        text_iter: Iterable[str],
+        voice: str,
+        language: str | None = None,
+        flush_timeout: float = DEFAULT_FLUSH_TIMEOUT,
+        max_concurrency: int = DEFAULT_PIPELINE_CONCURRENCY,
+        max_chars: int = DEFAULT_MAX_CHARS,
+    ) -> TtsStream:
+        """
+        Stream synthesized audio for text that is still being generated, e.g. LLM tokens.
+
+        Text from ``text_iter`` is collected in a :class:`SentenceBuffer` and every completed
+        sentence is synthesized right away, so speech starts with the first sentence rather than
+        with the end of the text. When no sentence ends within ``flush_timeout`` seconds of text
+        arriving, the complete words so far are synthesized instead. Sentences render and are
+        yielded as in :meth:`stream_pipelined`.
+
+        Args:
+            text_iter: The text, in pieces of any size
+            voice: The voice to use
+            language: Optional language code
+            flush_timeout: Longest wait for the end of a sentence, in seconds (default: 1.0)
+            max_concurrency: Sentences rendering at the same time, including the one being
+                yielded (default: 3)
+            max_chars: Longest piece sent in one request, in characters (default: 250)
+        """
+        self._validate_voice_params(voice, language)
+        self._validate_pipeline_params(max_concurrency, max_chars)
+        if flush_timeout <= 0:
+            raise AiolaValidationError("flush_timeout must be positive")
+        pieces = self._incremental_pieces(text_iter, flush_timeout, max_chars)
+        return TtsStream(
+            lambda transfers: self._pipeline(
+                pieces, voice, language, max_concurrency, "incremental TTS streaming", transfers
+            )
+        )
+
+    def _synthesize_item(self, client: httpx.Client, item: TtsItem, sink: TtsSink) -> TtsItemResult:
+        result = TtsItemResult(item)
+        start = time.perf_counter()
+        item_sink = None
         try:
-            # Create authenticated HTTP client and make the streaming request
-            with (
-                create_authenticated_client(self._options, self._auth) as client,
-                client.stream(
+            with _map_errors("TTS synthesis"):
+                self._validate_tts_params(item.text, item.voice, item.language)
+                item_sink = _ItemSink(sink, item)
+                with client.stream(
                     "POST",
                     "/api/tts/synthesize",
-                    json={
-                        "text": text,
-                        "voice": voice,
-                        "language": language,
-                    },
+                    json=self._make_payload(item.text, item.voice, item.language),
                     headers=self._make_headers(),
-                ) as response,
-            ):
-                response.raise_for_status()
-                yield from response.iter_bytes()
+                ) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes():
+                        if result.first_byte_s is None:
+                            result.first_byte_s = time.perf_counter() - start
+                        item_sink.write(chunk)
+                        result.size += len(chunk)
+                item_sink.close()
+        except AiolaError as exc:
+            result.error = exc
+            if item_sink is not None:
+                item_sink.discard()
+        result.elapsed_s = time.perf_counter() - start
+        return result
 
-        except AiolaError:
-            raise
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 401:
-                raise AiolaAuthenticationError.from_response(exc.response) from exc
-            elif exc.response.status_code >= 500:
-                raise AiolaServerError.from_response(exc.response) from exc
-            else:
-                raise AiolaError.from_response(exc.response) from exc
-        except httpx.RequestError as exc:
-            raise AiolaConnectionError(f"Network error during TTS synthesis: {str(exc)}") from exc
-        except Exception as exc:
-            raise AiolaError(f"TTS synthesis failed: {str(exc)}") from exc
+    def synthesize_many(
+        self, items: Iterable[TtsItem], *, concurrency: int = DEFAULT_BULK_CONCURRENCY, sink: TtsSink = None
+    ) -> list[TtsItemResult]:
+        """
+        Synthesize many prompts over one connection pool, e.g. to pre-render a catalog.
+
+        Up to ``concurrency`` requests run at a time. The audio of each item goes to ``sink`` as
+        it arrives: a :class:`TtsCache` stores complete results, and a function receiving the
+        item returns a binary file to write to, which is closed afterwards. When an item fails,
+        its file is closed and, if it has a path, removed; the error, including one raised while
+        writing or closing, is recorded on the item's result and does not stop the others.
+        Without a sink the audio is discarded.
+
+        Args:
+            items: The prompts to synthesize
+            concurrency: Requests running at the same time (default: 8)
+            sink: Where to put the audio (default: discard it)
+
+        Returns:
+            One result per item, in the order of ``items``, with its size, timings and error
+        """
+        if concurrency < 1:
+            raise AiolaValidationError("concurrency must be at least 1")
+        items = list(items)
+
+        with (
+            _map_errors("bulk TTS synthesis"),
+            create_authenticated_client(self._options, self._auth) as client,
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="aiola-tts") as pool,
+        ):
+            return list(pool.map(lambda item: self._synthesize_item(client, item, sink), items))
 
 
 class AsyncTtsClient(BaseTts):
@@ -119,78 +529,335 @@ class AsyncTtsClient(BaseTts):
         super().__init__(options, auth)
         self._auth: AsyncAuthClient = auth  # Type narrowing
 
-    async def stream(self, *, text: str, voice: str, language: str | None = None) -> AsyncIterator[bytes]:
-        """Stream synthesized audio in real-time (async)."""
+    async def _request(
+        self,
+        path: str,
+        text: str,
+        voice: str,
+        language: str | None,
+        operation: str,
+        transfers: _Transfers,
+        timings: TtsTimings,
+    ) -> AsyncIterator[bytes]:
+        recorder = _TimingRecorder(timings)
+        try:
+            with _map_errors(operation):
+                # Create authenticated HTTP client and make the streaming request
+                client = await create_async_authenticated_client(self._options, self._auth)
+                recorder.mark("token_s")
+                async with (
+                    client as http_client,
+                    http_client.stream(
+                        "POST",
+                        path,
+                        json=self._make_payload(text, voice, language),
+                        headers=self._make_headers(),
+                        extensions={"trace": recorder.atrace},
+                    ) as response,
+                ):
+                    with transfers.track(response):
+                        recorder.response(response)
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes():
+                            recorder.chunk(chunk)
+                            yield chunk
+            timings.completed = True
+        except Exception as exc:
+            if not transfers.aborted:
+                timings.error = exc
+            raise
+        finally:
+            timings.cancelled = transfers.aborted and not timings.completed
+            self._report(timings)
+
+    def stream(self, *, text: str, voice: str, language: str | None = None) -> AsyncTtsStream:
+        """
+        Stream synthesized audio in real-time (async).
+
+        Returns an :class:`AsyncTtsStream`: iterate it for the audio, and cancel or ``aclose()``
+        it to end the request early, e.g. when the listener interrupts. See
+        :meth:`TtsClient.stream` for its ``timings``.
+        """
         self._validate_tts_params(text, voice, language)
+        timings = TtsTimings("/api/tts/stream")
+        return AsyncTtsStream(
+            lambda transfers: self._request(
+                timings.path, text, voice, language, "async TTS streaming", transfers, timings
+            ),
+            timings,
+        )
 
-        try:
-            # Create authenticated HTTP client and make the streaming request
-            client = await create_async_authenticated_client(self._options, self._auth)
-            async with (
-                client as http_client,
-                http_client.stream(
-                    "POST",
-                    "/api/tts/stream",
-                    json={
-                        "text": text,
-                        "voice": voice,
-                        "language": language,
-                    },
-                    headers=self._make_headers(),
-                ) as response,
-            ):
-                response.raise_for_status()
-                async for chunk in response.aiter_bytes():
+    async def _synthesize(
+        self,
+        text: str,
+        voice: str,
+        language: str | None,
+        cache: TtsCache | None,
+        transfers: _Transfers,
+        timings: TtsTimings,
+    ) -> AsyncIterator[bytes]:
+        operation = "async TTS synthesis"
+        if cache is None:
+            async for chunk in self._request(timings.path, text, voice, language, operation, transfers, timings):
+                yield chunk
+            return
+
+        cached = cache.get(text, voice, language)
+        if cached is not None:
+            try:
+                for chunk in _CacheHit(timings).chunks(cached):
                     yield chunk
+            finally:
+                timings.cancelled = transfers.aborted and not timings.completed
+                self._report(timings)
+            return
+        audio = bytearray()
+        async for chunk in self._request(timings.path, text, voice, language, operation, transfers, timings):
+            audio += chunk
+            yield chunk
+        cache.put(text, voice, language, bytes(audio))
 
-        except AiolaError:
-            raise
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 401:
-                raise AiolaAuthenticationError.from_response(exc.response) from exc
-            elif exc.response.status_code >= 500:
-                raise AiolaServerError.from_response(exc.response) from exc
-            else:
-                raise AiolaError.from_response(exc.response) from exc
-        except httpx.RequestError as exc:
-            raise AiolaConnectionError(f"Network error during async TTS streaming: {str(exc)}") from exc
-        except Exception as exc:
-            raise AiolaError(f"Async TTS streaming failed: {str(exc)}") from exc
+    def synthesize(
+        self, *, text: str, voice: str, language: str | None = None, cache: TtsCache | None = None
+    ) -> AsyncTtsStream:
+        """
+        Synthesize audio and return as async iterator of bytes.
 
-    async def synthesize(self, *, text: str, voice: str, language: str | None = None) -> AsyncIterator[bytes]:
-        """Synthesize audio and return as async iterator of bytes."""
+        See :meth:`TtsClient.synthesize` for the ``cache``; the returned :class:`AsyncTtsStream`
+        can be cancelled and carries ``timings`` like the one of :meth:`stream`.
+        """
         self._validate_tts_params(text, voice, language)
+        timings = TtsTimings("/api/tts/synthesize")
+        return AsyncTtsStream(
+            lambda transfers: self._synthesize(text, voice, language, cache, transfers, timings), timings
+        )
 
-        try:
-            # Create authenticated HTTP client and make the streaming request
+    async def _pipeline(
+        self,
+        pieces: AsyncIterator[str],
+        voice: str,
+        language: str | None,
+        max_concurrency: int,
+        operation: str,
+        transfers: _Transfers,
+    ) -> AsyncIterator[bytes]:
+        """Render pieces concurrently, up to ``max_concurrency`` ahead, and yield their audio in order."""
+        headers = self._make_headers()
+        # One slot per piece rendering or waiting to be yielded
+        slots = asyncio.Semaphore(max_concurrency)
+        # Per-piece chunk queues in text order, then _DONE, or the error raised by ``pieces``
+        order: asyncio.Queue = asyncio.Queue()
+        tasks: list[asyncio.Task] = []
+
+        with _map_errors(operation):
             client = await create_async_authenticated_client(self._options, self._auth)
-            async with (
-                client as http_client,
-                http_client.stream(
+            async with client as http_client:
+
+                async def render(piece: str, out: asyncio.Queue) -> None:
+                    try:
+                        async with http_client.stream(
+                            "POST", "/api/tts/stream", json=self._make_payload(piece, voice, language), headers=headers
+                        ) as response:
+                            with transfers.track(response):
+                                response.raise_for_status()
+                                async for chunk in response.aiter_bytes():
+                                    out.put_nowait(chunk)
+                        out.put_nowait(_DONE)
+                    except Exception as exc:
+                        out.put_nowait(exc)
+
+                async def feed() -> None:
+                    try:
+                        async for piece in pieces:
+                            await slots.acquire()
+                            out: asyncio.Queue = asyncio.Queue()
+                            tasks.append(asyncio.create_task(render(piece, out)))
+                            order.put_nowait(out)
+                        order.put_nowait(_DONE)
+                    except Exception as exc:
+                        order.put_nowait(exc)
+
+                # The queue being waited on, which a cancel has to wake up too
+                current: list[asyncio.Queue] = []
+
+                def wake() -> None:
+                    order.put_nowait(_CANCELLED)
+                    for out in current:
+                        out.put_nowait(_CANCELLED)
+
+                transfers.on_abort(wake)
+                feeder = asyncio.create_task(feed())
+                try:
+                    while (out := await order.get()) is not _DONE:
+                        if out is _CANCELLED:
+                            return
+                        if isinstance(out, Exception):
+                            raise out
+                        current[:] = [out]
+                        if transfers.aborted:
+                            return
+                        while (item := await out.get()) is not _DONE:
+                            if item is _CANCELLED:
+                                return
+                            if isinstance(item, Exception):
+                                raise item
+                            yield item
+                        slots.release()
+                finally:
+                    for task in (feeder, *tasks):
+                        task.cancel()
+                    await asyncio.gather(feeder, *tasks, return_exceptions=True)
+
+    def stream_pipelined(
+        self,
+        *,
+        text: str,
+        voice: str,
+        language: str | None = None,
+        max_concurrency: int = DEFAULT_PIPELINE_CONCURRENCY,
+        max_chars: int = DEFAULT_MAX_CHARS,
+    ) -> AsyncTtsStream:
+        """
+        Stream synthesized audio for long text, rendering sentences in parallel (async).
+
+        See :meth:`TtsClient.stream_pipelined`; sentences render in tasks on the running loop.
+        """
+        self._validate_tts_params(text, voice, language)
+        self._validate_pipeline_params(max_concurrency, max_chars)
+
+        async def pieces() -> AsyncIterator[str]:
+            for piece in split_sentences(text, max_chars=max_chars):
+                yield piece
+
+        return AsyncTtsStream(
+            lambda transfers: self._pipeline(
+                pieces(), voice, language, max_concurrency, "async pipelined TTS streaming", transfers
+            )
+        )
+
+    async def _incremental_pieces(
+        self, text_iter: AsyncIterable[str] | Iterable[str], flush_timeout: float, max_chars: int
+    ) -> AsyncIterator[str]:
+        tokens: asyncio.Queue = asyncio.Queue()
+
+        async def read() -> None:
+            try:
+                if isinstance(text_iter, AsyncIterable):
+                    async for token in text_iter:
+                        tokens.put_nowait(token)
+                else:
+                    for token in text_iter:
+                        tokens.put_nowait(token)
+                tokens.put_nowait(_DONE)
+            except Exception as exc:
+                tokens.put_nowait(exc)
+
+        reader = asyncio.create_task(read())
+        buffer = SentenceBuffer(max_chars=max_chars)
+        loop = asyncio.get_running_loop()
+        deadline: float | None = None
+        try:
+            while True:
+                try:
+                    if deadline is None:
+                        token = await tokens.get()
+                    else:
+                        token = await asyncio.wait_for(tokens.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    # Nothing ended the sentence in time: speak the words so far
+                    if (piece := buffer.pop_words()) is not None:
+                        yield piece
+                    deadline = None
+                    continue
+                if token is _DONE:
+                    if (piece := buffer.flush()) is not None:
+                        yield piece
+                    return
+                if isinstance(token, Exception):
+                    raise token
+                for piece in buffer.push(token):
+                    yield piece
+                if not buffer.pending:
+                    deadline = None
+                elif deadline is None:
+                    deadline = loop.time() + flush_timeout
+        finally:
+            reader.cancel()
+
+    def stream_incremental(
+        self,
+        *,
+        text_iter: AsyncIterable[str] | Iterable[str],
+        voice: str,
+        language: str | None = None,
+        flush_timeout: float = DEFAULT_FLUSH_TIMEOUT,
+        max_concurrency: int = DEFAULT_PIPELINE_CONCURRENCY,
+        max_chars: int = DEFAULT_MAX_CHARS,
+    ) -> AsyncTtsStream:
+        """
+        Stream synthesized audio for text that is still being generated, e.g. LLM tokens (async).
+
+        See :meth:`TtsClient.stream_incremental`. ``text_iter`` may be an async iterable; a plain
+        iterable is read on the running loop, so it must not block.
+        """
+        self._validate_voice_params(voice, language)
+        self._validate_pipeline_params(max_concurrency, max_chars)
+        if flush_timeout <= 0:
+            raise AiolaValidationError("flush_timeout must be positive")
+        pieces = self._incremental_pieces(text_iter, flush_timeout, max_chars)
+        return AsyncTtsStream(
+            lambda transfers: self._pipeline(
+                pieces, voice, language, max_concurrency, "async incremental TTS streaming", transfers
+            )
+        )
+
+    async def _synthesize_item(self, client: httpx.AsyncClient, item: TtsItem, sink: TtsSink) -> TtsItemResult:
+        result = TtsItemResult(item)
+        start = time.perf_counter()
+        item_sink = None
+        try:
+            with _map_errors("async TTS synthesis"):
+                self._validate_tts_params(item.text, item.voice, item.language)
+                item_sink = _ItemSink(sink, item)
+                async with client.stream(
                     "POST",
                     "/api/tts/synthesize",
-                    json={
-                        "text": text,
-                        "voice": voice,
-                        "language": language,
-                    },
+                    json=self._make_payload(item.text, item.voice, item.language),
                     headers=self._make_headers(),
-                ) as response,
-            ):
-                response.raise_for_status()
-                async for chunk in response.aiter_bytes():
-                    yield chunk
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes():
+                        if result.first_byte_s is None:
+                            result.first_byte_s = time.perf_counter() - start
+                        item_sink.write(chunk)
+                        result.size += len(chunk)
+                item_sink.close()
+        except AiolaError as exc:
+            result.error = exc
+            if item_sink is not None:
+                item_sink.discard()
+        result.elapsed_s = time.perf_counter() - start
+        return result
 
-        except AiolaError:
-            raise
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 401:
-                raise AiolaAuthenticationError.from_response(exc.response) from exc
-            elif exc.response.status_code >= 500:
-                raise AiolaServerError.from_response(exc.response) from exc
-            else:
-                raise AiolaError.from_response(exc.response) from exc
-        except httpx.RequestError as exc:
-            raise AiolaConnectionError(f"Network error during async TTS synthesis: {str(exc)}") from exc
-        except Exception as exc:
-            raise AiolaError(f"Async TTS synthesis failed: {str(exc)}") from exc
+    async def synthesize_many(
+        self, items: Iterable[TtsItem], *, concurrency: int = DEFAULT_BULK_CONCURRENCY, sink: TtsSink = None
+    ) -> list[TtsItemResult]:
+        """
+        Synthesize many prompts over one connection pool (async).
+
+        See :meth:`TtsClient.synthesize_many`. Files returned by a sink function are written
+        from the running loop.
+        """
+        if concurrency < 1:
+            raise AiolaValidationError("concurrency must be at least 1")
+        slots = asyncio.Semaphore(concurrency)
+
+        with _map_errors("async bulk TTS synthesis"):
+            client = await create_async_authenticated_client(self._options, self._auth)
+            async with client as http_client:
+
+                async def run(item: TtsItem) -> TtsItemResult:
+                    async with slots:
+                        return await self._synthesize_item(http_client, item, sink)
+
+                return list(await asyncio.gather(*(run(item) for item in items)))
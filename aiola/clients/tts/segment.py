@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import re
+
+# End of a sentence: terminal punctuation, optional closing quotes or brackets, then whitespace.
+# CJK full stops are not followed by spaces.
+SENTENCE_END = re.compile(r"[。！？]+|[.!?…]+[\"'”’)\]]*(?:\s+|$)")
+# End of a clause, used to break sentences longer than the piece limit
+CLAUSE_END = re.compile(r"[,;:—、，；]+(?:\s+|$)")
+
+DEFAULT_MAX_CHARS = 250
+DEFAULT_MIN_CHARS = 20
+
+
+def _split_after(text: str, pattern: re.Pattern[str]) -> list[str]:
+    pieces = []
+    start = 0
+    for match in pattern.finditer(text):
+        pieces.append(text[start : match.end()].strip())
+        start = match.end()
+    pieces.append(text[start:].strip())
+    return [piece for piece in pieces if piece]
+
+
+def _split_words(text: str, max_chars: int) -> list[str]:
+    pieces: list[str] = []
+    current = ""
+    for word in text.split():
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_sentences(text: str, *, max_chars: int = DEFAULT_MAX_CHARS, min_chars: int = DEFAULT_MIN_CHARS) -> list[str]:
+    """
+    Split text into pieces that can be synthesized independently.
+
+    Text is split after each sentence. Sentences longer than ``max_chars`` are split at clause
+    boundaries, and then between words. Pieces shorter than ``min_chars`` are joined with the
+    next one, which keeps abbreviations such as "Dr." and short interjections from becoming
+    requests of their own.
+
+    Args:
+        text: The text to split
+        max_chars: Longest piece, in characters (default: 250)
+        min_chars: Shortest piece worth a request of its own, in characters (default: 20)
+
+    Returns:
+        The pieces, in order; joined with spaces they give back the text up to whitespace
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+
+    pieces: list[str] = []
+    for sentence in _split_after(text, SENTENCE_END):
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        for clause in _split_after(sentence, CLAUSE_END):
+            pieces.extend([clause] if len(clause) <= max_chars else _split_words(clause, max_chars))
+
+    merged: list[str] = []
+    for piece in pieces:
+        if merged and len(merged[-1]) < min_chars and len(merged[-1]) + 1 + len(piece) <= max_chars:
+            merged[-1] = f"{merged[-1]} {piece}"
+        else:
+            merged.append(piece)
+    return merged
+
+
+# Sentence end in streamed text: unless it is a CJK full stop, it counts once whitespace follows,
+# as the next token may still continue it ("3." followed by "5")
+_STREAM_SENTENCE_END = re.compile(r"[。！？]+|[.!?…]+[\"'”’)\]]*\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SentenceBuffer:
+    """
+    Collects text as it is generated, e.g. LLM tokens, and hands out pieces to synthesize.
+
+    :meth:`push` returns the pieces completed by the new text: each ends at a sentence boundary
+    and is at least ``min_chars`` long. Text running past ``max_chars`` without one is cut at a
+    clause boundary or between words. :meth:`pop_words` takes whatever complete words are
+    pending, for when waiting for the end of the sentence would take too long, and
+    :meth:`flush` takes the rest at the end of the text.
+    """
+
+    def __init__(self, *, max_chars: int = DEFAULT_MAX_CHARS, min_chars: int = DEFAULT_MIN_CHARS) -> None:
+        if max_chars <= 0:
+            raise ValueError("max_chars must be positive")
+        self.max_chars = max_chars
+        self.min_chars = min_chars
+        self._text = ""
+
+    @property
+    def pending(self) -> bool:
+        """``True`` while there is text that has not been handed out."""
+        return bool(self._text.strip())
+
+    def _take(self, end: int) -> str:
+        piece, self._text = self._text[:end].strip(), self._text[end:].lstrip()
+        return piece
+
+    def _next_piece(self) -> str | None:
+        for match in _STREAM_SENTENCE_END.finditer(self._text):
+            if match.end() > self.max_chars:
+                break
+            if len(self._text[: match.end()].strip()) >= self.min_chars:
+                return self._take(match.end())
+        if len(self._text) <= self.max_chars:
+            return None
+        head = self._text[: self.max_chars + 1]
+        for pattern in (CLAUSE_END, _WHITESPACE):
+            ends = [match.end() for match in pattern.finditer(head) if match.end() <= self.max_chars]
+            if ends and self._text[: ends[-1]].strip():
+                return self._take(ends[-1])
+        return self._take(self.max_chars)
+
+    def push(self, text: str) -> list[str]:
+        """Add text and return the pieces it completes, in order."""
+        self._text += text
+        pieces = []
+        while (piece := self._next_piece()) is not None:
+            if piece:
+                pieces.append(piece)
+        return pieces
+
+    def pop_words(self) -> str | None:
+        """Take the pending text up to the last word boundary, if there is one."""
+        ends = [match.start() for match in _WHITESPACE.finditer(self._text) if self._text[: match.start()].strip()]
+        return self._take(ends[-1]) if ends else None
+
+    def flush(self) -> str | None:
+        """Take all pending text."""
+        return self._take(len(self._text)) or None
@@ -0,0 +1,508 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Any, BinaryIO, Union
+
+import httpx
+
+from ...audio.decode import PcmDecoder
+from ...audio.framing import FrameChunker
+from ...audio.transcode import TELEPHONY_SAMPLE_RATE, AudioTranscoder
+from ...audio.wav import WAVE_FORMAT_ALAW, WAVE_FORMAT_MULAW, WAVE_FORMAT_PCM, WavInfo, WavStreamParser
+from ...errors import AiolaValidationError
+from ...types import TtsTimings
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Where stream_into writes: a growing bytearray, a fixed writable buffer, a file descriptor or a binary file
+StreamTarget = Union[bytearray, memoryview, int, BinaryIO, Any]
+
+# Frame duration of TtsStream.frames, in milliseconds
+DEFAULT_FRAME_MS = 20
+
+
+def _abort(response: httpx.Response) -> None:
+    """Interrupt a transfer, including a read blocked in another thread."""
+    network_stream = response.extensions.get("network_stream")
+    sock = network_stream.get_extra_info("socket") if network_stream is not None else None
+    if sock is not None:
+        # Unlike close(), shutdown() wakes a thread blocked in recv() on the socket
+        with suppress(OSError):
+            sock.shutdown(socket.SHUT_RDWR)
+
+
+class _Transfers:
+    """Responses being read on behalf of one :class:`TtsStream`, so they can be aborted together."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._open: set[httpx.Response] = set()
+        # Called on abort, to wake up waits that no response would end
+        self._wakers: list[Callable[[], None]] = []
+        self.aborted = False
+
+    def on_abort(self, waker: Callable[[], None]) -> None:
+        """Call ``waker`` when the transfers are aborted, or right away if they already were."""
+        with self._lock:
+            aborted = self.aborted
+            if not aborted:
+                self._wakers.append(waker)
+        if aborted:
+            waker()
+
+    @contextmanager
+    def track(self, response: httpx.Response) -> Iterator[None]:
+        with self._lock:
+            self._open.add(response)
+            aborted = self.aborted
+        if aborted:
+            _abort(response)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._open.discard(response)
+
+    def abort(self) -> None:
+        with self._lock:
+            self.aborted = True
+            responses = list(self._open)
+            wakers, self._wakers = self._wakers, []
+        for response in responses:
+            _abort(response)
+        for waker in wakers:
+            waker()
+
+
+class _Framer:
+    """Turns audio chunks into frames of ``frame_ms``, taking the format from a WAV header if there is one."""
+
+    def __init__(self, frame_ms: float, sample_rate: int | None, sample_width: int, channels: int, pad: bool) -> None:
+        self._frame_ms = frame_ms
+        self._format = (sample_rate, sample_width, channels)
+        self._pad = pad
+        self._fill = b"\0"
+        self.parser = WavStreamParser()
+        self._chunker: FrameChunker | None = None
+
+    def _start(self) -> FrameChunker:
+        info = self.parser.info
+        if info is not None:
+            sample_rate, sample_width, channels = info.sample_rate, info.block_align // info.channels, info.channels
+            if info.format_tag == WAVE_FORMAT_PCM and sample_width == 1:
+                self._fill = b"\x80"
+            elif info.format_tag == WAVE_FORMAT_MULAW:
+                self._fill = b"\xff"
+            elif info.format_tag == WAVE_FORMAT_ALAW:
+                self._fill = b"\xd5"
+        else:
+            sample_rate, sample_width, channels = self._format
+            if sample_rate is None:
+                raise AiolaValidationError("sample_rate is required for audio without a WAV header")
+        self._chunker = FrameChunker(
+            self._frame_ms, sample_rate=sample_rate, sample_width=sample_width, channels=channels
+        )
+        return self._chunker
+
+    def push(self, chunk: bytes) -> list[memoryview]:
+        payload = self.parser.push(chunk)
+        if not len(payload):
+            return []
+        return (self._chunker or self._start()).push(payload)
+
+    def finish(self) -> list[memoryview]:
+        tail = self.parser.flush()
+        frames = (self._chunker or self._start()).push(tail) if len(tail) else []
+        if self._chunker is not None and (rest := self._chunker.flush()):
+            if self._pad:
+                rest += self._fill * (self._chunker.frame_bytes - len(rest))
+            frames.append(memoryview(rest))
+        return frames
+
+
+def _decoder(info: WavInfo | None, dtype: str | None, sample_width: int, channels: int) -> PcmDecoder:
+    try:
+        if info is not None:
+            return PcmDecoder.from_wav_info(info, dtype)
+        return PcmDecoder(sample_width=sample_width, channels=channels, dtype=dtype)
+    except ValueError as exc:
+        raise AiolaValidationError(str(exc)) from exc
+
+
+def _transcoder(encoding: str, sample_rate: int, input_sample_rate: int | None) -> AudioTranscoder:
+    try:
+        return AudioTranscoder(encoding, sample_rate=sample_rate, input_sample_rate=input_sample_rate)
+    except ValueError as exc:
+        raise AiolaValidationError(str(exc)) from exc
+
+
+def _write_all(fd: int, data: memoryview) -> None:
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+class TtsStream:
+    """
+    Audio of a TTS request, as an iterator of byte chunks that can be cancelled.
+
+    Breaking out of a loop leaves the request open until the stream is garbage collected; call
+    :meth:`cancel` or :meth:`close`, or use the stream as a context manager, to end it right
+    away. :meth:`cancel` may be called from any thread: a read in progress is interrupted and
+    the iterating thread stops without raising. The connection and the per-request client are
+    closed once the stream stops; a partly read response cannot be reused.
+    """
+
+    def __init__(self, open_chunks: Callable[[_Transfers], Iterator[bytes]], timings: TtsTimings | None = None) -> None:
+        self._transfers = _Transfers()
+        self._chunks = open_chunks(self._transfers)
+        # Held while the request code runs in the iterating thread
+        self._lock = threading.Lock()
+        self._finished = False
+        # Part of a chunk not yet handed out by readinto
+        self._leftover = memoryview(b"")
+        self.cancelled = False
+        self.bytes_received = 0
+        self.wav_info: WavInfo | None = None
+        # Timings of the underlying request, for the methods that make a single one
+        self.timings = timings
+
+    def __iter__(self) -> TtsStream:
+        return self
+
+    def __next__(self) -> bytes:
+        if self._leftover:
+            chunk, self._leftover = bytes(self._leftover), memoryview(b"")
+            return chunk
+        with self._lock:
+            if self.cancelled or self._finished:
+                self._chunks.close()
+                raise StopIteration
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._finished = True
+                raise
+            except Exception:
+                if not self.cancelled:
+                    self._finished = True
+                    raise
+                # The error is the aborted transfer
+                raise StopIteration from None
+            if self.cancelled:
+                self._chunks.close()
+                raise StopIteration
+            self.bytes_received += len(chunk)
+            return chunk
+
+    def __enter__(self) -> TtsStream:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def finished(self) -> bool:
+        """``True`` once all audio was received, or the request failed."""
+        return self._finished
+
+    def cancel(self) -> None:
+        """Abort the request; safe to call from any thread."""
+        if self._finished:
+            return
+        self.cancelled = True
+        self._transfers.abort()
+        if self._lock.acquire(blocking=False):
+            # Not being iterated: release everything now
+            try:
+                self._chunks.close()
+            finally:
+                self._lock.release()
+
+    def close(self) -> None:
+        """Release the request; cancels it if audio is still outstanding."""
+        self.cancel()
+
+    def frames(
+        self,
+        frame_ms: float = DEFAULT_FRAME_MS,
+        *,
+        sample_rate: int | None = None,
+        sample_width: int = 2,
+        channels: int = 1,
+        pad: bool = True,
+    ) -> Iterator[memoryview]:
+        """
+        Iterate over the audio in frames of exactly ``frame_ms``, e.g. for playback.
+
+        If the audio starts with a WAV header, it is parsed once, kept in :attr:`wav_info` and
+        not yielded, and the frame format is taken from it; raw PCM needs ``sample_rate``.
+        Frames within a chunk are views of it, and only frames spanning two chunks are copied.
+        With ``pad``, the last frame is completed with silence.
+        """
+        framer = _Framer(frame_ms, sample_rate, sample_width, channels, pad)
+        for chunk in self:
+            frames = framer.push(chunk)
+            self.wav_info = framer.parser.info
+            yield from frames
+        yield from framer.finish()
+
+    def pcm(
+        self,
+        frame_ms: float = DEFAULT_FRAME_MS,
+        *,
+        dtype: str | None = None,
+        sample_rate: int | None = None,
+        sample_width: int = 2,
+        channels: int = 1,
+        pad: bool = True,
+    ) -> Iterator[np.ndarray]:
+        """
+        Iterate over the audio as NumPy arrays of shape ``(samples, channels)``, one per frame.
+
+        Frames are cut as by :meth:`frames`. Without a ``dtype`` each array is a read-only view
+        of the received bytes in their stored sample type; ``"float32"``, ``"float64"``,
+        ``"int16"`` or ``"int32"`` convert them, see :class:`~aiola.audio.PcmDecoder`.
+        Requires numpy.
+        """
+        decoder = None
+        frames = self.frames(frame_ms, sample_rate=sample_rate, sample_width=sample_width, channels=channels, pad=pad)
+        for frame in frames:
+            if decoder is None:
+                decoder = _decoder(self.wav_info, dtype, sample_width, channels)
+            yield decoder.decode(frame)
+
+    def transcode(
+        self,
+        encoding: str = "mulaw",
+        *,
+        sample_rate: int = TELEPHONY_SAMPLE_RATE,
+        input_sample_rate: int | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the audio converted to headerless ``encoding`` at ``sample_rate``.
+
+        The defaults give 8 kHz mu-law for telephony; ``"alaw"`` and ``"pcm16"`` are also
+        supported. The format of the received audio is taken from its WAV header, or it is
+        16-bit PCM at ``input_sample_rate``. See :class:`~aiola.audio.AudioTranscoder`.
+        Requires numpy.
+        """
+        transcoder = _transcoder(encoding, sample_rate, input_sample_rate)
+        for chunk in self:
+            if output := transcoder.push(chunk):
+                yield output
+        if output := transcoder.flush():
+            yield output
+
+    def readinto(self, buffer: Any) -> int:
+        """
+        Fill a writable buffer with the next audio bytes and return how many were written.
+
+        Returns less than the buffer size only at the end of the audio; 0 once it is done.
+        """
+        target = memoryview(buffer).cast("B")
+        written = 0
+        while written < len(target):
+            if not self._leftover:
+                try:
+                    self._leftover = memoryview(next(self))
+                except StopIteration:
+                    break
+            size = min(len(self._leftover), len(target) - written)
+            target[written : written + size] = self._leftover[:size]
+            self._leftover = self._leftover[size:]
+            written += size
+        return written
+
+    def stream_into(self, target: StreamTarget) -> int:
+        """
+        Write the rest of the audio to ``target`` and return the number of bytes written.
+
+        A ``bytearray`` is extended, a file descriptor or an object with ``write`` receives the
+        chunks as they arrive, and any other writable buffer, such as a ``memoryview``, is filled
+        from its start as by :meth:`readinto`, leaving what doesn't fit for the next read.
+        """
+        if not isinstance(target, (bytearray, int)) and not hasattr(target, "write"):
+            return self.readinto(target)
+        written = 0
+        for chunk in self:
+            if isinstance(target, bytearray):
+                target += chunk
+            elif isinstance(target, int):
+                _write_all(target, memoryview(chunk))
+            else:
+                target.write(chunk)
+            written += len(chunk)
+        return written
+
+
+class AsyncTtsStream:
+    """
+    Audio of a TTS request, as an async iterator of byte chunks that can be cancelled.
+
+    See :class:`TtsStream`. :meth:`cancel` may be called from any task on the loop: a read in
+    progress is interrupted by aborting its transfer, and the iterating task stops without
+    raising. Await :meth:`aclose` to also wait until the request has been torn down.
+    """
+
+    def __init__(
+        self, open_chunks: Callable[[_Transfers], AsyncIterator[bytes]], timings: TtsTimings | None = None
+    ) -> None:
+        self._transfers = _Transfers()
+        self._chunks = open_chunks(self._transfers)
+        # Set while no read is in progress, so aclose can wait for the reading task to stop
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._finished = False
+        # Part of a chunk not yet handed out by readinto
+        self._leftover = memoryview(b"")
+        self.cancelled = False
+        self.bytes_received = 0
+        self.wav_info: WavInfo | None = None
+        # Timings of the underlying request, for the methods that make a single one
+        self.timings = timings
+
+    def __aiter__(self) -> AsyncTtsStream:
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self._leftover:
+            chunk, self._leftover = bytes(self._leftover), memoryview(b"")
+            return chunk
+        if self.cancelled or self._finished:
+            raise StopAsyncIteration
+        self._idle.clear()
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._finished = True
+            raise
+        except Exception:
+            if not self.cancelled:
+                self._finished = True
+                raise
+            # The error is the aborted transfer
+            raise StopAsyncIteration from None
+        finally:
+            self._idle.set()
+        if self.cancelled:
+            raise StopAsyncIteration
+        self.bytes_received += len(chunk)
+        return chunk
+
+    async def __aenter__(self) -> AsyncTtsStream:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    @property
+    def finished(self) -> bool:
+        """``True`` once all audio was received, or the request failed."""
+        return self._finished
+
+    def cancel(self) -> None:
+        """Abort the request without waiting for it to be torn down."""
+        if self._finished:
+            return
+        self.cancelled = True
+        self._transfers.abort()
+
+    async def aclose(self) -> None:
+        """Release the request, cancelling it if audio is still outstanding, and wait until it is."""
+        self.cancel()
+        # A read in progress ends the request in its own task
+        await self._idle.wait()
+        await self._chunks.aclose()  # type: ignore[attr-defined]
+
+    async def frames(
+        self,
+        frame_ms: float = DEFAULT_FRAME_MS,
+        *,
+        sample_rate: int | None = None,
+        sample_width: int = 2,
+        channels: int = 1,
+        pad: bool = True,
+    ) -> AsyncIterator[memoryview]:
+        """Iterate over the audio in frames of exactly ``frame_ms``; see :meth:`TtsStream.frames`."""
+        framer = _Framer(frame_ms, sample_rate, sample_width, channels, pad)
+        async for chunk in self:
+            frames = framer.push(chunk)
+            self.wav_info = framer.parser.info
+            for frame in frames:
+                yield frame
+        for frame in framer.finish():
+            yield frame
+
+    async def pcm(
+        self,
+        frame_ms: float = DEFAULT_FRAME_MS,
+        *,
+        dtype: str | None = None,
+        sample_rate: int | None = None,
+        sample_width: int = 2,
+        channels: int = 1,
+        pad: bool = True,
+    ) -> AsyncIterator[np.ndarray]:
+        """Iterate over the audio as NumPy arrays, one per frame; see :meth:`TtsStream.pcm`."""
+        decoder = None
+        frames = self.frames(frame_ms, sample_rate=sample_rate, sample_width=sample_width, channels=channels, pad=pad)
+        async for frame in frames:
+            if decoder is None:
+                decoder = _decoder(self.wav_info, dtype, sample_width, channels)
+            yield decoder.decode(frame)
+
+    async def transcode(
+        self,
+        encoding: str = "mulaw",
+        *,
+        sample_rate: int = TELEPHONY_SAMPLE_RATE,
+        input_sample_rate: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the audio converted to another encoding; see :meth:`TtsStream.transcode`."""
+        transcoder = _transcoder(encoding, sample_rate, input_sample_rate)
+        async for chunk in self:
+            if output := transcoder.push(chunk):
+                yield output
+        if output := transcoder.flush():
+            yield output
+
+    async def readinto(self, buffer: Any) -> int:
+        """Fill a writable buffer with the next audio bytes; see :meth:`TtsStream.readinto`."""
+        target = memoryview(buffer).cast("B")
+        written = 0
+        while written < len(target):
+            if not self._leftover:
+                try:
+                    self._leftover = memoryview(await self.__anext__())
+                except StopAsyncIteration:
+                    break
+            size = min(len(self._leftover), len(target) - written)
+            target[written : written + size] = self._leftover[:size]
+            self._leftover = self._leftover[size:]
+            written += size
+        return written
+
+    async def stream_into(self, target: StreamTarget) -> int:
+        """
+        Write the rest of the audio to ``target``; see :meth:`TtsStream.stream_into`.
+
+        Writes to files and file descriptors happen on the running loop.
+        """
+        if not isinstance(target, (bytearray, int)) and not hasattr(target, "write"):
+            return await self.readinto(target)
+        written = 0
+        async for chunk in self:
+            if isinstance(target, bytearray):
+                target += chunk
+            elif isinstance(target, int):
+                _write_all(target, memoryview(chunk))
+            else:
+                target.write(chunk)
+            written += len(chunk)
+        return written
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import queue
-import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
+from .audio.source import MAX_BUFFER_MS, AudioSource
+
 try:
     import numpy as np
     import sounddevice as sd
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
     import numpy as np
     import sounddevice as sd
 
+    from .audio.meter import LevelMeter
+
 # Default values for microphone stream
 CHANNELS = 1
 SAMPLE_RATE = 16000
@@ -25,12 +27,14 @@ BLOCK_SIZE = 4096
 DTYPE = "int16"
 
 
-class MicrophoneStream:
+class MicrophoneStream(AudioSource):
     """
     A microphone stream class that handles audio capture from the microphone
     and provides a simple interface for streaming audio data.
     """
 
+    _name = "Microphone stream"
+
     def __init__(
         self,
         channels: int = CHANNELS,
@@ -38,6 +42,9 @@ class MicrophoneStream:
         blocksize: int = BLOCK_SIZE,
         dtype: str = DTYPE,
         device: int | None = None,
+        max_buffer_ms: float = MAX_BUFFER_MS,
+        meter: LevelMeter | None = None,
+        preroll_ms: float | None = None,
     ):
         """
         Initialize the microphone stream.
@@ -48,6 +55,15 @@ class MicrophoneStream:
             blocksize: Number of frames per buffer (default: 4096)
             dtype: Audio data type (default: "int16")
             device: Index of the input device to use (default: None for default device)
+            max_buffer_ms: Most unread audio to keep, in milliseconds (default: 2000). When the
+                consumer falls further behind, the oldest audio is dropped and counted in
+                ``overflows``, which bounds both memory use and latency.
+            meter: Optional ``aiola.audio.LevelMeter`` updated with every captured block, for
+                monitoring levels and clipping from another thread
+            preroll_ms: Audio captured before ``stream_to`` is called that is sent first, in
+                milliseconds (default: None for everything still buffered). Start the stream
+                once and call :meth:`detach` after each utterance; the next ``stream_to``
+                begins with the pre-roll, so triggered speech keeps its first syllables.
         """
         if sd is None or np is None:
             raise ImportError(
@@ -56,42 +72,26 @@ class MicrophoneStream:
                 "Note: This also requires system PortAudio libraries."
             )
 
-        self.channels = channels
-        self.samplerate = samplerate
-        self.blocksize = blocksize
-        self.dtype = dtype
+        super().__init__(
+            channels=channels,
+            samplerate=samplerate,
+            blocksize=blocksize,
+            dtype=dtype,
+            max_buffer_ms=max_buffer_ms,
+            meter=meter,
+            preroll_ms=preroll_ms,
+        )
         self.device = device
-
         self._stream: Any | None = None
-        self._is_recording = False
-        self._thread: threading.Thread | None = None
-        self._audio_queue: queue.Queue[bytes] = queue.Queue()
-        self._on_audio_callback: Callable[[bytes], None] | None = None
-        self._on_error_callback: Callable[[Exception], None] | None = None
-
-    def __enter__(self):
-        """Context manager entry."""
-        self.start()
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.stop()
 
     def _audio_callback(self, indata: Any, frames: int, time: Any, status: Any) -> None:
         """Internal callback for sounddevice stream."""
-        if status and self._on_error_callback:
-            self._on_error_callback(Exception(f"Audio callback status: {status}"))
+        if status:
+            self._report_error(Exception(f"Audio callback status: {status}"))
 
-        # Convert numpy array to bytes
-        audio_bytes = indata.astype(self.dtype).tobytes()
-        self._audio_queue.put(audio_bytes)
-
-    def start(self) -> None:
-        """Start the microphone stream."""
-        if self._is_recording:
-            return
+        self._deliver(indata)
 
+    def _open(self) -> None:
         self._stream = sd.InputStream(
             device=self.device,
             channels=self.channels,
@@ -101,171 +101,223 @@ class MicrophoneStream:
             callback=self._audio_callback,
         )
         self._stream.start()
-        self._is_recording = True
-
-    def stop(self) -> None:
-        """Stop the microphone stream."""
-        if not self._is_recording:
-            return
-
-        self._is_recording = False
-
-        if self._thread and self._thread.is_alive():
-            self._thread.join()
 
+    def _close(self) -> None:
         if self._stream:
             self._stream.stop()
             self._stream.close()
             self._stream = None
 
-        # Clear the audio queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+    @classmethod
+    def list_devices(cls) -> list[dict]:
+        """
+        List available audio input devices.
 
-    def read(self, timeout: float | None = None) -> bytes:
+        Returns:
+            List of dictionaries containing device information
         """
-        Read audio data from the microphone.
+        if sd is None:
+            raise ImportError(
+                "sounddevice is required for microphone functionality. "
+                "Install it with: pip install 'aiola[mic]'\n"
+                "Note: This also requires system PortAudio libraries."
+            )
 
-        Args:
-            timeout: Timeout in seconds to wait for audio data (default: None for blocking)
+        devices = []
+        device_list = sd.query_devices()
 
-        Returns:
-            Audio data as bytes
+        for i, device_info in enumerate(device_list):
+            if device_info["max_input_channels"] > 0:
+                devices.append(
+                    {
+                        "index": i,
+                        "name": device_info["name"],
+                        "channels": device_info["max_input_channels"],
+                        "sample_rate": device_info["default_samplerate"],
+                        "hostapi": device_info["hostapi"],
+                    }
+                )
 
-        Raises:
-            RuntimeError: If the stream is not started
-            queue.Empty: If timeout is reached
-        """
-        if not self._is_recording or not self._stream:
-            raise RuntimeError("Microphone stream is not started")
+        return devices
 
-        return self._audio_queue.get(timeout=timeout)
 
-    def stream_to(
+class ChannelStream(AudioSource):
+    """
+    One channel of a :class:`MultiChannelMicrophoneStream`.
+
+    Each channel has its own buffer, consumer and ``overflows``/``underflows``/``lag_ms``
+    counters, so a slow connection on one channel never holds up the others. Assign a
+    ``LevelMeter`` to ``meter`` to monitor the channel's level. The device itself
+    is opened and closed by the parent stream.
+    """
+
+    _name = "Channel stream"
+
+    def __init__(self, index: int, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.index = index
+
+    def _open(self) -> None:
+        pass
+
+    def _close(self) -> None:
+        pass
+
+
+class MultiChannelMicrophoneStream:
+    """
+    Captures several channels of one input device with a single PortAudio stream and splits
+    them into independent mono :class:`ChannelStream` objects.
+
+    Channels are de-interleaved with strided NumPy views of the device buffer, so the only copy
+    is the one into each channel's ring buffer.
+    """
+
+    def __init__(
         self,
-        connection: Any,
-        on_error: Callable[[Exception], None] | None = None,
-    ) -> None:
+        channels: int,
+        samplerate: int = SAMPLE_RATE,
+        blocksize: int = BLOCK_SIZE,
+        dtype: str = DTYPE,
+        device: int | None = None,
+        max_buffer_ms: float = MAX_BUFFER_MS,
+    ):
         """
-        Stream audio data to a connection (e.g., STT streaming connection).
+        Initialize the multi-channel microphone stream.
 
         Args:
-            connection: The connection object to send audio data to
-            on_error: Optional callback for handling errors
-
-        Raises:
-            RuntimeError: If the stream is not started
+            channels: Number of device channels to capture
+            samplerate: Sample rate in Hz (default: 16000)
+            blocksize: Number of frames per buffer (default: 4096)
+            dtype: Audio data type (default: "int16")
+            device: Index of the input device to use (default: None for default device)
+            max_buffer_ms: Most unread audio to keep per channel, in milliseconds (default: 2000)
         """
-        if not self._is_recording:
-            raise RuntimeError("Microphone stream is not started")
+        if sd is None or np is None:
+            raise ImportError(
+                "sounddevice and numpy are required for microphone functionality. "
+                "Install them with: pip install 'aiola[mic]'\n"
+                "Note: This also requires system PortAudio libraries."
+            )
+        if channels <= 0:
+            raise ValueError("channels must be positive")
 
-        self._on_error_callback = on_error
+        self.channels = channels
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.dtype = dtype
+        self.device = device
+
+        self.streams = [
+            ChannelStream(
+                index,
+                channels=1,
+                samplerate=samplerate,
+                blocksize=blocksize,
+                dtype=dtype,
+                max_buffer_ms=max_buffer_ms,
+            )
+            for index in range(channels)
+        ]
+        self._stream: Any | None = None
+        self._on_error_callback: Callable[[Exception], None] | None = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.stop()
+
+    def __getitem__(self, index: int) -> ChannelStream:
+        return self.streams[index]
+
+    def __len__(self) -> int:
+        return len(self.streams)
+
+    def __iter__(self) -> Iterator[ChannelStream]:
+        return iter(self.streams)
+
+    def _audio_callback(self, indata: Any, frames: int, time: Any, status: Any) -> None:
+        """Internal callback for sounddevice stream."""
+        if status and self._on_error_callback:
+            self._on_error_callback(Exception(f"Audio callback status: {status}"))
+
+        for index, stream in enumerate(self.streams):
+            # A (frames, 1) strided view of one channel; no copy until the ring write
+            stream._deliver(indata[:, index : index + 1])
+
+    def start(self) -> None:
+        """Open the device and start every channel."""
+        if self._stream is not None:
+            return
 
-        def _stream_worker():
+        for stream in self.streams:
+            stream.start()
+        try:
+            device_stream = sd.InputStream(
+                device=self.device,
+                channels=self.channels,
+                samplerate=self.samplerate,
+                blocksize=self.blocksize,
+                dtype=self.dtype,
+                callback=self._audio_callback,
+            )
             try:
-                while self._is_recording:
-                    try:
-                        audio_data = self.read(timeout=0.1)
-                        # Check if connection is still active before sending
-                        if hasattr(connection, "connected") and not connection.connected:
-                            break
-                        connection.send(audio_data)
-                    except queue.Empty:
-                        continue
-                    except Exception as e:
-                        if self._on_error_callback:
-                            self._on_error_callback(e)
-                        else:
-                            raise
-            except Exception as e:
-                if self._on_error_callback:
-                    self._on_error_callback(e)
-                else:
-                    raise
-
-        self._thread = threading.Thread(target=_stream_worker, daemon=True)
-        self._thread.start()
-
-    def stream_with_callback(
+                device_stream.start()
+            except Exception:
+                device_stream.close()
+                raise
+        except Exception:
+            # The device could not be opened; leave no channel running
+            for stream in self.streams:
+                stream.stop()
+            raise
+        self._stream = device_stream
+
+    def stop(self) -> None:
+        """Stop every channel and close the device."""
+        if self._stream is None:
+            return
+
+        self._stream.stop()
+        self._stream.close()
+        self._stream = None
+        for stream in self.streams:
+            stream.stop()
+
+    def stream_to(
         self,
-        callback: Callable[[bytes], None],
+        connections: Sequence[Any] | Mapping[int, Any],
         on_error: Callable[[Exception], None] | None = None,
+        frame_ms: float | None = None,
     ) -> None:
         """
-        Stream audio data to a callback function.
+        Stream each channel to its own connection.
+
+        Every channel gets its own worker thread, so connections are fed independently.
 
         Args:
-            callback: Function to call with audio data
+            connections: One connection per channel, or a mapping of channel index to
+                connection; channels without a connection (or mapped to ``None``) are not sent
             on_error: Optional callback for handling errors
+            frame_ms: Optional frame duration in milliseconds to re-chunk each channel into
 
         Raises:
             RuntimeError: If the stream is not started
         """
-        if not self._is_recording:
+        if self._stream is None:
             raise RuntimeError("Microphone stream is not started")
 
-        self._on_audio_callback = callback
         self._on_error_callback = on_error
-
-        def _stream_worker():
-            try:
-                while self._is_recording:
-                    try:
-                        audio_data = self.read(timeout=0.1)
-                        if self._on_audio_callback:
-                            self._on_audio_callback(audio_data)
-                    except queue.Empty:
-                        continue
-                    except Exception as e:
-                        if self._on_error_callback:
-                            self._on_error_callback(e)
-                        else:
-                            raise
-            except Exception as e:
-                if self._on_error_callback:
-                    self._on_error_callback(e)
-                else:
-                    raise
-
-        self._thread = threading.Thread(target=_stream_worker, daemon=True)
-        self._thread.start()
+        routes = connections.items() if isinstance(connections, Mapping) else enumerate(connections)
+        for index, connection in routes:
+            if connection is not None:
+                self.streams[index].stream_to(connection, on_error=on_error, frame_ms=frame_ms)
 
     @property
     def is_recording(self) -> bool:
         """Check if the microphone is currently recording."""
-        return self._is_recording
-
-    @classmethod
-    def list_devices(cls) -> list[dict]:
-        """
-        List available audio input devices.
-
-        Returns:
-            List of dictionaries containing device information
-        """
-        if sd is None:
-            raise ImportError(
-                "sounddevice is required for microphone functionality. "
-                "Install it with: pip install 'aiola[mic]'\n"
-                "Note: This also requires system PortAudio libraries."
-            )
-
-        devices = []
-        device_list = sd.query_devices()
-
-        for i, device_info in enumerate(device_list):
-            if device_info["max_input_channels"] > 0:
-                devices.append(
-                    {
-                        "index": i,
-                        "name": device_info["name"],
-                        "channels": device_info["max_input_channels"],
-                        "sample_rate": device_info["default_samplerate"],
-                        "hostapi": device_info["hostapi"],
-                    }
-                )
-
-        return devices
+        return self._stream is not None
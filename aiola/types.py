@@ -52,6 +52,22 @@ class LiveEvents(str, enum.Enum):
     Connect = "connect"
 
 
+class OverflowPolicy(str, enum.Enum):
+    """What an event queue does when it is full."""
+
+    Block = "block"  # Wait for the consumer, pausing the socket receive loop
+    DropOldest = "drop_oldest"
+    DropNewest = "drop_newest"
+
+
+@dataclass
+class StreamEvent:
+    """An event received on a stream connection."""
+
+    type: LiveEvents
+    data: Any = None
+
+
 @dataclass
 class Segment:
     start: float
@@ -148,6 +164,102 @@ class VadConfig:
     max_segment_ms: float | None = None
 
 
+@dataclass
+class ReplayConfig:
+    """Configuration for replaying audio across streaming reconnects.
+
+    ``history_ms`` of the most recently sent audio is kept and re-sent after the socket
+    reconnects, followed by up to ``max_pending_ms`` of audio passed to ``send`` while the
+    connection was down. The audio format fields are only used to convert durations to bytes.
+    """
+
+    enabled: bool = True
+    history_ms: int = 2000
+    max_pending_ms: int = 30000
+    sample_rate: int = 16000
+    sample_width: int = 2
+    channels: int = 1
+    dedupe_transcripts: bool = True
+    dedupe_window_s: float = 10.0
+
+    def __post_init__(self) -> None:
+        if self.history_ms < 0 or self.max_pending_ms < 0:
+            raise ValueError("Replay durations must be non-negative")
+        if self.sample_rate <= 0 or self.sample_width <= 0 or self.channels <= 0:
+            raise ValueError("Replay audio format values must be positive")
+
+    @property
+    def bytes_per_ms(self) -> float:
+        return self.sample_rate * self.sample_width * self.channels / 1000
+
+
+@dataclass
+class ReplayStats:
+    """Counters describing audio replay activity on a stream connection."""
+
+    reconnects: int = 0
+    buffered_bytes: int = 0
+    replayed_bytes: int = 0
+    dropped_bytes: int = 0
+    duplicates_suppressed: int = 0
+
+
+@dataclass
+class HandlerMetrics:
+    """Latency counters for the event handlers of a stream connection."""
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    max_queue_delay_seconds: float = 0.0
+    pending: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def record(self, duration: float, queue_delay: float = 0.0) -> None:
+        self.calls += 1
+        self.total_seconds += duration
+        self.max_seconds = max(self.max_seconds, duration)
+        self.max_queue_delay_seconds = max(self.max_queue_delay_seconds, queue_delay)
+
+
+@dataclass
+class TtsTimings:
+    """Where the time of one TTS request went.
+
+    Times are in seconds from the start of the request and stay ``None`` for steps that didn't
+    happen: ``token_s`` once the access token is resolved, ``connected_s`` once a connection is
+    ready to send on (``new_connection`` tells whether one was opened), ``request_sent_s`` once
+    the request body is sent, ``response_s`` once the response headers arrived, and
+    ``first_byte_s``/``last_byte_s`` for the first and latest chunk of audio. ``cancelled`` is
+    set when the stream was cancelled or closed before the audio ended.
+    """
+
+    path: str
+    token_s: float | None = None
+    connected_s: float | None = None
+    new_connection: bool = False
+    request_sent_s: float | None = None
+    response_s: float | None = None
+    first_byte_s: float | None = None
+    last_byte_s: float | None = None
+    bytes_received: int = 0
+    status_code: int | None = None
+    completed: bool = False
+    cancelled: bool = False
+    error: Exception | None = None
+
+    @property
+    def bytes_per_s(self) -> float | None:
+        """Transfer rate of the audio, from its first to its last byte."""
+        if self.first_byte_s is None or self.last_byte_s is None or self.last_byte_s <= self.first_byte_s:
+            return None
+        return self.bytes_received / (self.last_byte_s - self.first_byte_s)
+
+
 FileContent = Union[IO[bytes], bytes, str]
 File = Union[
     # file (or bytes)
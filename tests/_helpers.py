@@ -1,3 +1,6 @@
+import socket
+import threading
+import time
 from typing import AsyncIterator, Iterator
 
 
@@ -63,6 +66,8 @@ class DummyResponse:
     def __init__(self, chunks: list[bytes], json_data: dict | None = None):
         self._chunks = chunks
         self._json_data = json_data or {}
+        self.extensions: dict = {}
+        self.status_code = 200
 
     # Synchronous iterator – mirrors *iter_bytes* API
     def iter_bytes(self) -> Iterator[bytes]:
@@ -104,7 +109,7 @@ class DummyHTTPClient:
         self.stream_calls: list[dict] = []
         self.post_calls: list[dict] = []
 
-    def stream(self, method, path, *, headers, json):
+    def stream(self, method, path, *, headers, json, extensions=None):
         self.stream_calls.append(
             {
                 "method": method,
@@ -156,7 +161,7 @@ class DummyHTTPClient:
 
 
 class DummyAsyncHTTPClient(DummyHTTPClient):
-    def stream(self, method, path, *, headers, json):
+    def stream(self, method, path, *, headers, json, extensions=None):
         """Return an async-compatible context manager mimicking httpx.stream.
 
         Although the *real* httpx ``stream`` is a *sync* method that returns an
@@ -215,3 +220,105 @@ class DummyAsyncHTTPClient(DummyHTTPClient):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         return False
+
+
+class DummyInputStream:
+    """Stub mimicking :class:`sounddevice.InputStream`; tests drive ``callback`` by hand."""
+
+    def __init__(self, *, device=None, channels=1, samplerate=16000, blocksize=4096, dtype="int16", callback=None):
+        self.device = device
+        self.channels = channels
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.dtype = dtype
+        self.callback = callback
+        self.active = False
+        self.closed = False
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.closed = True
+
+
+class DummySoundDevice:
+    """Stub exposing the parts of the :mod:`sounddevice` module used by the SDK."""
+
+    def __init__(self):
+        self.streams: list[DummyInputStream] = []
+
+    def InputStream(self, **kwargs):
+        stream = DummyInputStream(**kwargs)
+        self.streams.append(stream)
+        return stream
+
+    def query_devices(self):
+        return []
+
+
+class RecordingConnection:
+    """Minimal sync connection collecting everything sent to it."""
+
+    def __init__(self):
+        self.connected = True
+        self.sent: list[bytes] = []
+
+    def send(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+class AsyncRecordingConnection(RecordingConnection):
+    """Minimal async connection collecting everything sent to it."""
+
+    async def send(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+class LoopbackAudioServer:
+    """HTTP server on 127.0.0.1 answering one request with chunked audio.
+
+    With ``stall`` the response is left open after the last chunk until the client goes away,
+    which sets ``disconnected``.
+    """
+
+    def __init__(self, chunks: list[bytes], *, stall: bool = False, delay: float = 0.0):
+        self.chunks = chunks
+        self.stall = stall
+        self.delay = delay
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        self.url = f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+        self.disconnected = threading.Event()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        conn, _ = self.sock.accept()
+        with conn:
+            data = b""
+            while b"\r\n\r\n" not in data:
+                data += conn.recv(4096)
+            head, body = data.split(b"\r\n\r\n", 1)
+            length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+            while len(body) < length:
+                body += conn.recv(4096)
+            conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Type: audio/wav\r\nTransfer-Encoding: chunked\r\n\r\n")
+            for chunk in self.chunks:
+                time.sleep(self.delay)
+                conn.sendall(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            if not self.stall:
+                conn.sendall(b"0\r\n\r\n")
+            conn.settimeout(5)
+            try:
+                # Returns b"" once the client goes away
+                if conn.recv(1) == b"":
+                    self.disconnected.set()
+            except OSError:
+                self.disconnected.set()
+
+    def close(self):
+        self.sock.close()
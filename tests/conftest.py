@@ -7,6 +7,7 @@ from tests._helpers import (
     DummyAsyncSocketClient,
     DummyHTTPClient,
     DummyAsyncHTTPClient,
+    DummySoundDevice,
 )
 
 
@@ -168,3 +169,15 @@ def dummy_async_stt_http(monkeypatch):
     
     monkeypatch.setattr(aiola.clients.stt.client, "create_async_authenticated_client", mock_create_async_authenticated_client)
     return client
+
+
+@pytest.fixture
+def dummy_sounddevice(monkeypatch):
+    """Replace *sounddevice* in :mod:`aiola.mic` so microphone code runs without PortAudio."""
+    np = pytest.importorskip("numpy")
+    import aiola.mic as mic_module
+
+    device = DummySoundDevice()
+    monkeypatch.setattr(mic_module, "sd", device)
+    monkeypatch.setattr(mic_module, "np", np)
+    return device
@@ -0,0 +1,102 @@
+import multiprocessing
+import queue
+
+import numpy as np
+import pytest
+
+from aiola.audio import AudioBusPublisher, AudioBusSubscriber, BusSource, ToneSource
+from tests._helpers import RecordingConnection
+
+
+def _tone(duration=0.2):
+    return ToneSource(500, samplerate=8000, duration=duration)
+
+
+def _expected(duration=0.2):
+    with ToneSource(500, samplerate=8000, duration=duration, realtime=False) as source:
+        blocks = []
+        while True:
+            try:
+                blocks.append(source.read(timeout=1))
+            except queue.Empty:
+                return b"".join(blocks)
+
+
+def test_subscribers_read_the_same_blocks_by_cursor():
+    with AudioBusPublisher(_tone()) as publisher:
+        first = AudioBusSubscriber(publisher.name, from_start=True)
+        second = AudioBusSubscriber(publisher.name, from_start=True)
+        assert (first.samplerate, first.channels, first.dtype) == (8000, 1, "int16")
+
+        view = first.read_view(timeout=1)
+        assert isinstance(view, memoryview) and view.readonly
+        data_first = bytes(view) + b"".join(first)
+        view.release()
+        data_second = b"".join(second)
+        first.close()
+        second.close()
+
+    assert data_first == data_second == _expected()
+
+
+def test_lagging_subscriber_skips_overwritten_blocks():
+    source = ToneSource(500, samplerate=8000, duration=0.2, realtime=False)
+    # 20 ms blocks; 40 ms keeps two of them
+    publisher = AudioBusPublisher(source, buffer_ms=40)
+    subscriber = AudioBusSubscriber(publisher.name)
+    with publisher:
+        while publisher.blocks_published < 10:
+            pass
+        assert subscriber.lag_ms == pytest.approx(40)
+        blocks = list(subscriber)
+        subscriber.close()
+
+    assert len(blocks) == 2
+    assert subscriber.overruns == 8
+    assert b"".join(blocks) == _expected()[-len(b"".join(blocks)) :]
+
+
+def _child_reads(name, results):
+    with AudioBusSubscriber(name, from_start=True) as subscriber:
+        results.put(b"".join(subscriber))
+
+
+def test_subscriber_in_another_process():
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        pytest.skip("fork start method unavailable")
+    results = context.Queue()
+
+    with AudioBusPublisher(_tone(0.1), buffer_ms=500) as publisher:
+        child = context.Process(target=_child_reads, args=(publisher.name, results))
+        child.start()
+        data = results.get(timeout=5)
+        child.join(timeout=5)
+
+    assert child.exitcode == 0
+    assert data == _expected(0.1)
+
+
+def test_bus_source_streams_published_audio():
+    connection = RecordingConnection()
+    with AudioBusPublisher(_tone(0.1)) as publisher:
+        source = BusSource(publisher.name)
+        source.start()
+        source.stream_to(connection)
+        source._thread.join(timeout=2)
+        source.close()
+
+    samples = np.frombuffer(b"".join(connection.sent), dtype=np.int16)
+    assert len(samples) > 0
+    assert samples.tobytes() in _expected(0.1)
+
+
+def test_publisher_requires_numpy(monkeypatch):
+    import aiola.audio.bus
+
+    source = _tone()
+    monkeypatch.setattr(aiola.audio.bus, "np", None)
+
+    with pytest.raises(ImportError, match="numpy is required for the audio bus"):
+        AudioBusPublisher(source)
@@ -0,0 +1,71 @@
+import pytest
+
+from aiola import AiolaFileError
+from aiola.audio import aconcat_wav, concat_wav, parse_wav_header, wav_header
+from aiola.audio.wav import UNKNOWN_SIZE
+
+
+def wav(payload: bytes, sample_rate: int = 8000) -> bytes:
+    return wav_header(sample_rate=sample_rate, data_size=len(payload)) + payload
+
+
+def chunked(data: bytes, size: int):
+    return iter([data[i : i + size] for i in range(0, len(data), size)])
+
+
+def test_buffers_are_joined_behind_one_exact_header():
+    joined = b"".join(concat_wav([wav(b"\x01\x00" * 3), b"\x02\x00" * 2, wav(b"\x03\x00")]))
+
+    info = parse_wav_header(joined)
+    assert info.sample_rate == 8000
+    assert info.data_size == 12
+    assert joined[info.data_offset :] == b"\x01\x00" * 3 + b"\x02\x00" * 2 + b"\x03\x00"
+    assert joined.count(b"RIFF") == 1
+
+
+def test_streams_are_joined_with_an_unknown_size():
+    parts = [chunked(wav(b"\x01\x00" * 10), 7), chunked(wav(b"\x02\x00" * 5), 3)]
+
+    joined = b"".join(concat_wav(parts))
+
+    assert joined[4:8] == UNKNOWN_SIZE.to_bytes(4, "little")
+    info = parse_wav_header(joined)
+    assert info.data_size is None
+    assert joined[info.data_offset :] == b"\x01\x00" * 10 + b"\x02\x00" * 5
+
+
+def test_partial_samples_are_dropped_and_streams_closed():
+    closed = []
+
+    class Stream:
+        def __iter__(self):
+            return iter([b"\x01\x00\x01"])
+
+        def close(self):
+            closed.append(True)
+
+    joined = b"".join(concat_wav([Stream(), b"\x02\x00"], sample_rate=16000, header=False))
+
+    assert joined == b"\x01\x00\x02\x00"
+    assert closed == [True]
+
+
+def test_different_formats_are_rejected():
+    with pytest.raises(AiolaFileError):
+        list(concat_wav([wav(b"\0\0", 8000), wav(b"\0\0", 16000)]))
+    with pytest.raises(ValueError):
+        list(concat_wav([b"\0\0"]))  # raw audio needs a sample rate for the header
+
+
+@pytest.mark.anyio
+async def test_async_parts():
+    async def stream(data: bytes):
+        for chunk in chunked(data, 5):
+            yield chunk
+
+    parts = [stream(wav(b"\x01\x00" * 4)), wav(b"\x02\x00")]
+    joined = b"".join([bytes(view) async for view in aconcat_wav(parts)])
+
+    info = parse_wav_header(joined)
+    assert info.data_size is None
+    assert joined[info.data_offset :] == b"\x01\x00" * 4 + b"\x02\x00"
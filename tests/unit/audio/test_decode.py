@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from aiola.audio import PcmDecoder
+from aiola.audio.wav import WAVE_FORMAT_IEEE_FLOAT
+
+
+def test_native_samples_are_views_of_the_frame():
+    samples = np.array([[1, -1], [32767, -32768]], dtype=np.int16)
+    frame = samples.tobytes()
+
+    decoded = PcmDecoder(channels=2).decode(memoryview(frame))
+
+    assert decoded.shape == (2, 2)
+    assert decoded.dtype == np.int16
+    assert np.array_equal(decoded, samples)
+    assert not decoded.flags.owndata and not decoded.flags.writeable
+
+
+def test_conversion_to_float_and_between_widths():
+    frame = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+
+    assert PcmDecoder(dtype="float32").decode(frame).ravel().tolist() == [0.0, 0.5, -1.0]
+    assert PcmDecoder(dtype="int32").decode(frame).ravel().tolist() == [0, 2**30, -(2**31)]
+
+    floats = np.array([0.5, 1.0, -1.0], dtype=np.float32).tobytes()
+    decoded = PcmDecoder(sample_width=4, format_tag=WAVE_FORMAT_IEEE_FLOAT, dtype="int16").decode(floats)
+    assert decoded.ravel().tolist() == [16384, 32767, -32768]  # full scale is clipped
+
+
+def test_unsigned_and_24_bit_pcm():
+    assert PcmDecoder(sample_width=1, dtype="int16").decode(bytes([128, 255, 0])).ravel().tolist() == [0, 32512, -32768]
+
+    frame = b"\x00\x00\x40" + b"\xff\xff\xff" + b"\x00\x00\x80"
+    assert PcmDecoder(sample_width=3).decode(frame).ravel().tolist() == [2**22, -1, -(2**23)]
+
+
+def test_unsupported_formats_are_rejected():
+    with pytest.raises(ValueError):
+        PcmDecoder(sample_width=5)
+    with pytest.raises(ValueError):
+        PcmDecoder(dtype="uint8")
@@ -0,0 +1,35 @@
+import pytest
+
+from aiola.audio import FrameChunker
+
+
+def test_chunker_emits_exact_frames_across_block_boundaries():
+    # 10 ms at 1 kHz, 16-bit mono: 20 bytes per frame
+    chunker = FrameChunker(10, sample_rate=1000)
+    data = bytes(range(100))
+
+    frames = []
+    for start, end in [(0, 7), (7, 53), (53, 54), (54, 100)]:
+        frames.extend(bytes(frame) for frame in chunker.push(data[start:end]))
+
+    assert frames == [data[i : i + 20] for i in range(0, 100, 20)]
+    assert chunker.pending == 0
+    assert chunker.flush() == b""
+
+
+def test_chunker_slices_whole_frames_without_copying():
+    chunker = FrameChunker(10, sample_rate=1000)
+    block = bytearray(50)
+
+    frames = chunker.push(block)
+    block[0] = 1
+
+    assert [len(frame) for frame in frames] == [20, 20]
+    assert frames[0].obj is block and frames[0][0] == 1
+    assert chunker.pending == 10
+    assert chunker.flush() == bytes(10)
+
+
+def test_chunker_rejects_non_positive_frame():
+    with pytest.raises(ValueError):
+        FrameChunker(0)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from aiola.audio import LevelMeter, ToneSource
+
+
+def test_meter_measures_level_peak_and_clipping():
+    meter = LevelMeter(sample_rate=1000, window_ms=1)
+    block = np.full(100, 16384, dtype=np.int16)
+    block[:3] = 32767
+    block[3] = -32768
+
+    meter.update(block.tobytes())
+    reading = meter.reading()
+
+    assert reading.peak_db == pytest.approx(0, abs=0.01)
+    assert reading.rms_db == pytest.approx(-5.53, abs=0.02)
+    assert reading.clipped_samples == 4
+    assert reading.clip_ratio == pytest.approx(0.04)
+
+
+def test_meter_smooths_level_and_holds_peak():
+    meter = LevelMeter(sample_rate=1000, window_ms=100)
+    meter.update(np.full((10, 1), 16384, dtype=np.int16))
+    loud = meter.reading()
+    meter.update(np.zeros((10, 1), dtype=np.int16))
+    quiet = meter.reading()
+
+    assert quiet.rms_db < loud.rms_db
+    assert quiet.peak_db == -120.0
+    assert quiet.peak_hold_db == loud.peak_db
+    assert quiet.samples == 20
+
+    meter.reset()
+    assert meter.reading().samples == 0
+
+
+def test_source_updates_meter_on_capture():
+    meter = LevelMeter(sample_rate=8000)
+    with ToneSource(samplerate=8000, amplitude=0.5, duration=0.1, realtime=False, meter=meter) as source:
+        source.stream_with_callback(lambda data: None)
+        source._thread.join(timeout=1)
+
+    reading = meter.reading()
+    assert reading.samples == 800
+    assert reading.peak_hold_db == pytest.approx(-6.02, abs=0.05)
+    assert reading.clipped_samples == 0
@@ -0,0 +1,116 @@
+import threading
+
+import numpy as np
+import pytest
+
+from aiola.audio.ring import AudioRingBuffer
+
+
+def test_ring_returns_blocks_in_order_as_views():
+    ring = AudioRingBuffer(block_frames=4, channels=1, dtype="int16", capacity=4)
+    ring.write(np.arange(4, dtype=np.int16).reshape(-1, 1))
+    ring.write(np.arange(4, 8, dtype=np.int16).reshape(-1, 1))
+
+    first = ring.read_view(timeout=0)
+    second = ring.read_view(timeout=0)
+
+    assert isinstance(first, memoryview) and first.readonly
+    assert np.frombuffer(first, dtype=np.int16).tolist() == [0, 1, 2, 3]
+    assert np.frombuffer(second, dtype=np.int16).tolist() == [4, 5, 6, 7]
+    assert ring.read_view(timeout=0) is None
+
+
+def test_ring_write_does_not_allocate_when_dtype_matches():
+    ring = AudioRingBuffer(block_frames=4, channels=2, dtype="int16", capacity=4)
+    slots_before = ring._slots.__array_interface__["data"][0]
+
+    ring.write(np.ones((4, 2), dtype=np.int16))
+
+    assert ring._slots.__array_interface__["data"][0] == slots_before
+    assert bytes(ring.read_view(timeout=0)) == np.ones((4, 2), dtype=np.int16).tobytes()
+
+
+def test_ring_converts_dtype_in_place_and_splits_long_blocks():
+    ring = AudioRingBuffer(block_frames=2, channels=1, dtype="int16", capacity=4)
+    ring.write(np.array([[1.0], [2.0], [3.0]], dtype=np.float32))
+
+    assert np.frombuffer(ring.read_view(timeout=0), dtype=np.int16).tolist() == [1, 2]
+    assert np.frombuffer(ring.read_view(timeout=0), dtype=np.int16).tolist() == [3]
+
+
+def test_ring_skips_oldest_blocks_when_consumer_lags(caplog):
+    ring = AudioRingBuffer(block_frames=1, channels=1, dtype="int16", capacity=3)
+    for value in range(5):
+        ring.write(np.array([[value]], dtype=np.int16))
+
+    assert len(ring) == 2
+    values = [np.frombuffer(ring.read_view(timeout=0), dtype=np.int16)[0] for _ in range(2)]
+    assert values == [3, 4]
+    assert ring.overflows == 3
+
+    # Only the first overflow is logged
+    for value in range(4):
+        ring.write(np.array([[value]], dtype=np.int16))
+    ring.read_view(timeout=0)
+    assert ring.overflows == 5
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+    assert "dropping the oldest audio" in caplog.text
+
+
+def test_ring_read_wakes_up_on_write():
+    ring = AudioRingBuffer(block_frames=1, channels=1, dtype="int16", capacity=4)
+    timer = threading.Timer(0.02, ring.write, args=(np.array([[7]], dtype=np.int16),))
+    timer.start()
+
+    view = ring.read_view(timeout=1)
+
+    assert np.frombuffer(view, dtype=np.int16).tolist() == [7]
+
+
+def test_ring_rejects_tiny_capacity():
+    with pytest.raises(ValueError):
+        AudioRingBuffer(block_frames=1, channels=1, dtype="int16", capacity=1)
+
+
+def test_ring_counts_buffered_frames_and_underflows():
+    ring = AudioRingBuffer(block_frames=4, channels=1, dtype="int16", capacity=4)
+    ring.write(np.zeros((6, 1), dtype=np.int16))
+
+    assert ring.buffered_frames == 6
+    assert ring.read_view(timeout=0) is not None
+    assert ring.buffered_frames == 2
+    ring.read_view(timeout=0)
+    assert ring.read_view(timeout=0) is None
+    assert ring.underflows == 1
+
+
+def test_ring_close_wakes_blocked_reader():
+    ring = AudioRingBuffer(block_frames=1, channels=1, dtype="int16", capacity=4)
+    threading.Timer(0.02, ring.close).start()
+
+    assert ring.read_view() is None
+    # The blocked read waited for the producer
+    assert ring.underflows == 1
+    ring.reopen()
+    assert ring.read_view(timeout=0) is None
+    assert ring.underflows == 2
+
+
+def test_ring_discard_older_keeps_newest_frames():
+    ring = AudioRingBuffer(block_frames=2, channels=1, dtype="int16", capacity=8)
+    for value in range(4):
+        ring.write(np.full((2, 1), value, dtype=np.int16))
+
+    ring.discard_older(3)
+
+    assert ring.buffered_frames == 4
+    assert np.frombuffer(ring.read_view(timeout=0), dtype=np.int16)[0] == 2
+
+
+def test_ring_interrupt_wakes_reader_once():
+    ring = AudioRingBuffer(block_frames=1, channels=1, dtype="int16", capacity=4)
+    threading.Timer(0.02, ring.interrupt).start()
+
+    assert ring.read_view() is None
+    assert ring.read_view(timeout=0) is None
+    assert ring.underflows == 2
@@ -0,0 +1,191 @@
+import io
+import os
+import queue
+import sys
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from aiola.audio import AudioSource, FfmpegSource, FileSource, PipeSource, ToneSource
+from aiola.errors import AiolaError, AiolaFileError
+from tests._helpers import AsyncRecordingConnection, RecordingConnection
+
+PCM = np.arange(-4000, 4000, dtype=np.int16).tobytes()
+
+
+def _write_wav(path, pcm=PCM, rate=8000):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm)
+    return path
+
+
+def _drain(source: AudioSource) -> list[bytes]:
+    blocks = []
+    while True:
+        try:
+            blocks.append(source.read(timeout=1))
+        except queue.Empty:
+            return blocks
+
+
+def test_file_source_streams_wav_to_connection(tmp_path):
+    connection = RecordingConnection()
+    source = FileSource(_write_wav(tmp_path / "a.wav"), realtime=False)
+    assert (source.samplerate, source.channels, source.blocksize) == (8000, 1, 160)
+
+    with source:
+        source.stream_to(connection)
+        # The worker finishes on its own once the file is exhausted
+        source._thread.join(timeout=1)
+
+    assert b"".join(connection.sent) == PCM
+    assert {len(chunk) for chunk in connection.sent[:-1]} == {320}
+
+
+def test_file_source_applies_backpressure_without_realtime(tmp_path):
+    source = FileSource(_write_wav(tmp_path / "a.wav"), realtime=False, max_buffer_ms=50)
+
+    with source:
+        time.sleep(0.05)  # The producer pauses instead of overwriting unread audio
+        blocks = _drain(source)
+
+    assert b"".join(blocks) == PCM
+    assert source.overflows == 0
+
+
+def test_tone_source_is_paced_in_realtime():
+    source = ToneSource(1000, samplerate=8000, duration=0.1)
+    started = time.monotonic()
+
+    with source:
+        samples = np.frombuffer(b"".join(_drain(source)), dtype=np.int16)
+
+    assert time.monotonic() - started >= 0.08
+    assert len(samples) == 800
+    assert samples.max() == pytest.approx(16383, abs=2)
+
+
+def test_tone_source_fills_every_channel():
+    with ToneSource(samplerate=8000, channels=2, duration=0.02, realtime=False) as source:
+        frames = np.frombuffer(b"".join(_drain(source)), dtype=np.int16).reshape(-1, 2)
+
+    assert len(frames) == 160
+    assert np.array_equal(frames[:, 0], frames[:, 1])
+
+
+@pytest.mark.anyio
+async def test_pipe_source_feeds_async_connection():
+    connection = AsyncRecordingConnection()
+    # An odd trailing byte is not a whole sample and is dropped
+    source = PipeSource(io.BytesIO(PCM + b"\x01"), samplerate=8000)
+
+    async with source:
+        await source.astream_to(connection)
+
+    assert b"".join(connection.sent) == PCM
+
+
+class ShortReads(io.RawIOBase):
+    """Raw stream returning at most *size* bytes per read, like a pipe or socket."""
+
+    def __init__(self, data, size):
+        self._data = io.BytesIO(data)
+        self._size = size
+
+    def readable(self):
+        return True
+
+    def read(self, n=-1):
+        return self._data.read(min(n, self._size) if n >= 0 else self._size)
+
+
+def test_pipe_source_keeps_partial_frames_across_short_reads():
+    samples = np.arange(1000, dtype=np.int16)
+    source = PipeSource(ShortReads(samples.tobytes(), 101), samplerate=8000, blocksize=80)
+
+    with source:
+        received = np.frombuffer(b"".join(_drain(source)), dtype=np.int16)
+
+    assert np.array_equal(received, samples)
+
+
+def test_ffmpeg_source_reads_decoder_output(tmp_path):
+    script = tmp_path / "fake-ffmpeg"
+    script.write_text(f"#!{sys.executable}\nimport sys\nsys.stdout.buffer.write(bytes(range(256)) * 4)\n")
+    script.chmod(0o755)
+    source = FfmpegSource("input.mp3", samplerate=8000, ffmpeg=str(script))
+
+    assert source.command[-9:] == ["-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", "8000", "pipe:1"]
+    assert "-re" in source.command
+    with source:
+        data = b"".join(_drain(source))
+
+    assert data == bytes(range(256)) * 4
+
+
+def test_ffmpeg_source_requires_executable():
+    source = FfmpegSource("input.mp3", ffmpeg="/nonexistent/ffmpeg")
+
+    with pytest.raises(AiolaError, match="ffmpeg executable not found"):
+        source.start()
+
+
+def _fake_ffmpeg(tmp_path, body):
+    script = tmp_path / "fake-ffmpeg"
+    script.write_text(f"#!{sys.executable}\nimport sys\n{body}\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_ffmpeg_source_does_not_block_on_a_full_stderr_pipe(tmp_path):
+    ffmpeg = _fake_ffmpeg(tmp_path, "sys.stderr.write('warning\\n' * 50000)\nsys.stdout.buffer.write(b'\\0' * 640)")
+
+    with FfmpegSource("input.mp3", samplerate=8000, ffmpeg=ffmpeg) as source:
+        data = b"".join(_drain(source))
+
+    assert data == b"\0" * 640
+
+
+def test_producer_errors_are_raised_by_the_reader(tmp_path):
+    ffmpeg = _fake_ffmpeg(tmp_path, "sys.stderr.write('noise\\n' * 1000 + 'input.mp3: Invalid data\\n')\nsys.exit(1)")
+
+    with FfmpegSource("input.mp3", ffmpeg=ffmpeg) as source:
+        with pytest.raises(AiolaFileError, match="input.mp3: Invalid data"):
+            source.read(timeout=1)
+        # Raised once; afterwards the source reads as exhausted
+        with pytest.raises(queue.Empty):
+            source.read(timeout=0)
+
+
+def test_pipe_source_keeps_audio_read_after_stop():
+    read_fd, write_fd = os.pipe()
+    source = PipeSource(os.fdopen(read_fd, "rb", buffering=0), samplerate=8000, blocksize=4)
+    try:
+        source.start()
+        os.write(write_fd, b"\1" * 8)
+        assert source.read(timeout=1) == b"\1" * 8
+        # The producer is now blocked reading the pipe and picks up the next block after stop()
+        source.stop()
+        os.write(write_fd, b"\2" * 8)
+        time.sleep(0.05)
+
+        source.start()
+        assert source.read(timeout=1) == b"\2" * 8
+    finally:
+        os.close(write_fd)
+        source.stop()
+
+
+def test_source_without_a_producer_cannot_be_created():
+    from aiola.audio.sources import _ThreadedSource
+
+    class Incomplete(_ThreadedSource):
+        pass
+
+    with pytest.raises(TypeError, match="_produce"):
+        Incomplete(realtime=False, channels=1, samplerate=16000, blocksize=160, dtype="int16")
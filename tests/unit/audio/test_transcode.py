@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from aiola.audio import AudioTranscoder, PcmDecoder, Resampler, g711_decode, g711_encode, wav_header
+from aiola.audio.wav import WAVE_FORMAT_MULAW
+
+
+def tone(freq: float, sample_rate: int, seconds: float = 1.0, amplitude: float = 0.5) -> np.ndarray:
+    return amplitude * np.sin(2 * np.pi * freq * np.arange(int(sample_rate * seconds)) / sample_rate)
+
+
+@pytest.mark.parametrize("law, silence", [("mulaw", 0xFF), ("alaw", 0xD5)])
+def test_g711_round_trip(law, silence):
+    samples = np.array([0, 1000, -1000, 32767, -32768], dtype=np.int16)
+
+    codes = g711_encode(samples, law)
+    decoded = g711_decode(codes, law)
+
+    assert len(codes) == 5
+    assert codes[0] == silence
+    assert np.all(np.abs(decoded.astype(int) - samples) <= np.abs(samples.astype(int)) // 16 + 8)
+    assert g711_encode(samples.tobytes(), law) == codes
+
+
+def test_g711_known_codes():
+    assert g711_encode(np.array([1000, -1000], dtype=np.int16), "mulaw") == bytes([0xCE, 0x4E])
+    assert g711_encode(np.array([1000, -1000], dtype=np.int16), "alaw") == bytes([0xFA, 0x7A])
+    with pytest.raises(ValueError):
+        g711_encode(b"\0\0", "g722")
+
+
+def test_resampler_output_does_not_depend_on_chunking():
+    signal = tone(440, 24000)
+    whole = Resampler(24000, 8000)
+    expected = np.concatenate([whole.push(signal), whole.flush()])
+
+    split = Resampler(24000, 8000)
+    chunks = [split.push(chunk) for chunk in np.array_split(signal, 37)] + [split.flush()]
+    result = np.concatenate(chunks)
+
+    assert result.shape == (8000, 1)
+    assert np.array_equal(result, expected)
+    assert np.abs(result[50:-50, 0] - tone(440, 8000)[50:-50]).max() < 1e-3
+
+
+def test_resampler_removes_frequencies_above_the_new_rate():
+    resampler = Resampler(24000, 8000)
+    result = np.concatenate([resampler.push(tone(6000, 24000)), resampler.flush()])
+
+    assert np.abs(result[50:-50]).max() < 0.01
+
+
+def test_mulaw_wav_decodes_to_pcm():
+    codes = g711_encode(np.array([0, 8000, -8000], dtype=np.int16), "mulaw")
+
+    decoded = PcmDecoder(sample_width=1, format_tag=WAVE_FORMAT_MULAW).decode(codes)
+
+    assert decoded.dtype == np.int16
+    assert np.array_equal(decoded.ravel(), g711_decode(codes, "mulaw"))
+
+
+def test_transcoder_turns_wav_into_telephony_audio():
+    pcm = (tone(440, 16000) * 32767).astype("<i2").tobytes()
+    audio = wav_header(sample_rate=16000, data_size=len(pcm)) + pcm
+    transcoder = AudioTranscoder("mulaw")
+
+    output = b"".join(transcoder.push(audio[i : i + 333]) for i in range(0, len(audio), 333)) + transcoder.flush()
+
+    assert len(output) == 8000
+    decoded = g711_decode(output, "mulaw") / 32768
+    assert np.abs(decoded[50:-50] - tone(440, 8000)[50:-50]).max() < 0.03
+
+
+def test_transcoder_decodes_g711_for_speech_to_text():
+    codes = g711_encode((tone(300, 8000, 0.1) * 32767).astype(np.int16), "alaw")
+    transcoder = AudioTranscoder("pcm16", sample_rate=16000, input_encoding="alaw", input_sample_rate=8000)
+
+    output = transcoder.push(codes[:401]) + transcoder.push(codes[401:]) + transcoder.flush()
+
+    assert isinstance(output, bytes)
+    assert len(output) == 1600 * 2
+    with pytest.raises(ValueError):
+        AudioTranscoder("opus")
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from aiola.audio import VadGate
+
+
+def _block(amplitude: int, samples: int = 160) -> bytes:
+    """10 ms of a square wave at 16 kHz with the given amplitude."""
+    data = np.full(samples, amplitude, dtype=np.int16)
+    data[::2] = -amplitude
+    return data.tobytes()
+
+
+SILENCE = _block(0)
+SPEECH = _block(8000)
+
+
+def test_gate_drops_silence_and_reports_savings():
+    gate = VadGate(preroll_ms=0, hangover_ms=0, keepalive_ms=None)
+
+    sent = [chunk for _ in range(10) for chunk in gate.process(SILENCE)]
+
+    assert sent == []
+    assert gate.stats.bytes_in == 10 * len(SILENCE)
+    assert gate.stats.bytes_saved == gate.stats.bytes_in
+    assert gate.stats.saved_ratio == 1.0
+
+
+def test_gate_flushes_preroll_before_speech_and_keeps_hangover():
+    gate = VadGate(preroll_ms=20, hangover_ms=20, keepalive_ms=None)
+    quiet = [_block(1), _block(2), _block(3)]
+
+    for block in quiet:
+        assert gate.process(block) == []
+    assert gate.process(SPEECH) == [quiet[1], quiet[2], SPEECH]
+    assert gate.is_open
+
+    assert gate.process(SILENCE) == [SILENCE]  # 10 ms of hang-over left
+    assert gate.process(SILENCE) == [SILENCE]
+    assert gate.process(SILENCE) == []
+    assert not gate.is_open
+    assert gate.stats.speech_segments == 1
+
+
+def test_gate_trickles_keepalive_blocks_while_closed():
+    gate = VadGate(preroll_ms=0, hangover_ms=0, keepalive_ms=30)
+
+    sent = [gate.process(SILENCE) for _ in range(6)]
+
+    assert [len(chunks) for chunks in sent] == [0, 0, 1, 0, 0, 1]
+    assert gate.stats.keepalive_bytes == 2 * len(SILENCE)
+
+
+def test_gate_does_not_replay_audio_older_than_a_keepalive():
+    gate = VadGate(preroll_ms=30, hangover_ms=0, keepalive_ms=30)
+    quiet = [_block(1), _block(2), _block(3)]
+
+    assert gate.process(quiet[0]) == []
+    assert gate.process(quiet[1]) == []
+    assert gate.process(quiet[2]) == [quiet[2]]  # keep-alive
+    # Onset right after the keep-alive: the audio continues from it, in order
+    assert gate.process(SPEECH) == [SPEECH]
+
+
+def test_gate_detects_speech_in_partial_frame():
+    gate = VadGate(frame_ms=10)
+    short_burst = np.zeros(200, dtype=np.int16)
+    short_burst[-20:] = 10000  # Loud samples only in the trailing partial frame
+
+    assert gate.is_speech(short_burst.tobytes())
+    assert not gate.is_speech(b"")
+
+
+def test_gate_rejects_unknown_dtype():
+    with pytest.raises(ValueError):
+        VadGate(dtype="int8")
+
@@ -0,0 +1,76 @@
+import struct
+import wave
+
+import pytest
+
+from aiola.audio import MappedAudioFile, WavStreamParser, parse_wav_header
+from aiola.errors import AiolaFileError
+
+
+def test_parse_wav_header_skips_unknown_chunks(tmp_path):
+    path = tmp_path / "a.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(22050)
+        wav.writeframes(b"\x00" * 400)
+    raw = path.read_bytes()
+    # Insert an odd-sized LIST chunk between fmt and data
+    extra = b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+    data = raw[:36] + extra + raw[36:]
+
+    info = parse_wav_header(data)
+
+    assert (info.channels, info.sample_rate, info.sample_width) == (2, 22050, 2)
+    assert info.data_offset == 44 + len(extra)
+    assert info.data_size == 400
+
+
+def test_parse_wav_header_handles_unknown_length():
+    header = b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE"
+    header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, 16000, 32000, 2, 16)
+    header += b"data" + struct.pack("<I", 0xFFFFFFFF)
+
+    assert parse_wav_header(header).data_size is None
+
+
+def test_wav_stream_parser_splits_header_across_chunks():
+    header = b"RIFF" + struct.pack("<I", 44) + b"WAVE"
+    header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, 16000, 32000, 2, 16)
+    header += b"data" + struct.pack("<I", 6)
+    stream = header + b"abcdef" + b"trailing"
+    parser = WavStreamParser()
+
+    payload = [bytes(parser.push(stream[i : i + 10])) for i in range(0, len(stream), 10)]
+
+    assert b"".join(payload) == b"abcdef"
+    assert payload[:4] == [b"", b"", b"", b""]
+    assert parser.info.sample_rate == 16000
+
+
+def test_wav_stream_parser_passes_raw_audio_through():
+    parser = WavStreamParser()
+    assert bytes(parser.push(b"raw")) == b""
+    assert bytes(parser.flush()) == b"raw"
+    parser = WavStreamParser()
+    assert bytes(parser.push(b"raw pcm audio")) == b"raw pcm audio"
+    assert bytes(parser.push(b"more")) == b"more"
+    assert parser.info is None
+
+
+def test_parse_wav_header_rejects_non_wav():
+    with pytest.raises(AiolaFileError):
+        parse_wav_header(b"not a wav file")
+
+
+def test_mapped_audio_file_frames_are_zero_copy_views(tmp_path):
+    path = tmp_path / "raw.pcm"
+    path.write_bytes(b"\x01\x02" * 100)
+
+    with MappedAudioFile(path, sample_rate=1000) as audio:
+        frames = list(audio.frames(frame_ms=30))
+        assert all(isinstance(frame, memoryview) for frame in frames)
+        assert [len(frame) for frame in frames] == [60, 60, 60, 20]
+        assert audio.duration == pytest.approx(0.1)
+        for frame in frames:
+            frame.release()
@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient, AiolaError
+from aiola.types import LiveEvents, OverflowPolicy, StreamEvent
+
+
+def _trigger(sio, event, *args):
+    return sio.event_handlers[f"{event}:/events"](*args)
+
+
+def test_events_iterator_yields_typed_events_until_disconnect(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream()
+    stream = connection.events()
+    connection.connect()
+
+    _trigger(connection._sio, LiveEvents.Connect)
+    _trigger(connection._sio, LiveEvents.Transcript, {"transcript": "hi"})
+    connection.disconnect()
+
+    assert list(stream) == [
+        StreamEvent(type=LiveEvents.Connect),
+        StreamEvent(type=LiveEvents.Transcript, data={"transcript": "hi"}),
+    ]
+
+
+def test_events_coexist_with_callback_handlers(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream()
+    received = []
+    connection.on(LiveEvents.Transcript, received.append)
+    stream = connection.events(event_types=[LiveEvents.Transcript])
+
+    _trigger(connection._sio, LiveEvents.Transcript, {"transcript": "a"})
+
+    assert received == [{"transcript": "a"}]
+    assert stream.get(timeout=1).data == {"transcript": "a"}
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [(OverflowPolicy.DropOldest, ["b", "c"]), (OverflowPolicy.DropNewest, ["a", "b"])],
+)
+def test_events_overflow_policies(patch_dummy_socket, policy, expected):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream()
+    stream = connection.events(maxsize=2, overflow=policy, event_types=[LiveEvents.Transcript])
+
+    for text in ("a", "b", "c"):
+        _trigger(connection._sio, LiveEvents.Transcript, text)
+    stream.close()
+
+    assert [event.data for event in stream] == expected
+    assert stream.dropped == 1
+
+
+def test_events_block_policy_applies_backpressure(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream()
+    stream = connection.events(maxsize=1, overflow="block", event_types=[LiveEvents.Transcript])
+
+    _trigger(connection._sio, LiveEvents.Transcript, "first")
+    producer = threading.Thread(target=_trigger, args=(connection._sio, LiveEvents.Transcript, "second"))
+    producer.start()
+    producer.join(timeout=0.05)
+    assert producer.is_alive()  # Receive thread waits for the consumer
+
+    assert stream.get(timeout=1).data == "first"
+    producer.join(timeout=1)
+    assert stream.get(timeout=1).data == "second"
+    assert stream.dropped == 0
+
+
+def test_events_rejects_invalid_arguments(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream()
+
+    with pytest.raises(AiolaError, match="maxsize"):
+        connection.events(maxsize=0)
+    with pytest.raises(AiolaError, match="overflow policy"):
+        connection.events(overflow="spill")
+
+
+@pytest.mark.anyio
+async def test_async_events_iterator(patch_dummy_async_socket):
+    client = AsyncAiolaClient(api_key="secret-key")
+    connection = await client.stt.stream()
+    await connection.connect()
+    stream = connection.events(event_types=[LiveEvents.Transcript, LiveEvents.Error])
+
+    await _trigger(connection._sio, LiveEvents.Transcript, {"transcript": "hello"})
+    await _trigger(connection._sio, LiveEvents.Error, "boom")
+    await connection.disconnect()
+
+    events = [event async for event in stream]
+    assert [event.type for event in events] == [LiveEvents.Transcript, LiveEvents.Error]
+    assert events[1].data == "boom"
@@ -0,0 +1,74 @@
+import time
+import wave
+
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient, AiolaError, AiolaFileError
+
+
+def _write_wav(path, frames: bytes, samplerate=16000):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(samplerate)
+        wav.writeframes(frames)
+
+
+def _binary_emits(sio):
+    return [call["data"] for call in sio.emit_calls if call["event"] == "binary_data"]
+
+
+def test_stream_file_sends_fixed_frames_without_header(patch_dummy_socket, tmp_path):
+    path = tmp_path / "sample.wav"
+    payload = bytes(range(256)) * 5  # 640 samples = 40 ms at 16 kHz
+    _write_wav(path, payload)
+
+    connection = AiolaClient(api_key="k").stt.stream()
+    connection.connect()
+    sent = connection.stream_file(path, speed=None, frame_ms=10)
+
+    frames = _binary_emits(connection._sio)
+    assert sent == len(payload)
+    assert [len(frame) for frame in frames] == [320, 320, 320, 320]
+    assert b"".join(frames) == payload
+
+
+def test_stream_file_paces_frames_in_real_time(patch_dummy_socket, tmp_path):
+    path = tmp_path / "sample.pcm"
+    path.write_bytes(b"\x00\x00" * 1600)  # 100 ms of raw 16 kHz PCM
+
+    connection = AiolaClient(api_key="k").stt.stream()
+    connection.connect()
+    started = time.monotonic()
+    connection.stream_file(path, speed=2.0, frame_ms=20)
+    elapsed = time.monotonic() - started
+
+    # 5 frames, the last one starts 4 * 20 ms / 2 after the first
+    assert len(_binary_emits(connection._sio)) == 5
+    assert 0.035 <= elapsed < 0.5
+
+
+def test_stream_file_rejects_bad_input(patch_dummy_socket, tmp_path):
+    connection = AiolaClient(api_key="k").stt.stream()
+    connection.connect()
+
+    with pytest.raises(AiolaFileError):
+        connection.stream_file(tmp_path / "missing.wav")
+
+    path = tmp_path / "sample.pcm"
+    path.write_bytes(b"\x00\x00" * 10)
+    with pytest.raises(AiolaError, match="speed"):
+        connection.stream_file(path, speed=-1)
+
+
+@pytest.mark.anyio
+async def test_async_stream_file(patch_dummy_async_socket, tmp_path):
+    path = tmp_path / "sample.wav"
+    _write_wav(path, b"\x01\x00" * 480, samplerate=8000)  # 60 ms at 8 kHz
+
+    connection = await AsyncAiolaClient(api_key="k").stt.stream()
+    await connection.connect()
+    sent = await connection.stream_file(path, speed=None, frame_ms=20)
+
+    assert sent == 960
+    assert [len(frame) for frame in _binary_emits(connection._sio)] == [320, 320, 320]
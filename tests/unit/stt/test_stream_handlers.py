@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient, AiolaError
+from aiola.types import LiveEvents
+
+
+def _trigger(sio, event, *args):
+    return sio.event_handlers[f"{event}:/events"](*args)
+
+
+def test_handlers_run_on_executor_in_event_order(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    received = []
+    done = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        connection = client.stt.stream(handler_executor=executor)
+        receive_thread = threading.get_ident()
+
+        @connection.on(LiveEvents.Transcript)
+        def on_transcript(data):
+            time.sleep(0.001 * (5 - data))  # Earlier events are slower
+            received.append((data, threading.get_ident()))
+            if data == 4:
+                done.set()
+
+        for i in range(5):
+            # The receive thread only enqueues work
+            assert _trigger(connection._sio, LiveEvents.Transcript, i) is None
+        assert done.wait(timeout=2)
+
+    assert [data for data, _ in received] == [0, 1, 2, 3, 4]
+    assert all(thread != receive_thread for _, thread in received)
+    metrics = connection.handler_metrics
+    assert metrics.calls == 5
+    assert metrics.pending == 0
+    assert metrics.max_seconds > 0
+
+
+def test_disconnect_waits_for_queued_handlers(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    received = []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        connection = client.stt.stream(handler_executor=executor)
+
+        @connection.on(LiveEvents.Transcript)
+        def on_transcript(data):
+            time.sleep(0.05)
+            received.append(data)
+
+        @connection.on(LiveEvents.Error)
+        def on_error(data):
+            # A handler may disconnect without waiting for itself
+            connection.disconnect()
+            received.append(data)
+
+        connection.connect()
+        for i in range(3):
+            _trigger(connection._sio, LiveEvents.Transcript, i)
+        connection.disconnect()
+        assert received == [0, 1, 2]
+
+        _trigger(connection._sio, LiveEvents.Error, "bye")
+        connection.disconnect()
+        assert received == [0, 1, 2, "bye"]
+
+
+def test_inline_handlers_record_metrics_and_errors(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream()
+    connection.on(LiveEvents.Transcript, lambda data: data)
+
+    def failing(data):
+        raise ValueError("boom")
+
+    connection.on(LiveEvents.Error, failing)
+
+    assert _trigger(connection._sio, LiveEvents.Transcript, "x") == "x"
+    with pytest.raises(ValueError):
+        _trigger(connection._sio, LiveEvents.Error, "y")
+
+    assert connection.handler_metrics.calls == 2
+    assert connection.handler_metrics.errors == 1
+
+
+def test_invalid_handler_executor_is_rejected(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+
+    with pytest.raises(AiolaError, match="handler_executor"):
+        client.stt.stream(handler_executor=4)
+
+
+@pytest.mark.anyio
+async def test_async_handlers_run_off_the_receive_task(patch_dummy_async_socket):
+    client = AsyncAiolaClient(api_key="secret-key")
+    received = []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        connection = await client.stt.stream(handler_executor=executor)
+
+        @connection.on(LiveEvents.Transcript)
+        async def on_transcript(data):
+            await asyncio.sleep(0.01)
+            received.append(data)
+
+        connection.on(LiveEvents.Error, lambda data: received.append(("error", data)))
+
+        await _trigger(connection._sio, LiveEvents.Transcript, "a")
+        await _trigger(connection._sio, LiveEvents.Error, "b")
+        assert received == []  # Dispatch returned before the slow handler ran
+
+        for _ in range(100):
+            if len(received) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await connection.disconnect()
+
+    assert received == ["a", ("error", "b")]
+    assert connection.handler_metrics.calls == 2
+
+
+def test_connection_without_a_dispatcher_cannot_be_created():
+    from aiola.clients.stt.stream_client import _BaseStreamConnection
+
+    class Incomplete(_BaseStreamConnection):
+        pass
+
+    with pytest.raises(TypeError, match="_make_dispatcher"):
+        Incomplete(None, "https://speech.example", {}, "/api/voice-streaming/socket.io")
@@ -0,0 +1,185 @@
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient, AiolaError, ReplayConfig
+from aiola.types import LiveEvents
+
+
+def _binary_emits(sio):
+    return [call["data"] for call in sio.emit_calls if call["event"] == "binary_data"]
+
+
+def test_send_buffers_while_reconnecting_and_replays_on_connect(patch_dummy_socket):
+    """Audio sent during an outage is replayed after the recent history once the socket reconnects."""
+
+    client = AiolaClient(api_key="secret-key", base_url="https://speech.example")
+    connection = client.stt.stream(replay_config=ReplayConfig(history_ms=1, sample_rate=1000))
+    connection.connect()
+    sio = connection._sio
+
+    connection.send(b"a")
+    # Simulate a network drop: socketio flips ``connected`` while it reconnects
+    sio.connected = False
+    assert connection.reconnecting is True
+    connection.send(b"b")
+    connection.send(b"c")
+    assert _binary_emits(sio) == [b"a"]
+
+    sio.connected = True
+    sio.event_handlers[f"{LiveEvents.Connect}:/events"]()
+
+    assert _binary_emits(sio) == [b"a", b"a", b"b", b"c"]
+    stats = connection.replay_stats
+    assert stats.reconnects == 1
+    assert stats.buffered_bytes == 2
+    assert stats.dropped_bytes == 0
+
+
+def test_pending_audio_is_bounded_and_drops_oldest(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    config = ReplayConfig(history_ms=0, max_pending_ms=2, sample_rate=1000, sample_width=1)
+    connection = client.stt.stream(replay_config=config)
+    connection.connect()
+    sio = connection._sio
+
+    sio.connected = False
+    for chunk in (b"1", b"2", b"3"):
+        connection.send(chunk)
+    sio.connected = True
+    connection.send(b"4")
+
+    assert _binary_emits(sio) == [b"2", b"3", b"4"]
+    assert connection.replay_stats.dropped_bytes == 1
+
+
+def test_replayed_transcripts_are_deduplicated(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream(replay_config=ReplayConfig())
+    received = []
+    connection.on(LiveEvents.Transcript, received.append)
+    connection.connect()
+    sio = connection._sio
+    transcript_handler = sio.event_handlers[f"{LiveEvents.Transcript}:/events"]
+
+    transcript_handler({"transcript": "hello world"})
+    sio.connected = False
+    sio.connected = True
+    sio.event_handlers[f"{LiveEvents.Connect}:/events"]()
+    transcript_handler({"transcript": "Hello  world"})
+    transcript_handler({"transcript": "next words"})
+
+    assert received == [{"transcript": "hello world"}, {"transcript": "next words"}]
+    assert connection.replay_stats.duplicates_suppressed == 1
+
+
+def test_new_transcripts_after_a_reconnect_are_not_deduplicated_against_each_other(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream(replay_config=ReplayConfig())
+    received = []
+    connection.on(LiveEvents.Transcript, received.append)
+    connection.connect()
+    sio = connection._sio
+    transcript_handler = sio.event_handlers[f"{LiveEvents.Transcript}:/events"]
+
+    transcript_handler({"transcript": "yes", "start": 1.0})
+    sio.connected = False
+    sio.connected = True
+    sio.event_handlers[f"{LiveEvents.Connect}:/events"]()
+    transcript_handler({"transcript": "yes", "start": 1.0})  # the replayed original
+    transcript_handler({"transcript": "yes", "start": 4.0})
+    transcript_handler({"transcript": "yes", "start": 5.0})
+
+    assert [payload["start"] for payload in received] == [1.0, 4.0, 5.0]
+    assert connection.replay_stats.duplicates_suppressed == 1
+
+
+def test_interrupted_replay_is_resent_and_counted_once(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream(replay_config=ReplayConfig(history_ms=1, sample_rate=1000))
+    connection.connect()
+    sio = connection._sio
+    on_connect = sio.event_handlers[f"{LiveEvents.Connect}:/events"]
+
+    connection.send(b"a")
+    sio.connected = False
+    connection.send(b"b")
+    sio.connected = True
+    emit = sio.emit
+
+    def failing_emit(event, data, namespace=None):
+        raise ConnectionError("dropped again")
+
+    sio.emit = failing_emit
+    on_connect()
+    assert connection.replay_stats.replayed_bytes == 0
+
+    sio.emit = emit
+    on_connect()
+
+    assert _binary_emits(sio) == [b"a", b"a", b"b"]
+    assert connection.replay_stats.replayed_bytes == 2
+    # The history survived the failed attempt
+    assert connection._replay.replay() == [b"a", b"b"]
+
+
+def test_send_raises_once_reconnection_gives_up(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream(replay_config=ReplayConfig())
+    connection.connect()
+    sio = connection._sio
+
+    sio.connected = False
+    connection.send(b"buffered")
+    assert connection._replay.has_pending
+    # socketio fires this once its reconnection attempts are exhausted
+    sio.event_handlers["__disconnect_final:/events"]()
+
+    assert connection.reconnecting is False
+    assert not connection._replay.has_pending
+    with pytest.raises(AiolaError, match="Connection not established"):
+        connection.send(b"audio")
+
+
+def test_send_without_replay_still_raises_when_disconnected(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream()
+    connection.connect()
+    connection._sio.connected = False
+
+    assert connection.reconnecting is False
+    assert connection.replay_stats is None
+    with pytest.raises(AiolaError, match="Connection not established"):
+        connection.send(b"audio")
+
+
+def test_disconnect_stops_buffering(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+    connection = client.stt.stream(replay_config=ReplayConfig())
+    connection.connect()
+    connection.disconnect()
+
+    with pytest.raises(AiolaError, match="Connection not established"):
+        connection.send(b"audio")
+
+
+def test_invalid_replay_config_is_rejected(patch_dummy_socket):
+    client = AiolaClient(api_key="secret-key")
+
+    with pytest.raises(AiolaError, match="replay_config must be a ReplayConfig object"):
+        client.stt.stream(replay_config={"history_ms": 100})
+
+
+@pytest.mark.anyio
+async def test_async_send_buffers_and_replays(patch_dummy_async_socket):
+    client = AsyncAiolaClient(api_key="secret-key")
+    connection = await client.stt.stream(replay_config=ReplayConfig(history_ms=0))
+    await connection.connect()
+    sio = connection._sio
+
+    sio.connected = False
+    await connection.send(b"x")
+    sio.connected = True
+    await sio.event_handlers[f"{LiveEvents.Connect}:/events"]()
+    await connection.send(b"y")
+
+    assert _binary_emits(sio) == [b"x", b"y"]
+    assert connection.replay_stats.reconnects == 1
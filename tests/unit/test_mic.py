@@ -0,0 +1,362 @@
+import asyncio
+import queue
+import time
+
+import numpy as np
+import pytest
+
+from aiola import MicrophoneStream, MultiChannelMicrophoneStream
+from aiola.audio import VadGate
+from tests._helpers import AsyncRecordingConnection, RecordingConnection
+
+
+def _indata(block: bytes, channels: int = 1):
+    """Shape raw int16 bytes like the array sounddevice hands to the callback."""
+    return np.frombuffer(block, dtype=np.int16).reshape(-1, channels)
+
+
+def _wait_for(predicate, timeout: float = 1.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+SILENCE = np.zeros(160, dtype=np.int16).tobytes()
+SPEECH = np.full(160, 8000, dtype=np.int16).tobytes()
+
+
+def test_microphone_stream_to_applies_vad(dummy_sounddevice):
+    gate = VadGate(preroll_ms=0, hangover_ms=0, keepalive_ms=None)
+    connection = RecordingConnection()
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+    mic.stream_to(connection, vad=gate)
+    callback = dummy_sounddevice.streams[0].callback
+
+    for block in (SILENCE, SPEECH, SILENCE):
+        callback(_indata(block), 160, None, None)
+    _wait_for(lambda: gate.stats.bytes_in == 3 * len(SILENCE))
+    mic.stop()
+
+    assert connection.sent == [SPEECH]
+
+
+def test_microphone_read_view_is_zero_copy(dummy_sounddevice):
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+    dummy_sounddevice.streams[0].callback(_indata(SPEECH), 160, None, None)
+
+    view = mic.read_view(timeout=1)
+    mic.stop()
+
+    assert isinstance(view, memoryview)
+    assert view.tobytes() == SPEECH
+
+
+def test_microphone_buffer_is_bounded_by_duration(dummy_sounddevice):
+    # 160 frames at 16 kHz is 10 ms per block, so 50 ms holds five blocks
+    mic = MicrophoneStream(blocksize=160, max_buffer_ms=50)
+    mic.start()
+    callback = dummy_sounddevice.streams[0].callback
+    for value in range(8):
+        callback(np.full((160, 1), value, dtype=np.int16), 160, None, None)
+
+    assert mic.lag_ms == 50
+    assert np.frombuffer(mic.read_view(timeout=0), dtype=np.int16)[0] == 3
+    assert mic.overflows == 3
+    assert mic.lag_ms == 40
+    mic.stop()
+
+
+def test_stream_to_counts_waits_for_capture_as_underflows(dummy_sounddevice):
+    connection = RecordingConnection()
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+    mic.stream_to(connection)
+    callback = dummy_sounddevice.streams[0].callback
+
+    for value in range(3):
+        time.sleep(0.02)  # The worker is waiting for capture
+        callback(_block(value), 160, None, None)
+        _wait_for(lambda: len(connection.sent) == value + 1)
+    time.sleep(0.02)
+    mic.stop()
+
+    # One wait before each block and one for the block that never came
+    assert mic.underflows == 4
+    assert mic.overflows == 0
+
+
+def test_microphone_counts_underflows(dummy_sounddevice):
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+
+    with pytest.raises(queue.Empty):
+        mic.read(timeout=0)
+    mic.stop()
+
+    assert mic.underflows == 1
+    assert mic.lag_ms == 0
+
+
+@pytest.mark.anyio
+async def test_microphone_frames_wakes_loop_from_callback(dummy_sounddevice):
+    mic = MicrophoneStream(blocksize=160)
+    received = []
+
+    async with mic:
+        callback = dummy_sounddevice.streams[0].callback
+        loop = asyncio.get_running_loop()
+
+        async def consume():
+            async for frame in mic.frames():
+                received.append(frame)
+                if len(received) == 2:
+                    mic.stop()
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        # Deliver blocks from another thread, like PortAudio does
+        await loop.run_in_executor(None, callback, _indata(SILENCE), 160, None, None)
+        await loop.run_in_executor(None, callback, _indata(SPEECH), 160, None, None)
+        await asyncio.wait_for(task, timeout=1)
+
+    assert received == [SILENCE, SPEECH]
+    assert mic._thread is None
+
+
+@pytest.mark.anyio
+async def test_microphone_astream_to_awaits_send_and_ends_on_stop(dummy_sounddevice):
+    connection = AsyncRecordingConnection()
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+    task = asyncio.create_task(mic.astream_to(connection))
+    await asyncio.sleep(0)
+
+    dummy_sounddevice.streams[0].callback(_indata(SPEECH), 160, None, None)
+    for _ in range(100):
+        if connection.sent:
+            break
+        await asyncio.sleep(0.001)
+    mic.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert connection.sent == [SPEECH]
+    assert mic._async_waiter is None
+
+
+def test_microphone_idle_worker_sleeps_and_stops_immediately(dummy_sounddevice):
+    received = []
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+    mic.stream_with_callback(received.append)
+    dummy_sounddevice.streams[0].callback(_indata(SPEECH), 160, None, None)
+    _wait_for(lambda: received)
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    mic.stop()
+
+    assert time.monotonic() - started < 0.05
+    assert not mic._thread.is_alive()
+    assert received == [SPEECH]
+    # The worker blocked once per block instead of polling with timeouts
+    assert mic.underflows <= 2
+
+
+def test_microphone_can_restart_after_stop(dummy_sounddevice):
+    connection = RecordingConnection()
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+    mic.stop()
+    mic.start()
+    mic.stream_to(connection)
+    dummy_sounddevice.streams[-1].callback(_indata(SPEECH), 160, None, None)
+    _wait_for(lambda: connection.sent)
+    mic.stop()
+
+    assert connection.sent == [SPEECH]
+
+
+def test_microphone_stream_to_rechunks_into_fixed_frames(dummy_sounddevice):
+    connection = RecordingConnection()
+    mic = MicrophoneStream(blocksize=0)
+    mic.start()
+    mic.stream_to(connection, frame_ms=20)
+    callback = dummy_sounddevice.streams[0].callback
+    audio = np.arange(1000, dtype=np.int16)
+
+    # Device-sized blocks of 256 and 500 frames become 20 ms (320 frame) frames
+    callback(audio[:256].reshape(-1, 1), 256, None, None)
+    callback(audio[256:756].reshape(-1, 1), 500, None, None)
+    _wait_for(lambda: len(connection.sent) == 2)
+    callback(audio[756:].reshape(-1, 1), 244, None, None)
+    _wait_for(lambda: len(connection.sent) == 3)
+    # The incomplete last frame is sent on stop
+    mic.stop()
+
+    assert [len(chunk) for chunk in connection.sent] == [640, 640, 640, 80]
+    assert b"".join(connection.sent) == audio.tobytes()
+
+
+def test_multichannel_stream_routes_each_channel_to_its_connection(dummy_sounddevice):
+    connections = [RecordingConnection(), None, RecordingConnection()]
+    mic = MultiChannelMicrophoneStream(channels=3, blocksize=4)
+    mic.start()
+    mic.stream_to(connections)
+    assert dummy_sounddevice.streams[0].channels == 3
+
+    block = np.arange(12, dtype=np.int16).reshape(4, 3)
+    dummy_sounddevice.streams[0].callback(block, 4, None, None)
+    _wait_for(lambda: connections[0].sent and connections[2].sent)
+    mic.stop()
+
+    assert connections[0].sent == [block[:, 0].tobytes()]
+    assert connections[2].sent == [block[:, 2].tobytes()]
+    # The unrouted channel keeps its own buffer and counters
+    assert mic[1].lag_ms == 0 and len(mic) == 3
+
+
+def test_multichannel_stream_channels_have_independent_buffers(dummy_sounddevice):
+    mic = MultiChannelMicrophoneStream(channels=2, blocksize=160, max_buffer_ms=20)
+    with mic:
+        callback = dummy_sounddevice.streams[0].callback
+        for _ in range(4):
+            callback(np.zeros((160, 2), dtype=np.int16), 160, None, None)
+        # Channel 0 is drained, channel 1 falls behind
+        for _ in range(2):
+            mic[0].read(timeout=0)
+        assert mic[0].lag_ms == 0
+        assert mic[1].lag_ms == 20
+
+
+def test_multichannel_stream_stops_its_channels_when_the_device_fails(dummy_sounddevice, monkeypatch):
+    def unavailable(**kwargs):
+        raise RuntimeError("device busy")
+
+    monkeypatch.setattr(dummy_sounddevice, "InputStream", unavailable)
+    mic = MultiChannelMicrophoneStream(channels=2, blocksize=160)
+
+    with pytest.raises(RuntimeError, match="device busy"):
+        mic.start()
+
+    assert not any(channel.is_recording for channel in mic.streams)
+    with pytest.raises(RuntimeError, match="not started"):
+        mic[0].read(timeout=0)
+
+
+def _block(value):
+    return np.full((160, 1), value, dtype=np.int16)
+
+
+def test_microphone_preroll_is_sent_first_when_streaming_begins(dummy_sounddevice):
+    connection = RecordingConnection()
+    mic = MicrophoneStream(blocksize=160, preroll_ms=20)
+    mic.start()
+    callback = dummy_sounddevice.streams[0].callback
+    for value in range(5):
+        callback(_block(value), 160, None, None)
+
+    mic.stream_to(connection)
+    callback(_block(5), 160, None, None)
+    _wait_for(lambda: len(connection.sent) == 3)
+    mic.stop()
+
+    assert [np.frombuffer(chunk, dtype=np.int16)[0] for chunk in connection.sent] == [3, 4, 5]
+
+
+def test_microphone_detach_keeps_capturing_for_the_next_utterance(dummy_sounddevice):
+    first, second = RecordingConnection(), RecordingConnection()
+    mic = MicrophoneStream(blocksize=160, preroll_ms=10)
+    mic.start()
+    callback = dummy_sounddevice.streams[0].callback
+
+    mic.stream_to(first)
+    callback(_block(1), 160, None, None)
+    _wait_for(lambda: first.sent)
+    mic.detach()
+    for value in (2, 3, 4):
+        callback(_block(value), 160, None, None)
+    mic.stream_to(second)
+    _wait_for(lambda: second.sent)
+    mic.stop()
+
+    assert len(dummy_sounddevice.streams) == 1
+    assert [np.frombuffer(chunk, dtype=np.int16)[0] for chunk in first.sent] == [1]
+    assert [np.frombuffer(chunk, dtype=np.int16)[0] for chunk in second.sent] == [4]
+
+
+def test_idle_capture_while_detached_is_not_counted_as_overflow(dummy_sounddevice, caplog):
+    first, second = RecordingConnection(), RecordingConnection()
+    # 50 ms of buffer holds five 10 ms blocks
+    mic = MicrophoneStream(blocksize=160, max_buffer_ms=50)
+    mic.start()
+    callback = dummy_sounddevice.streams[0].callback
+
+    mic.stream_to(first)
+    callback(_block(1), 160, None, None)
+    _wait_for(lambda: first.sent)
+    mic.detach()
+    for value in range(2, 22):
+        callback(_block(value), 160, None, None)
+    mic.stream_to(second)
+    _wait_for(lambda: len(second.sent) == 5)
+    mic.stop()
+
+    assert [np.frombuffer(chunk, dtype=np.int16)[0] for chunk in second.sent] == [17, 18, 19, 20, 21]
+    assert mic.overflows == 0
+    assert "fell" not in caplog.text
+
+
+@pytest.mark.anyio
+async def test_astream_to_passes_source_errors_to_on_error(dummy_sounddevice):
+    connection = AsyncRecordingConnection()
+    errors = []
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+    callback = dummy_sounddevice.streams[0].callback
+
+    task = asyncio.create_task(mic.astream_to(connection, on_error=errors.append))
+    await asyncio.sleep(0)
+    callback(_block(1), 160, None, "input overflow")
+    for _ in range(100):
+        if connection.sent:
+            break
+        await asyncio.sleep(0.001)
+    mic.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert [str(error) for error in errors] == ["Audio callback status: input overflow"]
+    assert len(connection.sent) == 1
+
+
+@pytest.mark.anyio
+async def test_microphone_detach_ends_an_async_consumer(dummy_sounddevice):
+    first, second = AsyncRecordingConnection(), AsyncRecordingConnection()
+    mic = MicrophoneStream(blocksize=160)
+    mic.start()
+    callback = dummy_sounddevice.streams[0].callback
+    loop = asyncio.get_running_loop()
+
+    task = asyncio.create_task(mic.astream_to(first))
+    await loop.run_in_executor(None, callback, _block(1), 160, None, None)
+    for _ in range(100):
+        if first.sent:
+            break
+        await asyncio.sleep(0.001)
+    # Detach from another thread while the consumer waits for the next block
+    await loop.run_in_executor(None, mic.detach)
+    await asyncio.wait_for(task, timeout=1)
+
+    task = asyncio.create_task(mic.astream_to(second))
+    await asyncio.sleep(0)
+    callback(_block(2), 160, None, None)
+    for _ in range(100):
+        if second.sent:
+            break
+        await asyncio.sleep(0.001)
+    mic.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert [np.frombuffer(chunk, dtype=np.int16)[0] for chunk in first.sent] == [1]
+    assert [np.frombuffer(chunk, dtype=np.int16)[0] for chunk in second.sent] == [2]
@@ -0,0 +1,110 @@
+import io
+
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient, AiolaValidationError
+from aiola.clients.tts import TtsCache, TtsItem
+
+from tests._helpers import DummyHTTPClient
+
+
+ITEMS = [TtsItem("Please hold", "v"), TtsItem("Press one", "v", "en"), TtsItem("Goodbye", "v")]
+
+
+def test_synthesize_many_writes_each_item_to_its_file(dummy_http, tmp_path):
+    client = AiolaClient(api_key="k")
+
+    results = client.tts.synthesize_many(
+        ITEMS, concurrency=2, sink=lambda item: open(tmp_path / f"{item.text}.wav", "wb")
+    )
+
+    assert [result.item for result in results] == ITEMS
+    assert all(result.ok and result.size == 12 for result in results)
+    assert all(result.first_byte_s is not None and result.elapsed_s >= result.first_byte_s for result in results)
+    assert (tmp_path / "Press one.wav").read_bytes() == b"chunk1chunk2"
+    assert sorted(call["json"]["text"] for call in dummy_http.stream_calls) == sorted(i.text for i in ITEMS)
+
+
+def test_synthesize_many_reports_failures(dummy_http, monkeypatch):
+    stream = DummyHTTPClient.stream
+
+    def flaky(self, method, path, *, headers, json):
+        if json["text"] == "Press one":
+            raise RuntimeError("render failed")
+        return stream(self, method, path, headers=headers, json=json)
+
+    monkeypatch.setattr(DummyHTTPClient, "stream", flaky)
+    cache = TtsCache()
+    client = AiolaClient(api_key="k")
+
+    results = client.tts.synthesize_many(ITEMS + [TtsItem("", "v")], sink=cache)
+
+    assert [result.ok for result in results] == [True, False, True, False]
+    assert "render failed" in str(results[1].error)
+    assert isinstance(results[3].error, AiolaValidationError)
+    assert cache.get("Please hold", "v") is not None
+    assert cache.get("Press one", "v", "en") is None
+
+
+class FlakyFile(io.FileIO):
+    """File whose write or close fails for one prompt."""
+
+    def __init__(self, path, fail_on):
+        super().__init__(path, "wb")
+        self.fail_on = fail_on
+
+    def write(self, data):
+        if self.fail_on == "write" and data == b"chunk2":
+            raise OSError("disk full")
+        return super().write(data)
+
+    def close(self):
+        super().close()
+        if self.fail_on == "close":
+            raise OSError("close failed")
+
+
+def flaky_files(tmp_path):
+    failures = {"Please hold": "write", "Press one": "close"}
+    return lambda item: FlakyFile(tmp_path / f"{item.text}.wav", failures.get(item.text))
+
+
+def test_synthesize_many_records_file_errors_and_removes_partial_files(dummy_http, tmp_path):
+    client = AiolaClient(api_key="k")
+
+    results = client.tts.synthesize_many(ITEMS, sink=flaky_files(tmp_path))
+
+    assert [result.ok for result in results] == [False, False, True]
+    assert "disk full" in str(results[0].error)
+    assert "close failed" in str(results[1].error)
+    assert [path.name for path in tmp_path.iterdir()] == ["Goodbye.wav"]
+
+
+def test_synthesize_many_validates_concurrency(dummy_http):
+    client = AiolaClient(api_key="k")
+    with pytest.raises(AiolaValidationError):
+        client.tts.synthesize_many(ITEMS, concurrency=0)
+
+
+@pytest.mark.anyio
+async def test_async_synthesize_many_fills_cache(dummy_async_http):
+    client = AsyncAiolaClient(api_key="k")
+    cache = TtsCache()
+
+    results = await client.tts.synthesize_many(ITEMS, concurrency=2, sink=cache)
+
+    assert [result.item for result in results] == ITEMS
+    assert all(result.ok for result in results)
+    assert b"".join(cache.get("Goodbye", "v")) == b"chunk1chunk2"
+    assert len(dummy_async_http.stream_calls) == 3
+
+
+@pytest.mark.anyio
+async def test_async_synthesize_many_records_file_errors_and_removes_partial_files(dummy_async_http, tmp_path):
+    client = AsyncAiolaClient(api_key="k")
+
+    results = await client.tts.synthesize_many(ITEMS, sink=flaky_files(tmp_path))
+
+    assert [result.ok for result in results] == [False, False, True]
+    assert "close failed" in str(results[1].error)
+    assert [path.name for path in tmp_path.iterdir()] == ["Goodbye.wav"]
@@ -0,0 +1,180 @@
+import os
+
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient
+from aiola.clients.tts import TtsCache
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = TtsCache(memory_bytes=10)
+    cache.put("a", "v", None, b"aaaa")
+    cache.put("b", "v", None, b"bbbb")
+    assert b"".join(cache.get("a", "v")) == b"aaaa"  # a is now the most recent
+    cache.put("c", "v", None, b"cccc")
+
+    assert cache.get("b", "v") is None
+    assert b"".join(cache.get("a", "v")) == b"aaaa"
+    assert cache.memory_size == 8
+    assert (cache.memory_hits, cache.misses) == (2, 1)
+
+
+def test_key_distinguishes_voice_and_language():
+    cache = TtsCache()
+    cache.put("hi", "v1", "en", b"one")
+    assert cache.get("hi", "v2", "en") is None
+    assert cache.get("hi", "v1", None) is None
+    assert b"".join(cache.get("hi", "v1", "en")) == b"one"
+
+
+def test_disk_tier_streams_mapped_file_in_chunks(tmp_path):
+    cache = TtsCache(tmp_path, memory_bytes=0, chunk_size=4)
+    cache.put("hold", "v", "en", b"0123456789")
+
+    reopened = TtsCache(tmp_path, memory_bytes=0, chunk_size=4)
+    assert list(reopened.get("hold", "v", "en")) == [b"0123", b"4567", b"89"]
+    assert reopened.disk_hits == 1
+    assert reopened.disk_size == 10
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path):
+    TtsCache(tmp_path).put("hold", "v", None, b"audio")
+    cache = TtsCache(tmp_path)
+
+    assert b"".join(cache.get("hold", "v")) == b"audio"
+    assert b"".join(cache.get("hold", "v")) == b"audio"
+    assert (cache.disk_hits, cache.memory_hits) == (1, 1)
+
+
+def test_disk_tier_evicts_oldest_files(tmp_path):
+    cache = TtsCache(tmp_path, memory_bytes=0, disk_bytes=8)
+    cache.put("a", "v", None, b"aaaa")
+    cache.put("b", "v", None, b"bbbb")
+    cache.put("c", "v", None, b"cccc")
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert cache.get("a", "v") is None
+    assert cache.disk_size == 8
+
+
+def test_disk_write_does_not_block_readers(tmp_path, monkeypatch):
+    cache = TtsCache(tmp_path)
+    cache.put("a", "v", None, b"aaaa")
+    fdopen = os.fdopen
+    lookups = []
+
+    def write_while_reading(fd, mode):
+        # Another thread reads the cache while this put writes its file
+        lookups.append(cache._lock.acquire(timeout=1))
+        cache._lock.release()
+        return fdopen(fd, mode)
+
+    monkeypatch.setattr(os, "fdopen", write_while_reading)
+    cache.put("b", "v", None, b"bbbb")
+
+    assert lookups == [True]
+    assert cache.disk_size == 8
+    assert [path.suffix for path in tmp_path.iterdir()] == [".audio", ".audio"]
+
+
+def test_disk_tier_is_trimmed_on_startup(tmp_path):
+    old = TtsCache(tmp_path)
+    old.put("a", "v", None, b"aaaa")
+    old.put("b", "v", None, b"bbbb")
+    os.utime(tmp_path / f"{TtsCache.key('a', 'v', None)}.audio", (0, 0))
+
+    cache = TtsCache(tmp_path, disk_bytes=4)
+    assert cache.get("a", "v") is None
+    assert cache.get("b", "v") is not None
+
+
+def test_synthesize_uses_cache(dummy_http):
+    client = AiolaClient(api_key="k")
+    cache = TtsCache()
+
+    first = list(client.tts.synthesize(text="Please hold", voice="v", cache=cache))
+    second = list(client.tts.synthesize(text="Please hold", voice="v", cache=cache))
+
+    assert first == [b"chunk1", b"chunk2"]
+    assert b"".join(second) == b"chunk1chunk2"
+    assert len(dummy_http.stream_calls) == 1
+
+
+def test_synthesize_does_not_cache_partial_results(dummy_http):
+    client = AiolaClient(api_key="k")
+    cache = TtsCache()
+
+    stream = client.tts.synthesize(text="Please hold", voice="v", cache=cache)
+    next(stream)
+    stream.close()
+
+    assert cache.get("Please hold", "v") is None
+
+
+@pytest.mark.anyio
+async def test_async_synthesize_uses_cache(dummy_async_http, tmp_path):
+    client = AsyncAiolaClient(api_key="k")
+    cache = TtsCache(tmp_path)
+
+    _ = [c async for c in client.tts.synthesize(text="Menu", voice="v", cache=cache)]
+    second = [c async for c in client.tts.synthesize(text="Menu", voice="v", cache=cache)]
+
+    assert b"".join(second) == b"chunk1chunk2"
+    assert len(dummy_async_http.stream_calls) == 1
+
+
+def test_synthesize_stopped_early_releases_mapped_file(dummy_http, tmp_path):
+    client = AiolaClient(api_key="k")
+    TtsCache(tmp_path).put("Please hold", "v", None, b"0123456789")
+    cache = TtsCache(tmp_path, memory_bytes=0, chunk_size=4)
+    open_file, get = cache._open_file, cache.get
+    mapped, hits = [], []
+
+    def record(key):
+        mapped.append(open_file(key))
+        return mapped[-1]
+
+    def keep(*args):
+        # Hold on to the iterator so garbage collection can't close it for us
+        hits.append(get(*args))
+        return hits[-1]
+
+    cache._open_file, cache.get = record, keep
+    stream = client.tts.synthesize(text="Please hold", voice="v", cache=cache)
+    assert next(stream) == b"0123"
+    stream.close()
+
+    assert mapped[0].closed
+    assert not dummy_http.stream_calls
+
+
+def test_small_disk_hit_releases_mapped_file_at_once(tmp_path):
+    TtsCache(tmp_path).put("hold", "v", None, b"audio")
+    cache = TtsCache(tmp_path)
+    open_file = cache._open_file
+    mapped = []
+
+    def record(key):
+        mapped.append(open_file(key))
+        return mapped[-1]
+
+    cache._open_file = record
+    chunks = cache.get("hold", "v")
+
+    assert mapped[0].closed
+    assert b"".join(chunks) == b"audio"
+
+
+def test_unwritable_directory_does_not_fail_synthesize(dummy_http, tmp_path, monkeypatch):
+    client = AiolaClient(api_key="k")
+    cache = TtsCache(tmp_path)
+
+    def full_disk(**kwargs):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr("aiola.clients.tts.cache.tempfile.mkstemp", full_disk)
+    audio = list(client.tts.synthesize(text="Please hold", voice="v", cache=cache))
+
+    assert audio == [b"chunk1", b"chunk2"]
+    assert cache.disk_size == 0
+    assert b"".join(cache.get("Please hold", "v")) == b"chunk1chunk2"
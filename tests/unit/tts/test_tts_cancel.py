@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient
+
+from tests._helpers import LoopbackAudioServer
+
+
+@pytest.fixture
+def slow_server(dummy_http, monkeypatch):
+    import aiola.clients.tts.client
+
+    server = LoopbackAudioServer([b"first"], stall=True)
+    monkeypatch.setattr(
+        aiola.clients.tts.client, "create_authenticated_client", lambda *a, **k: httpx.Client(base_url=server.url)
+    )
+
+    async def create_async(*a, **k):
+        return httpx.AsyncClient(base_url=server.url)
+
+    monkeypatch.setattr(aiola.clients.tts.client, "create_async_authenticated_client", create_async)
+    yield server
+    server.close()
+
+
+def test_cancel_interrupts_a_blocked_read_from_another_thread(slow_server):
+    client = AiolaClient(api_key="k")
+    stream = client.tts.stream(text="Hello", voice="v")
+    received = []
+
+    def consume():
+        for chunk in stream:
+            received.append(chunk)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    time.sleep(0.2)  # the consumer is now waiting for the second chunk
+
+    started = time.monotonic()
+    stream.cancel()
+    consumer.join(timeout=2)
+
+    assert not consumer.is_alive()
+    assert time.monotonic() - started < 1
+    assert received == [b"first"]
+    assert stream.cancelled and stream.bytes_received == 5
+    assert stream.timings.cancelled and not stream.timings.completed
+    assert slow_server.disconnected.wait(2)
+
+
+def test_close_releases_the_request_between_chunks(slow_server):
+    client = AiolaClient(api_key="k")
+
+    with client.tts.stream(text="Hello", voice="v") as stream:
+        assert next(stream) == b"first"
+
+    assert stream.cancelled and stream.timings.cancelled
+    assert slow_server.disconnected.wait(2)
+    assert list(stream) == []
+
+
+def test_finished_stream_is_not_cancelled(dummy_http):
+    client = AiolaClient(api_key="k")
+    stream = client.tts.stream(text="Hello", voice="v")
+
+    assert list(stream) == [b"chunk1", b"chunk2"]
+    stream.close()
+
+    assert stream.finished and not stream.cancelled
+    assert not stream.timings.cancelled
+    assert stream.bytes_received == 12
+
+
+@pytest.mark.anyio
+async def test_async_cancel_from_another_task(slow_server):
+    client = AsyncAiolaClient(api_key="k")
+    stream = client.tts.stream(text="Hello", voice="v")
+    received = []
+
+    async def consume():
+        async for chunk in stream:
+            received.append(chunk)
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(0.2)
+
+    await stream.aclose()
+    await asyncio.wait_for(consumer, 1)
+
+    assert received == [b"first"]
+    assert stream.cancelled and stream.bytes_received == 5
+    assert stream.timings.cancelled and not stream.timings.completed
+    assert await asyncio.to_thread(slow_server.disconnected.wait, 2)
+
+
+def test_cancel_wakes_a_consumer_waiting_for_text(dummy_http):
+    client = AiolaClient(api_key="k")
+    release = threading.Event()
+
+    def tokens():
+        yield "Hello there, my good friend. "
+        release.wait(5)  # the model is still thinking
+        yield "More text."
+
+    stream = client.tts.stream_incremental(text_iter=tokens(), voice="v")
+    received = []
+
+    def consume():
+        for chunk in stream:
+            received.append(chunk)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    time.sleep(0.2)  # the first sentence is played and the consumer waits for the next one
+
+    started = time.monotonic()
+    stream.cancel()
+    consumer.join(timeout=2)
+    release.set()
+
+    assert not consumer.is_alive()
+    assert time.monotonic() - started < 1
+    assert received == [b"chunk1", b"chunk2"]
+    assert stream.cancelled
+
+
+@pytest.mark.anyio
+async def test_async_cancel_wakes_a_consumer_waiting_for_text(dummy_async_http):
+    client = AsyncAiolaClient(api_key="k")
+    release = asyncio.Event()
+
+    async def tokens():
+        yield "Hello there, my good friend. "
+        await release.wait()
+        yield "More text."
+
+    stream = client.tts.stream_incremental(text_iter=tokens(), voice="v")
+    received = []
+
+    async def consume():
+        async for chunk in stream:
+            received.append(chunk)
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(0.2)
+
+    stream.cancel()
+    await asyncio.wait_for(consumer, 1)
+    await stream.aclose()
+
+    assert received == [b"chunk1", b"chunk2"]
+    assert stream.cancelled
@@ -0,0 +1,158 @@
+import httpx
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient, AiolaError
+from aiola.clients.tts import TtsCache
+
+from tests._helpers import DummyHTTPClient, LoopbackAudioServer
+
+
+@pytest.fixture
+def serve(dummy_http, monkeypatch):
+    import aiola.clients.tts.client
+
+    servers = []
+
+    def start(chunks, **kwargs):
+        server = LoopbackAudioServer(chunks, **kwargs)
+        servers.append(server)
+        monkeypatch.setattr(
+            aiola.clients.tts.client, "create_authenticated_client", lambda *a, **k: httpx.Client(base_url=server.url)
+        )
+
+        async def create_async(*a, **k):
+            return httpx.AsyncClient(base_url=server.url)
+
+        monkeypatch.setattr(aiola.clients.tts.client, "create_async_authenticated_client", create_async)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+def assert_complete(timings):
+    steps = [
+        timings.token_s,
+        timings.connected_s,
+        timings.request_sent_s,
+        timings.response_s,
+        timings.first_byte_s,
+        timings.last_byte_s,
+    ]
+    assert None not in steps
+    assert steps == sorted(steps)
+    assert timings.new_connection
+    assert timings.status_code == 200
+    assert timings.completed and timings.error is None
+    assert timings.bytes_received == 2000
+    assert timings.bytes_per_s > 0
+
+
+def test_stream_records_timings_and_calls_the_hook(serve):
+    serve([b"a" * 1000, b"b" * 1000], delay=0.02)
+    client = AiolaClient(api_key="k")
+    reported = []
+    client.tts.metrics_hook = reported.append
+
+    stream = client.tts.synthesize(text="Hello", voice="v")
+    assert b"".join(stream) == b"a" * 1000 + b"b" * 1000
+
+    assert reported == [stream.timings]
+    assert stream.timings.path == "/api/tts/synthesize"
+    assert_complete(stream.timings)
+    assert stream.timings.last_byte_s - stream.timings.first_byte_s >= 0.015
+
+
+def test_failed_and_cancelled_requests_are_reported(serve, monkeypatch):
+    reported = []
+    client = AiolaClient(api_key="k")
+    client.tts.metrics_hook = reported.append
+
+    serve([b"first"], stall=True)
+    with client.tts.stream(text="Hello", voice="v") as stream:
+        next(stream)
+    assert not reported[0].completed and reported[0].error is None
+    assert reported[0].cancelled
+    assert reported[0].bytes_received == 5
+
+    def failing(*a, **k):
+        raise RuntimeError("boom")
+
+    import aiola.clients.tts.client
+
+    monkeypatch.setattr(aiola.clients.tts.client, "create_authenticated_client", lambda *a, **k: DummyHTTPClient())
+    monkeypatch.setattr(DummyHTTPClient, "stream", failing)
+    with pytest.raises(AiolaError):
+        list(client.tts.stream(text="Hello", voice="v"))
+    assert isinstance(reported[1].error, AiolaError) and not reported[1].cancelled
+    assert reported[1].token_s is not None and reported[1].first_byte_s is None
+
+
+def test_cache_hits_are_reported(dummy_http):
+    client = AiolaClient(api_key="k")
+    reported = []
+    client.tts.metrics_hook = reported.append
+    cache = TtsCache()
+    cache.put("Hello", "v", None, b"cached audio")
+
+    stream = client.tts.synthesize(text="Hello", voice="v", cache=cache)
+    assert b"".join(stream) == b"cached audio"
+
+    assert reported == [stream.timings]
+    assert stream.timings.completed and stream.timings.bytes_received == 12
+    assert stream.timings.status_code is None
+
+
+def test_cancelled_cache_hits_are_reported(dummy_http):
+    client = AiolaClient(api_key="k")
+    reported = []
+    client.tts.metrics_hook = reported.append
+    cache = TtsCache(chunk_size=4)
+    cache.put("Hello", "v", None, b"cached audio")
+
+    with client.tts.synthesize(text="Hello", voice="v", cache=cache) as stream:
+        assert next(stream) == b"cach"
+
+    assert reported == [stream.timings]
+    assert stream.timings.cancelled and not stream.timings.completed
+
+
+def test_hook_errors_do_not_break_the_stream(dummy_http, caplog):
+    client = AiolaClient(api_key="k")
+
+    def broken(timings):
+        raise ValueError("hook boom")
+
+    client.tts.metrics_hook = broken
+    assert list(client.tts.stream(text="Hello", voice="v")) == [b"chunk1", b"chunk2"]
+    assert "TTS metrics hook raised" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_async_stream_records_timings(serve):
+    serve([b"a" * 1000, b"b" * 1000], delay=0.02)
+    client = AsyncAiolaClient(api_key="k")
+    reported = []
+    client.tts.metrics_hook = reported.append
+
+    stream = client.tts.stream(text="Hello", voice="v")
+    _ = [chunk async for chunk in stream]
+
+    assert reported == [stream.timings]
+    assert_complete(stream.timings)
+
+
+@pytest.mark.anyio
+async def test_async_cache_hits_are_reported(dummy_async_http):
+    client = AsyncAiolaClient(api_key="k")
+    reported = []
+    client.tts.metrics_hook = reported.append
+    cache = TtsCache()
+    cache.put("Hello", "v", None, b"cached audio")
+
+    stream = client.tts.synthesize(text="Hello", voice="v", cache=cache)
+    assert b"".join([chunk async for chunk in stream]) == b"cached audio"
+
+    assert reported == [stream.timings]
+    assert stream.timings.completed and stream.timings.bytes_received == 12
@@ -0,0 +1,151 @@
+import os
+import struct
+
+import numpy as np
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient, AiolaValidationError
+from aiola.audio import g711_encode
+
+from tests._helpers import DummyAsyncHTTPClient, DummyAsyncResponse, DummyHTTPClient, DummyResponse
+
+
+def wav(payload: bytes, sample_rate: int = 8000) -> bytes:
+    header = b"RIFF" + struct.pack("<I", 36 + len(payload)) + b"WAVE"
+    header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    header += b"data" + struct.pack("<I", len(payload))
+    return header + payload
+
+
+AUDIO = wav(bytes(range(200)) * 3)  # 600 bytes: 300 samples at 8 kHz, 37.5 ms
+
+
+@pytest.fixture
+def audio_http(dummy_http, monkeypatch):
+    # Uneven chunks that split the header and the frames
+    chunks = [AUDIO[:30], AUDIO[30:100], AUDIO[100:101], AUDIO[101:]]
+    monkeypatch.setattr(DummyHTTPClient, "stream", lambda self, *a, **k: DummyResponse(chunks))
+
+
+def test_frames_are_fixed_size_and_skip_the_header(audio_http):
+    client = AiolaClient(api_key="k")
+    stream = client.tts.stream(text="Hello", voice="v")
+
+    frames = [bytes(frame) for frame in stream.frames(20)]
+
+    assert [len(frame) for frame in frames] == [320, 320]
+    assert b"".join(frames)[:600] == AUDIO[44:]
+    assert frames[-1][280:] == bytes(40)  # padded with silence
+    assert stream.wav_info.sample_rate == 8000
+
+
+def test_frames_of_raw_audio_need_a_sample_rate(dummy_http):
+    client = AiolaClient(api_key="k")
+
+    with pytest.raises(AiolaValidationError):
+        list(client.tts.stream(text="Hello", voice="v").frames())
+
+    frames = list(client.tts.stream(text="Hello", voice="v").frames(1, sample_rate=1000, pad=False))
+    assert b"".join(frames) == b"chunk1chunk2"
+    assert {len(frame) for frame in frames} == {2}
+
+
+def test_readinto_fills_fixed_buffers(audio_http):
+    client = AiolaClient(api_key="k")
+    stream = client.tts.synthesize(text="Hello", voice="v")
+    buffer = bytearray(256)
+    received = bytearray()
+
+    while n := stream.readinto(memoryview(buffer)):
+        received += buffer[:n]
+
+    assert received == AUDIO
+    assert stream.bytes_received == len(AUDIO)
+
+
+def test_stream_into_bytearray_file_and_fd(audio_http, tmp_path):
+    client = AiolaClient(api_key="k")
+
+    target = bytearray(b"prefix")
+    assert client.tts.stream(text="Hello", voice="v").stream_into(target) == len(AUDIO)
+    assert target == b"prefix" + AUDIO
+
+    with open(tmp_path / "a.wav", "wb") as file:
+        client.tts.stream(text="Hello", voice="v").stream_into(file)
+    assert (tmp_path / "a.wav").read_bytes() == AUDIO
+
+    fd = os.open(tmp_path / "b.wav", os.O_WRONLY | os.O_CREAT)
+    try:
+        client.tts.stream(text="Hello", voice="v").stream_into(fd)
+    finally:
+        os.close(fd)
+    assert (tmp_path / "b.wav").read_bytes() == AUDIO
+
+
+def test_stream_into_memoryview_keeps_the_rest(audio_http):
+    client = AiolaClient(api_key="k")
+    stream = client.tts.stream(text="Hello", voice="v")
+    head = bytearray(44)
+
+    assert stream.stream_into(memoryview(head)) == 44
+    assert b"".join(stream) == AUDIO[44:]
+
+
+@pytest.mark.anyio
+async def test_async_frames_and_readinto(dummy_async_http, monkeypatch):
+    chunks = [AUDIO[:50], AUDIO[50:]]
+    monkeypatch.setattr(DummyAsyncHTTPClient, "stream", lambda self, *a, **k: DummyAsyncResponse(chunks))
+    client = AsyncAiolaClient(api_key="k")
+
+    frames = [bytes(frame) async for frame in client.tts.stream(text="Hi", voice="v").frames(10)]
+    assert [len(frame) for frame in frames] == [160] * 4
+
+    buffer = bytearray(len(AUDIO))
+    assert await client.tts.stream(text="Hi", voice="v").readinto(buffer) == len(AUDIO)
+    assert buffer == AUDIO
+
+
+def test_pcm_yields_arrays_across_chunk_boundaries(audio_http):
+    client = AiolaClient(api_key="k")
+    stream = client.tts.stream(text="Hello", voice="v")
+
+    arrays = list(stream.pcm(10, dtype="float32", pad=False))
+
+    assert [array.shape for array in arrays] == [(80, 1)] * 3 + [(60, 1)]
+    assert arrays[0].dtype == np.float32
+    samples = np.frombuffer(AUDIO[44:], dtype="<i2") / 32768
+    assert np.allclose(np.concatenate(arrays).ravel(), samples)
+
+
+def test_pcm_of_raw_audio_keeps_the_stored_type(dummy_http):
+    client = AiolaClient(api_key="k")
+
+    arrays = list(client.tts.stream(text="Hello", voice="v").pcm(sample_rate=3, pad=False))
+
+    assert np.concatenate(arrays).ravel().tobytes() == b"chunk1chunk2"
+    assert arrays[0].dtype == np.int16
+
+
+@pytest.mark.anyio
+async def test_async_pcm(dummy_async_http, monkeypatch):
+    chunks = [AUDIO[:45], AUDIO[45:]]
+    monkeypatch.setattr(DummyAsyncHTTPClient, "stream", lambda self, *a, **k: DummyAsyncResponse(chunks))
+    client = AsyncAiolaClient(api_key="k")
+
+    arrays = [array async for array in client.tts.stream(text="Hi", voice="v").pcm(20)]
+
+    assert [array.shape for array in arrays] == [(160, 1), (160, 1)]
+    assert np.concatenate(arrays).ravel()[:300].tobytes() == AUDIO[44:]
+
+
+def test_transcode_to_telephony_audio(audio_http):
+    client = AiolaClient(api_key="k")
+
+    output = b"".join(client.tts.stream(text="Hello", voice="v").transcode("alaw"))
+
+    assert len(output) == 300  # already 8 kHz: one code per sample
+    expected = g711_encode(np.frombuffer(AUDIO[44:], dtype="<i2"), "alaw")
+    assert output == expected
+
+    with pytest.raises(AiolaValidationError):
+        list(client.tts.stream(text="Hello", voice="v").transcode("opus"))
@@ -0,0 +1,221 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aiola import AiolaClient, AsyncAiolaClient, AiolaError, AiolaValidationError
+from aiola.clients.tts import SentenceBuffer, split_sentences
+
+from tests._helpers import DummyAsyncHTTPClient, DummyAsyncResponse, DummyHTTPClient, DummyResponse
+
+
+# ---------------------------------------------------------------------------
+# Sentence splitting
+# ---------------------------------------------------------------------------
+
+
+def test_split_sentences_on_terminal_punctuation():
+    text = 'First sentence here. "Is this the second one?" she asked!  Third one…'
+    assert split_sentences(text, min_chars=0) == [
+        "First sentence here.",
+        '"Is this the second one?"',
+        "she asked!",
+        "Third one…",
+    ]
+
+
+def test_split_sentences_joins_short_pieces():
+    assert split_sentences("Dr. Smith will see you now. Please wait.", min_chars=10) == [
+        "Dr. Smith will see you now.",
+        "Please wait.",
+    ]
+
+
+def test_split_sentences_breaks_long_sentences_at_clauses_then_words():
+    text = "one two three, four five six seven eight nine"
+    assert split_sentences(text, max_chars=16, min_chars=0) == [
+        "one two three,",
+        "four five six",
+        "seven eight nine",
+    ]
+
+
+def test_split_sentences_cjk():
+    assert split_sentences("你好。今天天气很好！", min_chars=0) == ["你好。", "今天天气很好！"]
+
+
+# ---------------------------------------------------------------------------
+# Pipelined synthesis
+# ---------------------------------------------------------------------------
+
+
+class PieceHTTP(DummyHTTPClient):
+    """Returns the piece text as audio; earlier pieces take longer to render."""
+
+    def __init__(self, delays):
+        super().__init__()
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def stream(self, method, path, *, headers, json):
+        self.stream_calls.append({"path": path, "json": json})
+        http = self
+
+        class Response(DummyResponse):
+            def iter_bytes(self):
+                with http.lock:
+                    http.active += 1
+                    http.peak = max(http.peak, http.active)
+                time.sleep(http.delays.get(json["text"], 0))
+                with http.lock:
+                    http.active -= 1
+                yield json["text"].encode()
+                yield b"|"
+
+        return Response([])
+
+
+@pytest.fixture
+def piece_http(dummy_http, monkeypatch):
+    import aiola.clients.tts.client
+
+    http = PieceHTTP({"Slow first sentence.": 0.1})
+    monkeypatch.setattr(aiola.clients.tts.client, "create_authenticated_client", lambda *a, **k: http)
+    return http
+
+
+def test_stream_pipelined_yields_in_order(piece_http):
+    client = AiolaClient(api_key="k")
+    text = "Slow first sentence. Quick second sentence. Quick third sentence. Quick fourth sentence."
+
+    audio = b"".join(client.tts.stream_pipelined(text=text, voice="v", max_concurrency=2))
+
+    assert audio == b"Slow first sentence.|Quick second sentence.|Quick third sentence.|Quick fourth sentence.|"
+    assert [call["path"] for call in piece_http.stream_calls] == ["/api/tts/stream"] * 4
+    assert piece_http.peak == 2
+
+
+def test_stream_pipelined_wraps_piece_errors(piece_http):
+    def failing_stream(*a, **k):
+        raise RuntimeError("piece boom")
+
+    piece_http.stream = failing_stream
+    client = AiolaClient(api_key="k")
+
+    with pytest.raises(AiolaError, match="Pipelined TTS streaming failed: piece boom"):
+        list(client.tts.stream_pipelined(text="One sentence here. Another sentence here.", voice="v"))
+
+
+def test_stream_pipelined_validates_concurrency(dummy_http):
+    client = AiolaClient(api_key="k")
+    with pytest.raises(AiolaValidationError):
+        list(client.tts.stream_pipelined(text="Hi.", voice="v", max_concurrency=0))
+
+
+@pytest.mark.anyio
+async def test_async_stream_pipelined_yields_in_order(dummy_async_http, monkeypatch):
+    import aiola.clients.tts.client
+
+    delays = {"Slow first sentence.": 0.05}
+
+    class PieceAsyncHTTP(DummyAsyncHTTPClient):
+        def stream(self, method, path, *, headers, json):
+            self.stream_calls.append({"path": path, "json": json})
+
+            class Response(DummyAsyncResponse):
+                async def aiter_bytes(self):
+                    await asyncio.sleep(delays.get(json["text"], 0))
+                    yield json["text"].encode()
+                    yield b"|"
+
+            return Response([])
+
+    http = PieceAsyncHTTP()
+
+    async def create(*a, **k):
+        return http
+
+    monkeypatch.setattr(aiola.clients.tts.client, "create_async_authenticated_client", create)
+    client = AsyncAiolaClient(api_key="k")
+    text = "Slow first sentence. Quick second sentence. Quick third sentence."
+
+    chunks = [c async for c in client.tts.stream_pipelined(text=text, voice="v")]
+
+    assert b"".join(chunks) == b"Slow first sentence.|Quick second sentence.|Quick third sentence.|"
+    assert len(http.stream_calls) == 3
+
+
+# ---------------------------------------------------------------------------
+# Incremental text
+# ---------------------------------------------------------------------------
+
+
+def test_sentence_buffer_waits_for_whitespace_after_the_stop():
+    buffer = SentenceBuffer(min_chars=0)
+    assert buffer.push("It costs 3.") == []
+    assert buffer.push("5 euros. And") == ["It costs 3.5 euros."]
+    assert buffer.pending
+    assert buffer.flush() == "And"
+    assert not buffer.pending
+
+
+def test_sentence_buffer_pop_words_keeps_partial_word():
+    buffer = SentenceBuffer()
+    buffer.push("Hello there, how are y")
+    assert buffer.pop_words() == "Hello there, how are"
+    assert buffer.pop_words() is None
+    assert buffer.push("ou? ") == []  # shorter than min_chars
+    assert buffer.flush() == "you?"
+
+
+def test_sentence_buffer_cuts_long_text():
+    buffer = SentenceBuffer(max_chars=12, min_chars=0)
+    assert buffer.push("alpha beta gamma delta") == ["alpha beta"]
+
+
+def test_stream_incremental_synthesizes_each_sentence(piece_http):
+    client = AiolaClient(api_key="k")
+    tokens = ["Slow first", " sentence.", " Quick second", " sentence.", " Tail"]
+
+    audio = b"".join(client.tts.stream_incremental(text_iter=iter(tokens), voice="v"))
+
+    assert audio == b"Slow first sentence.|Quick second sentence.|Tail|"
+
+
+def test_stream_incremental_flushes_words_on_timeout(piece_http):
+    def tokens():
+        yield "Still thinking about it"
+        time.sleep(0.2)
+        yield " and done now."
+
+    client = AiolaClient(api_key="k")
+    audio = b"".join(client.tts.stream_incremental(text_iter=tokens(), voice="v", flush_timeout=0.05))
+
+    assert audio == b"Still thinking about|it and done now.|"
+
+
+def test_stream_incremental_wraps_text_errors(piece_http):
+    def tokens():
+        yield "Hello there friend. "
+        raise RuntimeError("llm boom")
+
+    client = AiolaClient(api_key="k")
+    with pytest.raises(AiolaError, match="Incremental TTS streaming failed: llm boom"):
+        list(client.tts.stream_incremental(text_iter=tokens(), voice="v"))
+
+
+@pytest.mark.anyio
+async def test_async_stream_incremental(dummy_async_http):
+    async def tokens():
+        yield "Hello there, my friend. "
+        await asyncio.sleep(0.1)
+        yield " Bye now"
+
+    client = AsyncAiolaClient(api_key="k")
+    chunks = [c async for c in client.tts.stream_incremental(text_iter=tokens(), voice="v", flush_timeout=0.02)]
+
+    assert chunks == [b"chunk1", b"chunk2"] * 2
+    assert [call["json"]["text"] for call in dummy_async_http.stream_calls] == ["Hello there, my friend.", "Bye now"]